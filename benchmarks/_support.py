@@ -0,0 +1,189 @@
+"""Shared helpers for benchmarks: local database stand-in and timing."""
+
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import create_engine
+
+from src.infrastructure.database.models import Base, CustomerModel
+
+
+def make_cpf(index: int) -> str:
+    """Build a valid 11-digit CPF from an integer seed."""
+    base = [int(d) for d in f"{(index * 7919 + 100000001) % 10**9:09d}"]
+    if len(set(base)) == 1:
+        base[-1] = (base[-1] + 1) % 10
+    for weights_start in (10, 11):
+        total = sum(d * w for d, w in zip(base, range(weights_start, 1, -1)))
+        remainder = total * 10 % 11
+        base.append(0 if remainder == 10 else remainder)
+    return "".join(map(str, base))
+
+
+def format_cpf(cpf: str) -> str:
+    """Format an 11-digit CPF as XXX.XXX.XXX-XX."""
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+
+def create_sqlite_database(rows: int, path: Optional[str] = None) -> str:
+    """
+    Create and seed a SQLite stand-in for the clientes table.
+
+    Half of the CPFs are stored formatted and half as bare digits,
+    mirroring production data.
+
+    Returns:
+        SQLAlchemy URL of the database
+    """
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench-"), "clientes.db")
+    url = f"sqlite:///{path}"
+
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        batch = []
+        for i in range(rows):
+            cpf = make_cpf(i)
+            batch.append(
+                {
+                    "id": str(uuid.UUID(int=i)),
+                    "cpf": format_cpf(cpf) if i % 2 else cpf,
+                    "nome": f"Cliente {i}",
+                    "criado_em": now,
+                    "atualizado_em": now,
+                }
+            )
+            if len(batch) == 10000:
+                connection.execute(CustomerModel.__table__.insert(), batch)
+                batch = []
+        if batch:
+            connection.execute(CustomerModel.__table__.insert(), batch)
+    engine.dispose()
+    return url
+
+
+def configure_environment(database_url: str, **overrides: str):
+    """Point the application at the stand-in database and reset singletons."""
+    os.environ.update(
+        {
+            "DATABASE_URL": database_url,
+            "JWT_SECRET": "benchmark-secret",
+            "ENVIRONMENT": "benchmark",
+            # get_controller() re-adds the stdout sink; keep request logs quiet
+            "LOG_LEVEL": "ERROR",
+        }
+    )
+    os.environ.update(overrides)
+    reset_container()
+
+
+def reset_container():
+    """Drop every container-lifetime singleton, as a cold start would."""
+    from src.infrastructure.config.settings import get_settings
+    from src.infrastructure.database.connection import DatabaseConnection
+    from src.lambda_handler import get_controller, get_instrumentation
+
+    get_settings.cache_clear()
+    get_controller.cache_clear()
+    get_instrumentation.cache_clear()
+    DatabaseConnection.dispose()
+
+
+def silence_logs():
+    """Remove loguru sinks so logging I/O does not skew timings."""
+    logger.remove()
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int = 10) -> List[float]:
+    """Run fn repeatedly and return per-call durations in seconds."""
+    for _ in range(warmup):
+        fn()
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize durations (seconds) as microsecond statistics."""
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p95_us": percentile(samples, 95) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+    }
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]]):
+    """Print benchmark results as an aligned table."""
+    print(title)
+    print("=" * len(title))
+    columns = list(next(iter(rows.values())).keys())
+    print(f"{'variant':<28}" + "".join(f"{c:>16}" for c in columns))
+    for name, values in rows.items():
+        print(f"{name:<28}" + "".join(f"{values[c]:>16.1f}" for c in columns))
+
+
+def save_results(path: str, results: Dict[str, Dict[str, object]], **meta: object):
+    """Write results (variant -> metric -> value) as a JSON baseline."""
+    with open(path, "w") as output:
+        json.dump({**meta, "results": results}, output, indent=2, sort_keys=True)
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, object]],
+    path: str,
+    threshold: float,
+    metrics: Optional[Sequence[str]] = None,
+) -> bool:
+    """
+    Print numeric metrics against a saved baseline (lower is better).
+
+    Returns True when any compared metric (all numeric ones unless
+    ``metrics`` is given) grew by more than ``threshold`` (a fraction), or
+    became non-zero where the baseline was zero.
+    """
+    with open(path) as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    title = f"Against {path} (threshold +{threshold:.0%})"
+    print(title)
+    print("=" * len(title))
+    regressed = False
+    for variant, values in results.items():
+        for metric, value in values.items():
+            before = baseline.get(variant, {}).get(metric)
+            if not isinstance(value, (int, float)) or before is None:
+                continue
+            if metrics is not None and metric not in metrics:
+                continue
+            if before:
+                change = value / before - 1
+                worse = change > threshold
+            else:
+                change = 0.0 if not value else float("inf")
+                worse = bool(value)
+            regressed = regressed or worse
+            print(
+                f"{variant:<36}{metric:<16}{before:>12.1f} ->{value:>12.1f}"
+                f"{change:>+10.1%}  {'REGRESSION' if worse else ''}"
+            )
+    return regressed
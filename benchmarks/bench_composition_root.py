@@ -0,0 +1,87 @@
+"""
+Per-invocation overhead: object graph built per call vs once per container.
+
+Usage:
+    python -m benchmarks.bench_composition_root [--iterations N]
+
+"per-invocation" replays the previous handler wiring (new repository,
+token generator, use case and controller on every call); "per-container"
+is the current ``lambda_handler``. Both run against a seeded SQLite
+stand-in with caches disabled so only the wiring differs.
+"""
+
+import argparse
+import json
+from types import SimpleNamespace
+
+from benchmarks._support import (
+    configure_environment,
+    create_sqlite_database,
+    make_cpf,
+    measure,
+    print_table,
+    silence_logs,
+    summarize,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    silence_logs()
+    configure_environment(
+        create_sqlite_database(args.rows),
+        CUSTOMER_CACHE_MAX_SIZE="0",
+        NEGATIVE_CACHE_MAX_SIZE="0",
+    )
+
+    from src.adapters.controllers.authentication_controller import (
+        AuthenticationController,
+    )
+    from src.adapters.gateways.customer_repository import CustomerRepository
+    from src.application.use_cases.authenticate_customer import (
+        AuthenticateCustomerUseCase,
+    )
+    from src.infrastructure.database.connection import DatabaseConnection
+    from src.infrastructure.security.jwt_service import JWTTokenGenerator
+    from src.lambda_handler import lambda_handler
+
+    context = SimpleNamespace(aws_request_id="benchmark")
+
+    def per_invocation(event):
+        DatabaseConnection.initialize()
+        controller = AuthenticationController(
+            AuthenticateCustomerUseCase(
+                customer_repository=CustomerRepository(DatabaseConnection.get_session),
+                token_generator=JWTTokenGenerator(),
+            )
+        )
+        return controller.handle(event)
+
+    def per_container(event):
+        return lambda_handler(event, context)
+
+    # Missing-CPF requests isolate the wiring cost from query and signing cost
+    scenarios = {
+        "wiring": {"body": json.dumps({})},
+        "login": {"body": json.dumps({"cpf": make_cpf(0)})},
+    }
+
+    results = {}
+    for scenario, event in scenarios.items():
+        for name, handler in (
+            ("per-invocation", per_invocation),
+            ("per-container", per_container),
+        ):
+            results[f"{name} ({scenario})"] = summarize(
+                measure(lambda: handler(event), args.iterations)
+            )
+
+    print_table("Composition root overhead (microseconds)", results)
+
+
+if __name__ == "__main__":
+    main()
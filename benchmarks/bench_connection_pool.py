@@ -0,0 +1,52 @@
+"""
+Session + query cost per invocation: NullPool vs Lambda pool mode.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [--database-url URL]
+
+Without --database-url a seeded SQLite file is used; connecting to SQLite
+is cheap, so point it at a local MySQL (e.g. mysql+pymysql://...) to see
+the TCP + handshake + auth cost that the persistent connection removes.
+"""
+
+import argparse
+
+from sqlalchemy import text
+
+from benchmarks._support import (
+    configure_environment,
+    create_sqlite_database,
+    measure,
+    print_table,
+    reset_container,
+    silence_logs,
+    summarize,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    silence_logs()
+    database_url = args.database_url or create_sqlite_database(rows=100)
+
+    from src.infrastructure.database.connection import DatabaseConnection
+
+    def invocation():
+        with DatabaseConnection.get_session() as session:
+            session.execute(text("SELECT 1")).scalar()
+
+    results = {}
+    for mode in ("null", "lambda"):
+        configure_environment(database_url, DATABASE_POOL_MODE=mode)
+        results[mode] = summarize(measure(invocation, args.iterations))
+        reset_container()
+
+    print_table("Session open + SELECT 1 per invocation (microseconds)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Full AuthenticationController.handle path with different response builders.
+
+Usage:
+    python -m benchmarks.bench_controller [--iterations N]
+
+The use case is a stub returning fixed results, so timings isolate event
+parsing, logging calls and response building. "legacy" replays the
+previous per-call headers dict + json.dumps; the others use
+ResponseBuilder with the stdlib and orjson encoders.
+"""
+
+import argparse
+import json
+
+from benchmarks._support import measure, print_table, silence_logs, summarize
+from src.adapters.controllers.authentication_controller import (
+    AuthenticationController,
+)
+from src.adapters.controllers.response_builder import ResponseBuilder
+from src.application.use_cases.authenticate_customer import AuthenticationResponse
+from src.infrastructure.serialization.json_encoder import get_json_encoder
+
+TOKEN = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "x" * 300 + ".signature"
+
+
+class StubUseCase:
+    """Fixed results keyed by CPF, no database or signing."""
+
+    def execute(self, request):
+        if request.cpf == "11144477735":
+            return AuthenticationResponse(
+                success=True,
+                token=TOKEN,
+                message="Autenticação realizada com sucesso",
+                customer_id="550e8400-e29b-41d4-a716-446655440000",
+                customer_name="João da Silva",
+                refresh_token=TOKEN,
+            )
+        return AuthenticationResponse(success=False, message="Cliente não encontrado")
+
+
+class LegacyResponseBuilder(ResponseBuilder):
+    """Previous behaviour: headers and body rebuilt on every call."""
+
+    def ok(self, data):
+        return self._legacy(200, data)
+
+    def error(self, status_code, message):
+        return self._legacy(status_code, {"error": message})
+
+    def internal_error(self):
+        return self._legacy(500, {"error": "Erro interno do servidor"})
+
+    @staticmethod
+    def _legacy(status_code, data):
+        return {
+            "statusCode": status_code,
+            "headers": {
+                "Content-Type": "application/json",
+                "Access-Control-Allow-Origin": "*",
+            },
+            "body": json.dumps(data, ensure_ascii=False),
+        }
+
+
+EVENTS = {
+    "200 login": {"body": json.dumps({"cpf": "11144477735"})},
+    "401 not found": {"body": json.dumps({"cpf": "52998224725"})},
+    "400 missing cpf": {"body": "{}"},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    silence_logs()
+    builders = {
+        "legacy": LegacyResponseBuilder(),
+        "stdlib": ResponseBuilder(get_json_encoder("stdlib")),
+    }
+    try:
+        builders["orjson"] = ResponseBuilder(get_json_encoder("orjson"))
+    except ImportError:
+        pass
+
+    for event_name, event in EVENTS.items():
+        rows = {}
+        for name, builder in builders.items():
+            controller = AuthenticationController(StubUseCase(), builder)
+            rows[name] = summarize(
+                measure(lambda: controller.handle(event), args.iterations)
+            )
+        print_table(f"AuthenticationController.handle: {event_name}", rows)
+        print()
+
+
+if __name__ == "__main__":
+    main()
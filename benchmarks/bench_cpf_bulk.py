@@ -0,0 +1,74 @@
+"""
+Bulk CPF validation throughput: CPF per row vs validate_cpfs.
+
+Input mixes bare, formatted and corrupted CPFs (roughly 2/3 valid).
+
+Usage:
+    python -m benchmarks.bench_cpf_bulk [--rows N]
+"""
+
+import argparse
+import time
+
+from benchmarks._support import format_cpf, make_cpf
+from src.domain.value_objects import CPF, validate_cpfs
+from src.domain.value_objects import cpf_bulk
+
+
+def build_inputs(rows):
+    values = []
+    for i in range(rows):
+        cpf = make_cpf(i)
+        if i % 3 == 0:
+            values.append(format_cpf(cpf))
+        elif i % 3 == 1:
+            values.append(cpf)
+        else:
+            values.append(cpf[:10] + str((int(cpf[10]) + 1) % 10))
+    return values
+
+
+def per_row(values):
+    """Baseline: one CPF value object per row."""
+    valid = 0
+    for value in values:
+        try:
+            CPF(value)
+            valid += 1
+        except ValueError:
+            pass
+    return valid
+
+
+def timed(fn, values):
+    start = time.perf_counter()
+    valid = fn(values)
+    return time.perf_counter() - start, valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    values = build_inputs(args.rows)
+    runs = {"CPF per row": per_row}
+    runs["validate_cpfs (python)"] = lambda v: validate_cpfs(
+        v, use_numpy=False
+    ).valid_count
+    if cpf_bulk.load_numpy() is not None:
+        runs["validate_cpfs (numpy)"] = lambda v: validate_cpfs(v).valid_count
+
+    print(f"Bulk CPF validation, {args.rows:,} rows")
+    print("=" * 56)
+    print(f"{'implementation':<26}{'rows/s':>14}{'valid':>16}")
+    baseline = None
+    for name, fn in runs.items():
+        elapsed, valid = timed(fn, values)
+        rate = args.rows / elapsed
+        baseline = baseline or rate
+        print(f"{name:<26}{rate:>14,.0f}{valid:>16,}  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
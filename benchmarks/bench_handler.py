@@ -0,0 +1,213 @@
+"""
+End-to-end latency of ``src.lambda_handler.lambda_handler`` on a local database.
+
+Usage:
+    python -m benchmarks.bench_handler [--rows N [N ...]] [--iterations N]
+        [--cold-runs N] [--no-cache] [--json PATH] [--baseline PATH]
+        [--threshold FRACTION]
+
+For each table size a SQLite stand-in for ``clientes`` is seeded (half the
+CPFs formatted, as in production) and API Gateway v2 events are replayed
+through the real handler:
+
+- ``cold``: the first invocation after every container-lifetime singleton
+  is dropped (settings, object graph, engines), one per ``--cold-runs``.
+  Module import cost is measured separately by ``bench_import_time``.
+- ``warm hit`` / ``warm miss`` / ``warm invalid``: registered CPFs drawn
+  at random from the table, valid but unregistered CPFs, and CPFs with a
+  wrong check digit.
+
+Each variant reports p50/p95/p99 latency (microseconds), SQL statements
+per invocation and, from a separate tracemalloc pass, peak KiB allocated
+while handling one request and blocks still retained afterwards.
+``--no-cache`` disables the customer and negative-lookup caches so every
+valid CPF reaches the database. ``--json`` saves a baseline; ``--baseline``
+compares against one and exits with status 1 when p50, p95, queries or
+allocated KiB grow past ``--threshold`` (p99 and retained blocks are
+reported but too noisy at these sample sizes to gate on).
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from benchmarks._support import (
+    compare_to_baseline,
+    configure_environment,
+    create_sqlite_database,
+    make_cpf,
+    print_table,
+    reset_container,
+    save_results,
+    silence_logs,
+    summarize,
+)
+
+CONTEXT = SimpleNamespace(aws_request_id="benchmark")
+
+GATED_METRICS = ("p50_us", "p95_us", "queries", "alloc_kib")
+
+
+class StatementCounter:
+    """Counts SQL statements executed by every engine in the process."""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def login_event(cpf: str) -> Dict:
+    """API Gateway HTTP API (payload 2.0) login event."""
+    return {
+        "version": "2.0",
+        "rawPath": "/auth",
+        "requestContext": {"http": {"method": "POST", "path": "/auth"}},
+        "headers": {"content-type": "application/json"},
+        "body": json.dumps({"cpf": cpf}),
+        "isBase64Encoded": False,
+    }
+
+
+def wrong_check_digit(cpf: str) -> str:
+    """Return cpf with its last check digit changed."""
+    return cpf[:-1] + str((int(cpf[-1]) + 1) % 10)
+
+
+def build_events(rows: int, count: int, seed: int) -> Dict[str, List[Dict]]:
+    """Hit, miss and invalid login events for a table of ``rows`` customers."""
+    rng = random.Random(seed)
+    hits = [make_cpf(rng.randrange(rows)) for _ in range(count)]
+    registered = set(hits)
+    misses = [make_cpf(rows + i) for i in range(count * 2)]
+    misses = [cpf for cpf in misses if cpf not in registered][:count]
+    return {
+        "hit": [login_event(cpf) for cpf in hits],
+        "miss": [login_event(cpf) for cpf in misses],
+        "invalid": [login_event(wrong_check_digit(cpf)) for cpf in hits],
+    }
+
+
+def run_events(
+    handler: Callable, events: List[Dict], counter: StatementCounter
+) -> Dict[str, float]:
+    """Invoke handler once per event; latency percentiles and queries per call."""
+    statements = counter.count
+    durations = []
+    for payload in events:
+        started = time.perf_counter()
+        handler(payload, CONTEXT)
+        durations.append(time.perf_counter() - started)
+
+    stats = summarize(durations)
+    del stats["mean_us"]
+    stats["queries"] = (counter.count - statements) / len(events)
+    return stats
+
+
+def allocations(handler: Callable, events: List[Dict]) -> Dict[str, float]:
+    """Mean peak KiB allocated per request and blocks retained per request."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    peaks = []
+    for payload in events:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        handler(payload, CONTEXT)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    return {
+        "alloc_kib": sum(peaks) / len(peaks) / 1024,
+        "retained_blocks": blocks / len(events),
+    }
+
+
+def run_table_size(
+    rows: int, args, counter: StatementCounter
+) -> Dict[str, Dict[str, float]]:
+    """Cold and warm results for one seeded table."""
+    overrides = {}
+    if args.no_cache:
+        overrides = {"CUSTOMER_CACHE_MAX_SIZE": "0", "NEGATIVE_CACHE_MAX_SIZE": "0"}
+    configure_environment(create_sqlite_database(rows), **overrides)
+
+    from src.lambda_handler import lambda_handler
+
+    events = build_events(rows, args.iterations, seed=rows)
+    results = {}
+
+    def cold(payload, context):
+        reset_container()
+        return lambda_handler(payload, context)
+
+    cold_events = events["hit"][: args.cold_runs]
+    results[f"{rows} rows / cold"] = {
+        **run_events(cold, cold_events, counter),
+        **allocations(cold, cold_events[:10]),
+    }
+
+    reset_container()
+    for payload in events["hit"][:50]:
+        lambda_handler(payload, CONTEXT)
+
+    sample = max(1, min(args.iterations, 200))
+    for scenario, scenario_events in events.items():
+        results[f"{rows} rows / warm {scenario}"] = {
+            **run_events(lambda_handler, scenario_events, counter),
+            **allocations(lambda_handler, scenario_events[:sample]),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100_000])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--cold-runs", type=int, default=50)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--json", dest="json_path")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    silence_logs()
+    counter = StatementCounter()
+    results = {}
+    for rows in args.rows:
+        results.update(run_table_size(rows, args, counter))
+
+    print_table("lambda_handler end to end", results)
+
+    if args.json_path:
+        save_results(
+            args.json_path,
+            results,
+            python=sys.version.split()[0],
+            no_cache=args.no_cache,
+            iterations=args.iterations,
+        )
+
+    if args.baseline:
+        print()
+        if compare_to_baseline(
+            results, args.baseline, args.threshold, GATED_METRICS
+        ):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Cold-import cost per Lambda entry point, measured with ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.bench_import_time [--runs N] [--init] [--top K]
+        [--json PATH] [--baseline PATH] [--threshold FRACTION]
+
+Each handler module is imported in a fresh interpreter (after one discarded
+run that warms the bytecode cache), and the per-module self times reported
+by ``-X importtime`` are summed. The median over ``--runs`` is the handler's
+cold-import cost; the heaviest top-level packages are listed beside it.
+
+``--init`` also builds each handler's container-lifetime objects
+(``get_controller()``, ``get_authorizer()``, ``get_jwks_body()``) so imports
+deferred to the first invocation are counted too. ``--json`` saves the
+results; ``--baseline`` compares against a saved run and exits with status 1
+when any handler is slower than the baseline by more than ``--threshold``.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks._support import compare_to_baseline, save_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# handler module -> statement run after the import with --init
+HANDLERS = {
+    "src.lambda_handler": "module.get_controller()",
+    "src.authorizer_handler": "module.get_authorizer()",
+    "src.jwks_handler": "module.get_jwks_body()",
+    "src.protected_handler": "",
+}
+
+ENVIRONMENT = {
+    "DATABASE_URL": "sqlite://",
+    "JWT_SECRET": "benchmark-secret",
+    "ENVIRONMENT": "benchmark",
+}
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Map each imported module to its self time in microseconds."""
+    modules: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|", 2)
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def import_once(module: str, init: bool) -> Dict[str, int]:
+    """Import module in a fresh interpreter and return per-module self times."""
+    code = f"import importlib; module = importlib.import_module({module!r})"
+    if init and HANDLERS[module]:
+        code += f"; {HANDLERS[module]}"
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env={**os.environ, **ENVIRONMENT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def by_package(modules: Dict[str, int]) -> Dict[str, int]:
+    """Sum self times by top-level package."""
+    packages: Dict[str, int] = defaultdict(int)
+    for name, self_us in modules.items():
+        packages[name.split(".")[0]] += self_us
+    return packages
+
+
+def measure_handler(module: str, runs: int, init: bool) -> Tuple[float, Dict]:
+    """Median total import time (ms) and median per-package times (ms)."""
+    import_once(module, init)
+
+    totals: List[float] = []
+    packages: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(runs):
+        modules = import_once(module, init)
+        totals.append(sum(modules.values()) / 1000)
+        for package, self_us in by_package(modules).items():
+            packages[package].append(self_us / 1000)
+
+    return statistics.median(totals), {
+        package: statistics.median(samples + [0.0] * (runs - len(samples)))
+        for package, samples in packages.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--init", action="store_true")
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--json", dest="json_path")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = {}
+    mode = "import + init" if args.init else "import"
+    print(f"Cold-import cost per handler ({mode}, median of {args.runs} runs)")
+    print("=" * 64)
+    for module in HANDLERS:
+        total_ms, packages = measure_handler(module, args.runs, args.init)
+        results[module] = {"total_ms": total_ms, "packages_ms": packages}
+
+        heaviest = sorted(packages.items(), key=lambda item: -item[1])[: args.top]
+        print(f"{module:<28}{total_ms:>10.1f} ms")
+        for package, package_ms in heaviest:
+            print(f"    {package:<24}{package_ms:>10.1f} ms")
+
+    if args.json_path:
+        save_results(args.json_path, results, init=args.init)
+
+    if args.baseline:
+        print()
+        if compare_to_baseline(results, args.baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
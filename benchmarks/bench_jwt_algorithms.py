@@ -0,0 +1,74 @@
+"""
+Sign/verify throughput for HS256, ES256 and EdDSA through JWTTokenGenerator.
+
+Keys are generated once and preloaded, as in a warm Lambda container.
+
+Usage:
+    python -m benchmarks.bench_jwt_algorithms [--seconds N]
+"""
+
+import argparse
+from unittest.mock import Mock, patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from src.infrastructure.security.jwt_service import JWTTokenGenerator
+from benchmarks.bench_token_signing import throughput
+
+ALGORITHMS = ("HS256", "ES256", "EdDSA")
+
+
+def private_key_pem(algorithm):
+    """Fresh PKCS#8 PEM key for ES256 (P-256) or EdDSA (Ed25519)."""
+    if algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def build_generator(algorithm):
+    """JWTTokenGenerator configured for algorithm."""
+    settings = Mock()
+    settings.jwt_secret = "benchmark-secret"
+    settings.jwt_algorithm = algorithm
+    settings.jwt_issuer = "serverless-auth"
+    settings.jwt_expiration_minutes = 60
+    settings.jwt_private_key = (
+        None if algorithm == "HS256" else private_key_pem(algorithm)
+    )
+    settings.jwt_key_id = None
+    with patch(
+        "src.infrastructure.security.jwt_service.get_settings",
+        return_value=settings,
+    ):
+        return JWTTokenGenerator()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print("JWT algorithm throughput (tokens/s)")
+    print("===================================")
+    print(f"{'algorithm':<16}{'sign':>12}{'verify':>12}")
+    for algorithm in ALGORITHMS:
+        generator = build_generator(algorithm)
+        token = generator.generate(customer_id=1, cpf="11144477735")
+
+        sign = throughput(
+            lambda: generator.generate(customer_id=1, cpf="11144477735"),
+            args.seconds,
+        )
+        verify = throughput(lambda: generator.validate(token), args.seconds)
+        print(f"{algorithm:<16}{sign:>12,.0f}{verify:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
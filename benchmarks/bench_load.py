@@ -0,0 +1,227 @@
+"""
+Concurrent load: many simulated Lambda containers hitting one database.
+
+Usage:
+    python -m benchmarks.bench_load [--containers N] [--requests N |
+        --duration SECONDS] [--mix HIT,MISS,INVALID] [--rows N]
+        [--database-url URL] [--env KEY=VALUE ...] [--json PATH]
+
+Each container is a separate process started with the ``spawn`` method, so
+it imports ``src.lambda_handler`` and builds its own settings, object graph
+and engine, exactly like a fresh Lambda execution environment. Containers
+wait on a barrier and start together (a cold-start connection storm), then
+replay API Gateway v2 login events mixing registered, unregistered and
+invalid CPFs.
+
+Reports throughput, error rate (exceptions or an unexpected status code
+for the event kind), cold and warm latency percentiles, a latency
+histogram, and the peak number of DBAPI connections open (and checked out)
+at once across all containers, tracked with SQLAlchemy pool events.
+
+By default a SQLite stand-in with ``--rows`` customers is seeded; pass
+``--database-url`` to target a real database instead (it must already hold
+the CPFs produced by ``make_cpf(0 .. rows - 1)``). ``--env`` forwards
+settings such as ``DATABASE_POOL_MODE=lambda`` to every container.
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Tuple
+
+from benchmarks._support import create_sqlite_database, make_cpf, percentile
+from benchmarks.bench_handler import login_event, wrong_check_digit
+
+KINDS = ("hit", "miss", "invalid")
+EXPECTED_STATUS = {"hit": 200, "miss": 401, "invalid": 401}
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 2500)
+
+
+class ConnectionGauge:
+    """Open and checked-out DBAPI connections, shared by every container."""
+
+    def __init__(self, context):
+        self._lock = context.Lock()
+        self._open = context.Value("i", 0, lock=False)
+        self._open_peak = context.Value("i", 0, lock=False)
+        self._in_use = context.Value("i", 0, lock=False)
+        self._in_use_peak = context.Value("i", 0, lock=False)
+
+    def install(self):
+        """Track every pool in the current process."""
+        from sqlalchemy import event
+        from sqlalchemy.pool import Pool
+
+        event.listen(Pool, "connect", lambda *_: self._add(self._open, 1))
+        event.listen(Pool, "close", lambda *_: self._add(self._open, -1))
+        event.listen(Pool, "close_detached", lambda *_: self._add(self._open, -1))
+        event.listen(Pool, "checkout", lambda *_: self._add(self._in_use, 1))
+        event.listen(Pool, "checkin", lambda *_: self._add(self._in_use, -1))
+
+    def _add(self, gauge, delta: int):
+        with self._lock:
+            gauge.value += delta
+            peak = self._open_peak if gauge is self._open else self._in_use_peak
+            peak.value = max(peak.value, gauge.value)
+
+    @property
+    def peaks(self) -> Tuple[int, int]:
+        """Peak (open, checked out) connections."""
+        return self._open_peak.value, self._in_use_peak.value
+
+
+def traffic(
+    rows: int, mix: Tuple[float, ...], seed: int
+) -> Iterator[Tuple[str, Dict]]:
+    """Endless (kind, event) pairs following the hit/miss/invalid mix."""
+    rng = random.Random(seed)
+    while True:
+        kind = rng.choices(KINDS, weights=mix)[0]
+        cpf = make_cpf(rng.randrange(rows))
+        if kind == "miss":
+            cpf = make_cpf(rows + rng.randrange(rows * 10))
+        elif kind == "invalid":
+            cpf = wrong_check_digit(cpf)
+        yield kind, login_event(cpf)
+
+
+def container(index: int, args, env: Dict[str, str], gauge, barrier, results):
+    """One simulated Lambda container: cold start, then warm invocations."""
+    os.environ.update(env)
+    gauge.install()
+
+    from loguru import logger
+
+    from src.lambda_handler import lambda_handler
+
+    logger.remove()
+    events = traffic(args.rows, args.mix, seed=args.seed + index)
+    if args.duration is None:
+        events = itertools.islice(events, args.requests)
+    context = SimpleNamespace(aws_request_id=f"container-{index}")
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    errors = 0
+    barrier.wait()
+    deadline = time.perf_counter() + (args.duration or float("inf"))
+
+    for kind, event in events:
+        if time.perf_counter() >= deadline:
+            break
+        started = time.perf_counter()
+        try:
+            status = lambda_handler(event, context)["statusCode"]
+        except Exception:
+            status = "exception"
+        latencies.append(time.perf_counter() - started)
+        statuses[status] += 1
+        errors += status != EXPECTED_STATUS[kind]
+
+    results.put({"latencies": latencies, "statuses": statuses, "errors": errors})
+
+
+def histogram(latencies: List[float]) -> List[Tuple[str, int]]:
+    """Count latencies per bucket of BUCKETS_MS."""
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for latency in latencies:
+        ms = latency * 1000
+        index = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), -1)
+        counts[index] += 1
+    labels = [f"<= {bound:g} ms" for bound in BUCKETS_MS] + [f"> {BUCKETS_MS[-1]:g} ms"]
+    return list(zip(labels, counts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--containers", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--duration", type=float)
+    parser.add_argument("--mix", default="70,20,10")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--database-url")
+    parser.add_argument("--env", action="append", default=[])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+    args.mix = tuple(float(weight) for weight in args.mix.split(","))
+
+    env = {
+        "DATABASE_URL": args.database_url or create_sqlite_database(args.rows),
+        "JWT_SECRET": "benchmark-secret",
+        "ENVIRONMENT": "benchmark",
+        "LOG_LEVEL": "ERROR",
+    }
+    env.update(item.split("=", 1) for item in args.env)
+
+    context = multiprocessing.get_context("spawn")
+    gauge = ConnectionGauge(context)
+    barrier = context.Barrier(args.containers + 1)
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=container, args=(i, args, env, gauge, barrier, results)
+        )
+        for i in range(args.containers)
+    ]
+    for process in processes:
+        process.start()
+
+    barrier.wait(timeout=300)
+    started = time.perf_counter()
+    reports = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+
+    cold = [report["latencies"][0] for report in reports if report["latencies"]]
+    warm = [latency for report in reports for latency in report["latencies"][1:]]
+    total = len(cold) + len(warm)
+    errors = sum(report["errors"] for report in reports)
+    statuses = sum((report["statuses"] for report in reports), Counter())
+    open_peak, in_use_peak = gauge.peaks
+
+    summary = {
+        "containers": args.containers,
+        "requests": total,
+        "throughput_rps": total / elapsed,
+        "error_rate": errors / total if total else 0.0,
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "cold_ms": {pct: percentile(cold, pct) * 1000 for pct in (50, 95, 99)},
+        "warm_ms": {pct: percentile(warm, pct) * 1000 for pct in (50, 95, 99)},
+        "histogram": dict(histogram(cold + warm)),
+        "peak_open_connections": open_peak,
+        "peak_checked_out_connections": in_use_peak,
+    }
+
+    title = f"{args.containers} containers, {total:,} requests in {elapsed:.2f} s"
+    print(title)
+    print("=" * len(title))
+    print(f"throughput             {summary['throughput_rps']:>10,.0f} req/s")
+    print(f"error rate             {summary['error_rate']:>10.2%}")
+    print(f"status codes           {summary['statuses']}")
+    for name in ("cold_ms", "warm_ms"):
+        values = "  ".join(f"p{pct} {ms:8.2f}" for pct, ms in summary[name].items())
+        print(f"{name.replace('_ms', ' latency (ms)'):<23}{values}")
+    print(f"peak open connections  {open_peak:>10}")
+    print(f"peak checked out       {in_use_peak:>10}")
+    print()
+    widest = max(summary["histogram"].values()) or 1
+    for label, count in summary["histogram"].items():
+        print(f"{label:>14} {count:>8,} {'#' * round(40 * count / widest)}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump(summary, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
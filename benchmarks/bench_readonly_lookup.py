@@ -0,0 +1,86 @@
+"""
+Per-lookup CPU time and allocations: ORM repository vs read-only Core path.
+
+Usage:
+    python -m benchmarks.bench_readonly_lookup [--rows N] [--iterations N]
+
+Both repositories query the same seeded SQLite stand-in through
+DatabaseConnection, so the difference is ORM hydration, the identity map
+and the commit round trip.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks._support import (
+    configure_environment,
+    create_sqlite_database,
+    make_cpf,
+    print_table,
+    silence_logs,
+)
+
+
+def profile(lookup, cpfs, iterations):
+    """Return CPU microseconds and allocation stats per lookup."""
+    for cpf in cpfs[:50]:
+        lookup(cpf)
+
+    started = time.process_time()
+    for i in range(iterations):
+        lookup(cpfs[i % len(cpfs)])
+    cpu_us = (time.process_time() - started) / iterations * 1e6
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    sample = min(iterations, 500)
+    for i in range(sample):
+        lookup(cpfs[i % len(cpfs)])
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+
+    return {
+        "cpu_us": cpu_us,
+        "retained_blocks": blocks / sample,
+        "peak_kib": peak / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    silence_logs()
+    configure_environment(create_sqlite_database(args.rows))
+
+    from src.adapters.gateways.customer_repository import CustomerRepository
+    from src.adapters.gateways.readonly_customer_repository import (
+        ReadOnlyCustomerRepository,
+    )
+    from src.infrastructure.database.connection import DatabaseConnection
+
+    cpfs = [make_cpf(i) for i in range(0, args.rows, max(1, args.rows // 1000))]
+    repositories = {
+        "orm": CustomerRepository(DatabaseConnection.get_session),
+        "readonly": ReadOnlyCustomerRepository(
+            DatabaseConnection.get_readonly_connection
+        ),
+    }
+
+    results = {
+        name: profile(repository.find_by_cpf, cpfs, args.iterations)
+        for name, repository in repositories.items()
+    }
+
+    print_table("find_by_cpf per lookup", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Token signing throughput: generic jwt.encode vs precomputed HMACSigner.
+
+Usage:
+    python -m benchmarks.bench_token_signing [--seconds N]
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import jwt
+
+from src.infrastructure.security.jws_signer import HMACSigner
+
+SECRET = "benchmark-secret"
+
+
+def legacy_generate():
+    """Previous JWTTokenGenerator.generate body (datetime claims + jwt.encode)."""
+    now = datetime.utcnow()
+    payload = {
+        "sub": "550e8400-e29b-41d4-a716-446655440000",
+        "cpf": "11144477735",
+        "role": "client",
+        "aud": "api-client",
+        "trace_id": str(uuid.uuid4()),
+        "iat": now,
+        "exp": now + timedelta(minutes=60),
+        "iss": "serverless-auth",
+    }
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+SIGNER = HMACSigner(SECRET, "HS256")
+
+
+def fast_generate():
+    """Current JWTTokenGenerator.generate body (integer claims + HMACSigner)."""
+    now = int(time.time())
+    payload = {
+        "sub": "550e8400-e29b-41d4-a716-446655440000",
+        "cpf": "11144477735",
+        "role": "client",
+        "aud": "api-client",
+        "trace_id": str(uuid.uuid4()),
+        "iat": now,
+        "exp": now + 3600,
+        "iss": "serverless-auth",
+    }
+    return SIGNER.sign(payload)
+
+
+def throughput(fn, seconds):
+    """Tokens per second over a fixed wall-clock window."""
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        count += 100
+    return count / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    legacy = throughput(legacy_generate, args.seconds)
+    fast = throughput(fast_generate, args.seconds)
+
+    print("HS256 token signing throughput")
+    print("==============================")
+    print(f"{'jwt.encode':<16}{legacy:>12,.0f} tokens/s")
+    print(f"{'HMACSigner':<16}{fast:>12,.0f} tokens/s")
+    print(f"{'speedup':<16}{fast / legacy:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import time
 import uuid
-from sqlalchemy import create_engine
-from src.infrastructure.database.models import Base
+from datetime import datetime, timedelta
+from sqlalchemy import bindparam, create_engine, func, inspect, select, text, update
+from sqlalchemy.exc import IntegrityError
+from src.infrastructure.database.models import Base, CustomerModel
 from src.infrastructure.config.settings import get_settings
 
 
@@ -25,36 +28,47 @@ def create_sample_data():
     Session = sessionmaker(bind=engine)
     session = Session()
 
+    # Tables created before cpf_numero get it from --backfill-cpf-numero
+    columns = {column["name"] for column in inspect(engine).get_columns("clientes")}
+    has_cpf_numero = "cpf_numero" in columns
+
+    def cpf_key(value):
+        return {"cpf_numero": value} if has_cpf_numero else {}
+
     try:
         # Check if data already exists
-        existing = session.query(CustomerModel).first()
+        existing = session.query(CustomerModel.id).first()
         if existing:
             print("Sample data already exists. Skipping...")
             return
 
-        # Create sample customers with production schema
+        # Create sample customers with production schema. A Core insert only
+        # names the given columns, so cpf_numero is left out when missing
         customers = [
-            CustomerModel(
+            dict(
                 id=str(uuid.uuid4()),
                 cpf="111.444.777-35",
+                **cpf_key(11144477735),
                 nome="João da Silva",
                 telefone="11987654321",
                 email="joao@example.com",
                 criado_em=datetime.utcnow(),
                 atualizado_em=datetime.utcnow(),
             ),
-            CustomerModel(
+            dict(
                 id=str(uuid.uuid4()),
                 cpf="529.982.247-25",
+                **cpf_key(52998224725),
                 nome="Maria Santos",
                 telefone="11912345678",
                 email="maria@example.com",
                 criado_em=datetime.utcnow(),
                 atualizado_em=datetime.utcnow(),
             ),
-            CustomerModel(
+            dict(
                 id=str(uuid.uuid4()),
                 cpf="390.533.447-05",
+                **cpf_key(39053344705),
                 nome="Pedro Oliveira",
                 telefone="11998765432",
                 email="pedro@example.com",
@@ -63,13 +77,13 @@ def create_sample_data():
             ),
         ]
 
-        session.add_all(customers)
+        session.execute(CustomerModel.__table__.insert(), customers)
         session.commit()
         print("✓ Sample data created successfully!")
         print("\nSample CPFs for testing:")
         for customer in customers:
-            cpf_digits = "".join(filter(str.isdigit, customer.cpf))
-            print(f"  - {customer.cpf} ({cpf_digits}) - {customer.nome}")
+            cpf_digits = "".join(filter(str.isdigit, customer["cpf"]))
+            print(f"  - {customer['cpf']} ({cpf_digits}) - {customer['nome']}")
 
     except Exception as e:
         session.rollback()
@@ -78,6 +92,241 @@ def create_sample_data():
         session.close()
 
 
+def add_cpf_numero_column(engine):
+    """Add clientes.cpf_numero and its unique index to an existing table."""
+    columns = {column["name"] for column in inspect(engine).get_columns("clientes")}
+    if "cpf_numero" in columns:
+        return
+
+    with engine.begin() as connection:
+        connection.execute(
+            text("ALTER TABLE clientes ADD COLUMN cpf_numero BIGINT NULL")
+        )
+        connection.execute(
+            text("CREATE UNIQUE INDEX ix_clientes_cpf_numero ON clientes (cpf_numero)")
+        )
+    print("✓ Column clientes.cpf_numero added")
+
+
+_SET_CPF_KEY = (
+    update(CustomerModel.__table__)
+    .where(CustomerModel.__table__.c.id == bindparam("row_id"))
+    .values(cpf_numero=bindparam("cpf_key"))
+)
+
+
+def _update_cpf_keys(connection, keys):
+    """Apply one chunk with executemany; on a collision, retry row by row."""
+    try:
+        with connection.begin_nested():
+            connection.execute(_SET_CPF_KEY, keys)
+        return len(keys)
+    except IntegrityError:
+        filled = 0
+        for key in keys:
+            try:
+                with connection.begin_nested():
+                    connection.execute(_SET_CPF_KEY, key)
+                filled += 1
+            except IntegrityError:
+                print(f"  ! CPF key collision, left NULL: id={key['row_id']}")
+        return filled
+
+
+def backfill_cpf_numero(engine, chunk_size=5000):
+    """
+    Fill clientes.cpf_numero from clientes.cpf in bounded chunks.
+
+    Walks the table by primary key (keyset pagination), so each chunk is
+    one short transaction and the job can be stopped and re-run at any
+    point: rows already filled are skipped. Rows whose cpf does not hold
+    11 digits, or whose digits collide with another row (the same CPF
+    stored formatted and bare), are left NULL and reported.
+
+    Returns:
+        Tuple (updated, skipped)
+    """
+    updated = skipped = 0
+    last_id = ""
+
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(
+                select(CustomerModel.id, CustomerModel.cpf)
+                .where(CustomerModel.id > last_id)
+                .where(CustomerModel.cpf.isnot(None))
+                .where(CustomerModel.cpf_numero.is_(None))
+                .order_by(CustomerModel.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            keys = []
+            for row in rows:
+                digits = "".join(filter(str.isdigit, row.cpf))
+                if len(digits) == 11:
+                    keys.append({"row_id": row.id, "cpf_key": int(digits)})
+                else:
+                    skipped += 1
+
+            filled = _update_cpf_keys(connection, keys) if keys else 0
+            updated += filled
+            skipped += len(keys) - filled
+
+        print(f"  ... {updated} rows filled, {skipped} skipped (last id {last_id})")
+
+    print(f"✓ cpf_numero backfill done: {updated} filled, {skipped} skipped")
+    return updated, skipped
+
+
+# Synthetic customers: index i of the generated population maps to a fixed,
+# unique row, so runs are reproducible and resume where the last one stopped.
+SYNTHETIC_ID_PREFIX = "5ca1ab1e-0000-4000-"
+_CPF_BASES = 10**9  # 9-digit CPF bodies; the 2 check digits follow
+# Affine permutation of the bodies (the multiplier is coprime with 10**9),
+# so consecutive indexes spread over the whole CPF space
+_CPF_MULTIPLIER = 387_420_489
+_CPF_OFFSET = 104_729_531
+# Repeated-digit bodies (000000000, 111111111...) are invalid CPFs; the 10
+# indexes landing on them take the bodies of the last 10 indexes instead
+MAX_SYNTHETIC_CUSTOMERS = _CPF_BASES - 10
+
+
+def _cpf_check_digits(body):
+    """The two CPF check digits of a 9-digit body."""
+    first = second = 0
+    for weight in range(2, 11):
+        body, digit = divmod(body, 10)
+        first += digit * weight
+        second += digit * (weight + 1)
+    first = first * 10 % 11 % 10
+    second = (second + first * 2) * 10 % 11 % 10
+    return first * 10 + second
+
+
+def synthetic_cpf(index):
+    """Valid CPF integer key of synthetic customer ``index`` (unique per index)."""
+    body = (index * _CPF_MULTIPLIER + _CPF_OFFSET) % _CPF_BASES
+    if body % 111_111_111 == 0:
+        replacement = MAX_SYNTHETIC_CUSTOMERS + body // 111_111_111
+        body = (replacement * _CPF_MULTIPLIER + _CPF_OFFSET) % _CPF_BASES
+    return body * 100 + _cpf_check_digits(body)
+
+
+def synthetic_id(index):
+    """Primary key of synthetic customer ``index``; sorts in index order."""
+    digits = f"{index:016x}"
+    return f"{SYNTHETIC_ID_PREFIX}{digits[:4]}-{digits[4:]}"
+
+
+def synthetic_customers(start, stop, formatted_ratio=0.5):
+    """
+    Rows for synthetic customers ``start`` to ``stop - 1``.
+
+    About ``formatted_ratio`` of the CPFs are stored as XXX.XXX.XXX-XX and
+    the rest as bare digits, picked by a hash of the index (deterministic).
+    """
+    threshold = formatted_ratio * 2**32
+    created = datetime(2020, 1, 1)
+    rows = []
+    for index in range(start, stop):
+        key = synthetic_cpf(index)
+        cpf = f"{key:011d}"
+        if (index * 2654435761) % 2**32 < threshold:
+            cpf = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        timestamp = created + timedelta(minutes=index % 2_000_000)
+        rows.append(
+            {
+                "id": synthetic_id(index),
+                "cpf": cpf,
+                "cpf_numero": key,
+                "nome": f"Cliente Sintético {index}",
+                "telefone": f"119{key % 10**8:08d}",
+                "email": f"cliente{index}@example.com",
+                "criado_em": timestamp,
+                "atualizado_em": timestamp,
+            }
+        )
+    return rows
+
+
+def _next_synthetic_index(connection):
+    """Index after the last synthetic customer already inserted."""
+    table = CustomerModel.__table__
+    last_id = connection.execute(
+        select(func.max(table.c.id)).where(
+            table.c.id.between(synthetic_id(0), synthetic_id(2**64 - 1))
+        )
+    ).scalar()
+    if last_id is None:
+        return 0
+    return int(last_id[len(SYNTHETIC_ID_PREFIX) :].replace("-", ""), 16) + 1
+
+
+def _insert_customers(connection, rows):
+    """Insert one batch with executemany; on a collision, retry row by row."""
+    insert_customer = CustomerModel.__table__.insert()
+    try:
+        with connection.begin_nested():
+            connection.execute(insert_customer, rows)
+        return len(rows)
+    except IntegrityError:
+        inserted = 0
+        for row in rows:
+            try:
+                with connection.begin_nested():
+                    connection.execute(insert_customer, row)
+                inserted += 1
+            except IntegrityError:
+                print(f"  ! CPF already in clientes, skipped: {row['cpf']}")
+        return inserted
+
+
+def generate_customers(engine, count, batch_size=10000, formatted_ratio=0.5):
+    """
+    Fill clientes with ``count`` synthetic customers with valid, unique CPFs.
+
+    Rows are inserted in ``batch_size`` executemany batches, one short
+    transaction each, with cpf_numero filled. Synthetic ids are sequential
+    under SYNTHETIC_ID_PREFIX, so the table itself is the checkpoint: a
+    stopped run re-run with the same ``count`` continues after the last
+    committed batch, and a larger ``count`` extends the population. CPFs
+    already present from other rows are skipped and reported.
+
+    Returns:
+        Tuple (inserted, skipped)
+    """
+    if not 0 <= count <= MAX_SYNTHETIC_CUSTOMERS:
+        raise ValueError(f"count must be between 0 and {MAX_SYNTHETIC_CUSTOMERS}")
+    if not 0 <= formatted_ratio <= 1:
+        raise ValueError("formatted_ratio must be between 0 and 1")
+
+    with engine.connect() as connection:
+        start = _next_synthetic_index(connection)
+    if start:
+        print(f"  ... resuming after {start} synthetic customers")
+
+    inserted = skipped = 0
+    started = time.perf_counter()
+    for batch_start in range(start, count, batch_size):
+        rows = synthetic_customers(
+            batch_start, min(batch_start + batch_size, count), formatted_ratio
+        )
+        with engine.begin() as connection:
+            filled = _insert_customers(connection, rows)
+        inserted += filled
+        skipped += len(rows) - filled
+
+        done = batch_start + len(rows)
+        rate = inserted / max(time.perf_counter() - started, 1e-9)
+        print(f"  ... {done}/{count} customers ({rate:,.0f} rows/s)")
+
+    print(f"✓ Synthetic customers done: {inserted} inserted, {skipped} skipped")
+    return inserted, skipped
+
+
 if __name__ == "__main__":
     import sys
     from dotenv import load_dotenv
@@ -88,7 +337,24 @@ if __name__ == "__main__":
     print("Database Migration Script")
     print("=" * 50)
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--with-sample-data":
+    if len(sys.argv) > 1 and sys.argv[1] == "--backfill-cpf-numero":
+        chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+        engine = create_engine(get_settings().database_url)
+        print("\n1. Adding clientes.cpf_numero...")
+        add_cpf_numero_column(engine)
+        print(f"\n2. Backfilling cpf_numero ({chunk_size} rows per chunk)...")
+        backfill_cpf_numero(engine, chunk_size)
+    elif len(sys.argv) > 2 and sys.argv[1] == "--generate-customers":
+        count = int(sys.argv[2])
+        batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+        formatted_ratio = float(sys.argv[4]) if len(sys.argv) > 4 else 0.5
+        engine = create_engine(get_settings().database_url)
+        print("\n1. Creating tables...")
+        create_tables()
+        add_cpf_numero_column(engine)
+        print(f"\n2. Generating {count} customers ({batch_size} per batch)...")
+        generate_customers(engine, count, batch_size, formatted_ratio)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--with-sample-data":
         print("\n1. Creating tables...")
         create_tables()
         print("\n2. Creating sample data...")
@@ -97,3 +363,11 @@ if __name__ == "__main__":
         print("\nCreating tables...")
         create_tables()
         print("\nTo create sample data, run: python migrate.py --with-sample-data")
+        print(
+            "To add and backfill clientes.cpf_numero, run: "
+            "python migrate.py --backfill-cpf-numero [chunk_size]"
+        )
+        print(
+            "To generate synthetic customers, run: python migrate.py "
+            "--generate-customers COUNT [batch_size] [formatted_ratio]"
+        )
@@ -0,0 +1,165 @@
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from src.adapters.controllers.authentication_controller import (
+    AsyncAuthenticationController,
+)
+from src.adapters.controllers.response_builder import ResponseBuilder
+from src.infrastructure.database.query_stats import QueryBudget, track_queries
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+DEFAULT_ROUTES = ("/auth", "/auth/batch", "/auth/refresh")
+
+
+class ASGIAdapter:
+    """
+    ASGI 3 application serving an AsyncAuthenticationController.
+
+    Each HTTP request is translated into the API Gateway HTTP API (payload
+    2.0) event the controller already handles, and the controller's
+    response dict is written back, so Lambda and a long-lived server share
+    one request/response mapping.
+
+    Routing that API Gateway does for Lambda happens here: unknown paths
+    get 404, methods other than POST/OPTIONS get 405, and ``health_path``
+    answers GET for load balancer health checks. The controller is built
+    by ``controller_factory`` at lifespan startup (or on the first request
+    when the server does not send lifespan events); ``on_shutdown`` runs at
+    lifespan shutdown, e.g. to dispose the async engine.
+
+    When ``query_budget_factory`` returns a budget, the SQL statements and
+    rows of each controller call are tracked and checked against it, as
+    ``Instrumentation`` does for the Lambda entry point.
+    """
+
+    def __init__(
+        self,
+        controller_factory: Callable[[], AsyncAuthenticationController],
+        routes: Iterable[str] = DEFAULT_ROUTES,
+        health_path: Optional[str] = "/health",
+        on_shutdown: Optional[Callable[[], Awaitable[None]]] = None,
+        responses: Optional[ResponseBuilder] = None,
+        max_body_bytes: int = 64 * 1024,
+        query_budget_factory: Optional[Callable[[], Optional[QueryBudget]]] = None,
+    ):
+        self._controller_factory = controller_factory
+        self._routes = frozenset(routes)
+        self._health_path = health_path
+        self._on_shutdown = on_shutdown
+        self._responses = responses or ResponseBuilder()
+        self._max_body_bytes = max_body_bytes
+        self._query_budget_factory = query_budget_factory
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            response = await self._respond(scope, receive)
+            await self._send(send, response)
+
+    async def _lifespan(self, receive: Receive, send: Send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    self._controller_factory()
+                except Exception as e:
+                    logger.exception("ASGI startup failed", error=str(e))
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._on_shutdown is not None:
+                    await self._on_shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _respond(self, scope: Dict[str, Any], receive: Receive) -> Dict[str, Any]:
+        path, method = scope["path"], scope["method"]
+
+        if path == self._health_path and method in ("GET", "HEAD"):
+            return self._responses.ok({"status": "ok"})
+        if path not in self._routes:
+            return self._responses.error(404, "Recurso não encontrado")
+        if method not in ("POST", "OPTIONS"):
+            return self._responses.error(405, "Método não permitido")
+
+        body = await self._read_body(receive)
+        if body is None:
+            return self._responses.error(413, "Corpo da requisição muito grande")
+
+        controller = self._controller_factory()
+        event = self._event(scope, body)
+        budget = None
+        if self._query_budget_factory is not None:
+            budget = self._query_budget_factory()
+        if budget is None:
+            return await controller.handle(event)
+
+        with track_queries() as queries:
+            response = await controller.handle(event)
+        budget.check(queries, path)
+        return response
+
+    async def _read_body(self, receive: Receive) -> Optional[bytes]:
+        """Read the request body; None once it exceeds max_body_bytes."""
+        chunks: List[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self._max_body_bytes:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    def _event(scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+        """Build an API Gateway HTTP API (payload 2.0) event."""
+        headers: Dict[str, str] = {}
+        for name, value in scope.get("headers", ()):
+            key = name.decode("latin-1").lower()
+            value = value.decode("latin-1")
+            headers[key] = f"{headers[key]},{value}" if key in headers else value
+
+        client = scope.get("client") or (None, None)
+        return {
+            "version": "2.0",
+            "rawPath": scope["path"],
+            "rawQueryString": scope.get("query_string", b"").decode("latin-1"),
+            "headers": headers,
+            "requestContext": {
+                "requestId": uuid.uuid4().hex,
+                "http": {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "sourceIp": client[0],
+                },
+            },
+            "body": body.decode("utf-8", errors="replace"),
+            "isBase64Encoded": False,
+        }
+
+    @staticmethod
+    async def _send(send: Send, response: Dict[str, Any]):
+        body = response.get("body", "").encode("utf-8")
+        headers: List[Tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), str(value).encode("latin-1"))
+            for name, value in response.get("headers", {}).items()
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response["statusCode"],
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
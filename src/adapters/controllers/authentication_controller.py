@@ -1,11 +1,42 @@
 import json
-from typing import Dict, Any
+from typing import Any, Callable, Dict, NamedTuple, Optional
 from loguru import logger
 
+from src.adapters.controllers.response_builder import (
+    SERVICE_UNAVAILABLE_MESSAGE,
+    ResponseBuilder,
+)
+from src.application.instrumentation import PARSE, SERIALIZE, stage
+from src.infrastructure.observability.logging import lazy_logger, sampled
 from src.application.use_cases.authenticate_customer import (
+    AsyncAuthenticateCustomerUseCase,
     AuthenticateCustomerUseCase,
     AuthenticationRequest,
+    AuthenticationResponse,
+    BatchAuthenticationRequest,
+    BatchAuthenticationResponse,
+    RefreshRequest,
 )
+from src.application.use_cases.ports import CustomerLookupError
+
+
+class _BadRequest(Exception):
+    """Request rejected by input validation (400, message in args[0])."""
+
+
+class _Route(NamedTuple):
+    """
+    How one endpoint parses its body, calls the use case and responds.
+
+    ``parse`` and ``respond`` are unbound controller methods. ``execute``
+    calls the use case method on the instance, so the async use case's
+    coroutine overrides are the ones awaited by the async controller.
+    """
+
+    parse: Callable[["AuthenticationController", Dict[str, Any]], Any]
+    execute: Callable[[AuthenticateCustomerUseCase, Any], Any]
+    respond: Callable[["AuthenticationController", Any, Any], Dict[str, Any]]
+    action: str
 
 
 class AuthenticationController:
@@ -16,11 +47,19 @@ class AuthenticationController:
     - Parse HTTP request
     - Validate input
     - Call use case
-    - Format HTTP response
+    - Format HTTP response (through a container-lifetime ResponseBuilder)
+
+    Request parsing and response formatting are per-route methods shared
+    with ``AsyncAuthenticationController``; only the use case call differs.
     """
 
-    def __init__(self, use_case: AuthenticateCustomerUseCase):
+    def __init__(
+        self,
+        use_case: AuthenticateCustomerUseCase,
+        responses: Optional[ResponseBuilder] = None,
+    ):
         self._use_case = use_case
+        self._responses = responses or ResponseBuilder()
 
     def handle(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,96 +71,257 @@ class AuthenticationController:
         Returns:
             HTTP response in API Gateway format
         """
+        if self._http_method(event) == "OPTIONS":
+            return self._responses.preflight()
+
+        return self._handle(event, self._route(event))
+
+    def handle_batch(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle batch authentication request.
+
+        Expects a body like {"cpfs": ["...", "..."]} and returns one result
+        per CPF, in input order, each with its own error code on failure.
+
+        Args:
+            event: AWS Lambda event (API Gateway format)
+
+        Returns:
+            HTTP response in API Gateway format
+        """
+        return self._handle(event, _BATCH)
+
+    def handle_refresh(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle refresh request.
+
+        Expects a body like {"refresh_token": "..."} and returns a new
+        access token (and, with rotation, a new refresh token).
+
+        Args:
+            event: AWS Lambda event (API Gateway format)
+
+        Returns:
+            HTTP response in API Gateway format
+        """
+        return self._handle(event, _REFRESH)
+
+    def _handle(self, event: Dict[str, Any], route: _Route) -> Dict[str, Any]:
+        """
+        Parse, call the use case and respond, mapping failures to 4xx/5xx.
+
+        A CustomerLookupError (database outage) becomes a 503, never a 401.
+        """
         try:
-            body = self._parse_body(event)
-            logger.debug("Request body parsed", body_keys=list(body.keys()))
+            with stage(PARSE):
+                request = route.parse(self, self._parse_body(event))
+            response = route.execute(self._use_case, request)
+            with stage(SERIALIZE):
+                return route.respond(self, request, response)
+        except Exception as e:
+            return self._error_response(e, route)
+
+    def _error_response(self, error: Exception, route: _Route) -> Dict[str, Any]:
+        """Map an exception raised while handling route (call from except)."""
+        if isinstance(error, _BadRequest):
+            return self._responses.bad_request(error.args[0])
+        if isinstance(error, json.JSONDecodeError):
+            logger.error("Invalid JSON in request", error=str(error))
+            return self._responses.bad_request("JSON inválido")
+        if isinstance(error, CustomerLookupError):
+            logger.exception(f"Customer lookup failed in {route.action}")
+            return self._responses.service_unavailable(SERVICE_UNAVAILABLE_MESSAGE)
+        logger.exception(f"Unexpected error in {route.action}", error=str(error))
+        return self._responses.internal_error()
 
-            if "cpf" not in body:
-                logger.warning("Missing CPF in request body")
-                return self._bad_request("Campo 'cpf' é obrigatório")
+    def _route(self, event: Dict[str, Any]) -> _Route:
+        """Select the endpoint from the request path."""
+        path = self._path(event)
+        if path.endswith("/batch"):
+            return _BATCH
+        if path.endswith("/refresh"):
+            return _REFRESH
+        return _LOGIN
 
-            request = AuthenticationRequest(cpf=body["cpf"])
+    def _login_request(self, body: Dict[str, Any]) -> AuthenticationRequest:
+        lazy_logger.debug("Request body parsed", body_keys=lambda: list(body))
+
+        if "cpf" not in body:
+            logger.warning("Missing CPF in request body")
+            raise _BadRequest("Campo 'cpf' é obrigatório")
+
+        request = AuthenticationRequest(cpf=body["cpf"])
+        if sampled():
             logger.info("Authentication attempt", cpf_prefix=body["cpf"][:3])
+        return request
 
-            response = self._use_case.execute(request)
-
-            if response.success:
-                logger.info("Authentication successful", customer_id=response.customer_id)
-                return self._ok(
-                    {
-                        "token": response.token,
-                        "message": response.message,
-                        "customer": {
-                            "id": response.customer_id,
-                            "name": response.customer_name,
-                        },
-                    }
-                )
-            else:
-                logger.warning("Authentication failed", reason=response.message)
-                return self._unauthorized(response.message)
-
-        except json.JSONDecodeError as e:
-            logger.error("Invalid JSON in request", error=str(e))
-            return self._bad_request("JSON inválido")
-        except Exception as e:
-            logger.exception("Unexpected error in authentication", error=str(e))
-            return self._internal_error(str(e))
+    def _login_response(
+        self, request: AuthenticationRequest, response: AuthenticationResponse
+    ) -> Dict[str, Any]:
+        if not response.success:
+            logger.warning("Authentication failed", reason=response.message)
+            return self._responses.unauthorized(response.message)
 
-    @staticmethod
-    def _parse_body(event: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse request body."""
-        body = event.get("body", "{}")
-        if isinstance(body, str):
-            return json.loads(body)
-        return body
+        if sampled():
+            logger.info("Authentication successful", customer_id=response.customer_id)
+        return self._responses.ok(self._token_body(response))
+
+    def _batch_request(self, body: Dict[str, Any]) -> BatchAuthenticationRequest:
+        cpfs = body.get("cpfs")
+        if not isinstance(cpfs, list):
+            logger.warning("Missing CPF list in batch request body")
+            raise _BadRequest("Campo 'cpfs' deve ser uma lista")
+
+        logger.info("Batch authentication attempt", size=len(cpfs))
+        return BatchAuthenticationRequest(cpfs=cpfs)
+
+    def _batch_response(
+        self, request: BatchAuthenticationRequest, response: BatchAuthenticationResponse
+    ) -> Dict[str, Any]:
+        if not response.success:
+            logger.warning("Batch authentication rejected", reason=response.message)
+            return self._responses.bad_request(response.message)
+
+        logger.info(
+            "Batch authentication completed",
+            authenticated=sum(result.success for result in response.results),
+            size=len(response.results),
+        )
+        return self._responses.ok(
+            {
+                "results": [
+                    self._batch_item(cpf, result)
+                    for cpf, result in zip(request.cpfs, response.results)
+                ]
+            }
+        )
+
+    def _refresh_request(self, body: Dict[str, Any]) -> RefreshRequest:
+        refresh_token = body.get("refresh_token")
+        if not isinstance(refresh_token, str) or not refresh_token:
+            logger.warning("Missing refresh token in request body")
+            raise _BadRequest("Campo 'refresh_token' é obrigatório")
+        return RefreshRequest(refresh_token=refresh_token)
+
+    def _refresh_response(
+        self, request: RefreshRequest, response: AuthenticationResponse
+    ) -> Dict[str, Any]:
+        if not response.success:
+            logger.warning("Token refresh failed", reason=response.message)
+            return self._responses.unauthorized(response.message)
+
+        if sampled():
+            logger.info("Token refreshed", customer_id=response.customer_id)
+        return self._responses.ok(self._token_body(response))
 
     @staticmethod
-    def _ok(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Return 200 OK response."""
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
+    def _token_body(response: AuthenticationResponse) -> Dict[str, Any]:
+        """Format a successful login or refresh."""
+        body = {
+            "token": response.token,
+            "message": response.message,
+            "customer": {
+                "id": response.customer_id,
+                "name": response.customer_name,
             },
-            "body": json.dumps(data, ensure_ascii=False),
         }
+        if response.refresh_token:
+            body["refresh_token"] = response.refresh_token
+        return body
 
     @staticmethod
-    def _bad_request(message: str) -> Dict[str, Any]:
-        """Return 400 Bad Request response."""
+    def _batch_item(cpf: Any, result: AuthenticationResponse) -> Dict[str, Any]:
+        """Format one batch result."""
+        if result.success:
+            return {
+                "cpf": cpf,
+                "success": True,
+                "token": result.token,
+                "customer": {"id": result.customer_id, "name": result.customer_name},
+            }
         return {
-            "statusCode": 400,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": json.dumps({"error": message}, ensure_ascii=False),
+            "cpf": cpf,
+            "success": False,
+            "error": {"code": result.error_code, "message": result.message},
         }
 
     @staticmethod
-    def _unauthorized(message: str) -> Dict[str, Any]:
-        """Return 401 Unauthorized response."""
-        return {
-            "statusCode": 401,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": json.dumps({"error": message}, ensure_ascii=False),
-        }
+    def _path(event: Dict[str, Any]) -> str:
+        """Read request path from API Gateway v2 or v1 events."""
+        return event.get("rawPath") or event.get("path") or ""
 
     @staticmethod
-    def _internal_error(message: str) -> Dict[str, Any]:
-        """Return 500 Internal Server Error response."""
-        return {
-            "statusCode": 500,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-            "body": json.dumps(
-                {"error": "Erro interno do servidor"}, ensure_ascii=False
-            ),
-        }
+    def _http_method(event: Dict[str, Any]) -> str:
+        """Read HTTP method from API Gateway v2 or v1 events."""
+        http = event.get("requestContext", {}).get("http", {})
+        return (http.get("method") or event.get("httpMethod") or "").upper()
+
+    @staticmethod
+    def _parse_body(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse request body."""
+        body = event.get("body", "{}")
+        if isinstance(body, str):
+            return json.loads(body)
+        return body
+
+
+_LOGIN = _Route(
+    AuthenticationController._login_request,
+    lambda use_case, request: use_case.execute(request),
+    AuthenticationController._login_response,
+    "authentication",
+)
+_BATCH = _Route(
+    AuthenticationController._batch_request,
+    lambda use_case, request: use_case.execute_batch(request),
+    AuthenticationController._batch_response,
+    "batch authentication",
+)
+_REFRESH = _Route(
+    AuthenticationController._refresh_request,
+    lambda use_case, request: use_case.execute_refresh(request),
+    AuthenticationController._refresh_response,
+    "token refresh",
+)
+
+
+class AsyncAuthenticationController(AuthenticationController):
+    """
+    asyncio variant of AuthenticationController.
+
+    Takes the same API Gateway-shaped events and returns the same responses,
+    but awaits an ``AsyncAuthenticateCustomerUseCase``, so one event loop
+    can serve many logins while their database lookups are in flight.
+    """
+
+    def __init__(
+        self,
+        use_case: AsyncAuthenticateCustomerUseCase,
+        responses: Optional[ResponseBuilder] = None,
+    ):
+        super().__init__(use_case, responses)
+
+    async def handle(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle authentication request (see AuthenticationController.handle)."""
+        if self._http_method(event) == "OPTIONS":
+            return self._responses.preflight()
+
+        return await self._handle(event, self._route(event))
+
+    async def handle_batch(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle batch authentication request."""
+        return await self._handle(event, _BATCH)
+
+    async def handle_refresh(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle refresh request."""
+        return await self._handle(event, _REFRESH)
+
+    async def _handle(self, event: Dict[str, Any], route: _Route) -> Dict[str, Any]:
+        try:
+            with stage(PARSE):
+                request = route.parse(self, self._parse_body(event))
+            response = await route.execute(self._use_case, request)
+            with stage(SERIALIZE):
+                return route.respond(self, request, response)
+        except Exception as e:
+            return self._error_response(e, route)
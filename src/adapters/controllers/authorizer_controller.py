@@ -0,0 +1,135 @@
+from typing import Any, Dict, Iterable, Optional
+from loguru import logger
+
+from src.application.use_cases.ports import ITokenGenerator
+
+
+class AuthorizerController:
+    """
+    Controller for the API Gateway Lambda REQUEST authorizer.
+
+    Responsibilities:
+    - Extract the bearer token from the identity source
+    - Validate it and apply the role and revocation rules
+    - Format a simple response (HTTP API payload 2.0) or an IAM policy
+
+    Validation goes through ``ITokenGenerator.validate``; with a
+    verified-token cache the decision for a repeated token costs a digest
+    and a dict lookup, since the rules below are pure functions of the
+    claims. API Gateway additionally caches results per identity source
+    for the route's ``ReauthorizeEvery`` TTL.
+    """
+
+    def __init__(
+        self,
+        token_generator: ITokenGenerator,
+        allowed_roles: Iterable[str] = ("client",),
+        revoked_token_ids: Iterable[str] = (),
+        simple_responses: bool = True,
+    ):
+        self._token_generator = token_generator
+        self._allowed_roles = frozenset(allowed_roles)
+        self._revoked_token_ids = frozenset(revoked_token_ids)
+        self._simple_responses = simple_responses
+
+    def handle(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Authorize a request.
+
+        Args:
+            event: API Gateway authorizer event (payload 1.0 or 2.0)
+
+        Returns:
+            Simple response or IAM policy document
+        """
+        token = self._bearer_token(event)
+        if token is None:
+            logger.warning("Authorizer called without bearer token")
+            return self._response(event, None)
+
+        try:
+            claims = self._token_generator.validate(token)
+        except ValueError as e:
+            logger.warning("Token rejected", reason=str(e))
+            return self._response(event, None)
+
+        if claims.get("role") not in self._allowed_roles:
+            logger.warning("Role not allowed", role=claims.get("role"))
+            return self._response(event, None)
+
+        if claims.get("trace_id") in self._revoked_token_ids:
+            logger.warning("Token revoked", trace_id=claims.get("trace_id"))
+            return self._response(event, None)
+
+        return self._response(event, claims)
+
+    def _response(
+        self, event: Dict[str, Any], claims: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the allow (claims given) or deny response for the event format."""
+        context = self._context(claims) if claims is not None else {}
+
+        if self._simple_responses and event.get("version") == "2.0":
+            return {"isAuthorized": claims is not None, "context": context}
+
+        return {
+            "principalId": context.get("sub", "anonymous"),
+            "policyDocument": {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Action": "execute-api:Invoke",
+                        "Effect": "Allow" if claims is not None else "Deny",
+                        "Resource": self._resource(event),
+                    }
+                ],
+            },
+            "context": context,
+        }
+
+    @staticmethod
+    def _context(claims: Dict[str, Any]) -> Dict[str, Any]:
+        """Claims forwarded to the integration (authorizer context is flat)."""
+        return {
+            key: claims[key]
+            for key in ("sub", "cpf", "role", "trace_id", "exp")
+            if key in claims
+        }
+
+    @staticmethod
+    def _resource(event: Dict[str, Any]) -> str:
+        """
+        Policy resource covering the whole stage.
+
+        Cached policies are reused for every route behind the authorizer,
+        so scoping them to the invoked method would deny the next route.
+        """
+        arn = event.get("routeArn") or event.get("methodArn") or "*"
+        if arn == "*":
+            return arn
+        api_arn, _, path = arn.partition("/")
+        stage = path.split("/", 1)[0]
+        return f"{api_arn}/{stage}/*"
+
+    @staticmethod
+    def _bearer_token(event: Dict[str, Any]) -> Optional[str]:
+        """Read the token from identitySource, authorizationToken or headers."""
+        identity = event.get("identitySource")
+        if isinstance(identity, list):
+            value = identity[0] if identity else None
+        elif identity:
+            value = identity
+        else:
+            headers = event.get("headers") or {}
+            value = (
+                event.get("authorizationToken")
+                or headers.get("authorization")
+                or headers.get("Authorization")
+            )
+
+        if not value:
+            return None
+        scheme, _, token = value.partition(" ")
+        if scheme.lower() != "bearer" or not token.strip():
+            return None
+        return token.strip()
@@ -0,0 +1,83 @@
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+INTERNAL_ERROR_MESSAGE = "Erro interno do servidor"
+SERVICE_UNAVAILABLE_MESSAGE = "Serviço temporariamente indisponível"
+
+
+class ResponseBuilder:
+    """
+    API Gateway response factory shared by the controller for a container.
+
+    Headers are built once. Error bodies come from a small, fixed set of
+    messages, so each (status, message) response is encoded on first use
+    and reused afterwards; only success bodies are encoded per request,
+    with the pluggable ``encode`` function (stdlib by default).
+
+    Every call returns fresh response and headers dicts, so callers may
+    add headers without affecting later responses.
+    """
+
+    def __init__(
+        self,
+        encode: Optional[Callable[[Any], str]] = None,
+        max_cached_errors: int = 64,
+    ):
+        self._encode = encode or json.JSONEncoder(ensure_ascii=False).encode
+        self._max_cached_errors = max_cached_errors
+        self._json_headers = {
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": "*",
+        }
+        self._preflight_headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "POST, OPTIONS",
+            "Access-Control-Allow-Headers": "Content-Type, Authorization",
+        }
+        self._error_bodies: Dict[Tuple[int, str], str] = {}
+        self._internal_error_body = self._encode({"error": INTERNAL_ERROR_MESSAGE})
+
+    def ok(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return 200 OK response."""
+        return self._json(200, self._encode(data))
+
+    def bad_request(self, message: str) -> Dict[str, Any]:
+        """Return 400 Bad Request response."""
+        return self.error(400, message)
+
+    def unauthorized(self, message: str) -> Dict[str, Any]:
+        """Return 401 Unauthorized response."""
+        return self.error(401, message)
+
+    def service_unavailable(self, message: str) -> Dict[str, Any]:
+        """Return 503 Service Unavailable response."""
+        return self.error(503, message)
+
+    def internal_error(self) -> Dict[str, Any]:
+        """Return 500 Internal Server Error response (details are not exposed)."""
+        return self._json(500, self._internal_error_body)
+
+    def error(self, status_code: int, message: str) -> Dict[str, Any]:
+        """Return an {"error": message} response, reusing the encoded body."""
+        key = (status_code, message)
+        body = self._error_bodies.get(key)
+        if body is None:
+            body = self._encode({"error": message})
+            if len(self._error_bodies) < self._max_cached_errors:
+                self._error_bodies[key] = body
+        return self._json(status_code, body)
+
+    def preflight(self) -> Dict[str, Any]:
+        """Return 204 No Content for CORS preflight requests."""
+        return {
+            "statusCode": 204,
+            "headers": self._preflight_headers.copy(),
+            "body": "",
+        }
+
+    def _json(self, status_code: int, body: str) -> Dict[str, Any]:
+        return {
+            "statusCode": status_code,
+            "headers": self._json_headers.copy(),
+            "body": body,
+        }
@@ -0,0 +1,77 @@
+from typing import Dict, Optional, Sequence
+
+from src.domain.entities import Customer
+from src.application.use_cases.ports import ICustomerRepository
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class CachedCustomerRepository(ICustomerRepository):
+    """
+    Caching decorator for ICustomerRepository.
+
+    Keeps recently found customers in a TTL/LRU cache shared across warm
+    invocations, so repeated logins with the same CPF skip the database.
+    Only found customers are cached; misses always reach the wrapped
+    repository.
+    """
+
+    def __init__(self, repository: ICustomerRepository, cache: TTLCache):
+        self._repository = repository
+        self._cache = cache
+
+    @property
+    def cache(self) -> TTLCache:
+        """Underlying cache (exposes hit/miss counters)."""
+        return self._cache
+
+    def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        """
+        Find customer by CPF, serving from cache when possible.
+
+        Args:
+            cpf: Clean CPF number (only digits)
+
+        Returns:
+            Customer entity or None if not found
+        """
+        key = self._key(cpf)
+        customer = self._cache.get(key)
+        if customer is not None:
+            return customer
+
+        customer = self._repository.find_by_cpf(cpf)
+        if customer is not None:
+            self._cache.set(key, customer)
+
+        return customer
+
+    def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """Find customers by CPF, querying only those not cached."""
+        found: Dict[str, Customer] = {}
+        missing = []
+        for key in dict.fromkeys(self._key(cpf) for cpf in cpfs):
+            customer = self._cache.get(key)
+            if customer is not None:
+                found[key] = customer
+            else:
+                missing.append(key)
+
+        if missing:
+            for key, customer in self._repository.find_many_by_cpf(missing).items():
+                self._cache.set(key, customer)
+                found[key] = customer
+
+        return found
+
+    def invalidate_cpf(self, cpf: str) -> bool:
+        """Drop the cached customer for a CPF."""
+        return self._cache.delete(self._key(cpf))
+
+    def invalidate_customer(self, customer_id: str) -> bool:
+        """Drop every cached entry belonging to a customer id."""
+        return self._cache.delete_where(lambda c: c.id == customer_id) > 0
+
+    @staticmethod
+    def _key(cpf: str) -> str:
+        """Normalize CPF so formatted and bare inputs share an entry."""
+        return "".join(filter(str.isdigit, cpf))
@@ -0,0 +1,35 @@
+from typing import List, Sequence
+
+# Which column lookups use: the legacy text column, the integer key with a
+# text fallback for rows not yet backfilled, or the integer key only.
+CPF_KEY_STRING = "string"
+CPF_KEY_DUAL = "dual"
+CPF_KEY_INTEGER = "integer"
+CPF_KEY_MODES = (CPF_KEY_STRING, CPF_KEY_DUAL, CPF_KEY_INTEGER)
+
+
+def check_cpf_key_mode(mode: str) -> str:
+    """Return mode, raising ValueError if it is not a known CPF key mode."""
+    if mode not in CPF_KEY_MODES:
+        raise ValueError(f"Unknown CPF key mode: {mode}")
+    return mode
+
+
+def stored_cpf_forms(cpf_digits: str) -> List[str]:
+    """Return the CPF representations that may be stored in clientes.cpf."""
+    formatted = f"{cpf_digits[:3]}.{cpf_digits[3:6]}.{cpf_digits[6:9]}-{cpf_digits[9:]}"
+    return [formatted, cpf_digits]
+
+
+def cpf_digits_many(cpfs: Sequence[str]) -> List[str]:
+    """Return the distinct 11-digit CPFs in cpfs, as bare digits."""
+    digits = dict.fromkeys("".join(filter(str.isdigit, cpf)) for cpf in cpfs)
+    return [cpf for cpf in digits if len(cpf) == 11]
+
+
+def stored_cpf_forms_many(cpfs: Sequence[str]) -> List[str]:
+    """Return stored CPF representations for every 11-digit CPF in cpfs."""
+    forms: List[str] = []
+    for cpf in cpf_digits_many(cpfs):
+        forms.extend(stored_cpf_forms(cpf))
+    return forms
@@ -1,9 +1,20 @@
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Callable, ContextManager, Dict, Iterator, Optional, Sequence
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, Session, defer
 
 from src.domain.entities import Customer
-from src.application.use_cases.ports import ICustomerRepository
+from src.application.instrumentation import DB_QUERY, stage
+from src.application.use_cases.ports import CustomerLookupError, ICustomerRepository
+from src.adapters.gateways.cpf_keys import (
+    CPF_KEY_INTEGER,
+    CPF_KEY_STRING,
+    check_cpf_key_mode,
+    cpf_digits_many,
+    stored_cpf_forms,
+    stored_cpf_forms_many,
+)
 from src.infrastructure.database.models import CustomerModel
+from src.infrastructure.database.query_stats import count_rows
 
 
 class CustomerRepository(ICustomerRepository):
@@ -12,41 +23,159 @@ class CustomerRepository(ICustomerRepository):
 
     Adapter between domain layer and database infrastructure.
     Uses SQLAlchemy ORM for data access.
+
+    Long-lived: each lookup opens its own session from ``session_scope``
+    (e.g. ``DatabaseConnection.get_session``), so a single instance can be
+    reused across warm invocations.
+
+    ``cpf_key_mode`` selects the lookup column (see ``cpf_keys.CPF_KEY_MODES``).
+    In string mode ``clientes.cpf_numero`` is never selected, so databases
+    that have not added the column yet keep working.
     """
 
-    def __init__(self, session: Session):
-        self._session = session
+    def __init__(
+        self,
+        session_scope: Callable[[], ContextManager[Session]],
+        cpf_key_mode: str = CPF_KEY_STRING,
+    ):
+        self._session_scope = session_scope
+        self._cpf_key_mode = check_cpf_key_mode(cpf_key_mode)
 
     def find_by_cpf(self, cpf: str) -> Optional[Customer]:
         """
         Find customer by CPF.
 
+        Issues a single equality lookup against the unique index on
+        ``clientes.cpf``, matching both the formatted (XXX.XXX.XXX-XX)
+        and the bare-digits forms in which CPFs are stored. In the dual
+        and integer modes, ``clientes.cpf_numero`` is tried first.
+
         Args:
             cpf: Clean CPF number (only digits)
 
         Returns:
             Customer entity or None if not found
+
+        Raises:
+            CustomerLookupError: If the database could not be queried
         """
         try:
             cpf_digits = "".join(filter(str.isdigit, cpf))
+            if len(cpf_digits) != 11:
+                return None
 
-            all_customers = self._session.query(CustomerModel).all()
+            with self._session_scope() as session, stage(DB_QUERY):
+                customer_model = None
+                if self._cpf_key_mode != CPF_KEY_STRING:
+                    customer_model = (
+                        self._query(session)
+                        .filter(CustomerModel.cpf_numero == int(cpf_digits))
+                        .first()
+                    )
+                    count_rows(int(customer_model is not None))
 
-            for customer_model in all_customers:
-                if customer_model.cpf:
-                    db_cpf_clean = "".join(filter(str.isdigit, customer_model.cpf))
-                    if db_cpf_clean == cpf_digits:
-                        return self._to_entity(customer_model)
+                if customer_model is None and self._cpf_key_mode != CPF_KEY_INTEGER:
+                    customer_model = (
+                        self._query(session)
+                        .filter(CustomerModel.cpf.in_(stored_cpf_forms(cpf_digits)))
+                        .first()
+                    )
+                    count_rows(int(customer_model is not None))
 
-            return None
+                if customer_model is None:
+                    return None
 
-        except Exception:
-            return None
+                return self._to_entity(customer_model)
+
+        except Exception as e:
+            raise CustomerLookupError("Customer lookup failed") from e
+
+    def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """
+        Find customers by CPF with a single IN (...) query.
+
+        Args:
+            cpfs: Clean CPF numbers (only digits)
+
+        Returns:
+            Customers found, keyed by clean CPF
+
+        Raises:
+            CustomerLookupError: If the database could not be queried
+        """
+        try:
+            cpf_digits = cpf_digits_many(cpfs)
+            if not cpf_digits:
+                return {}
+
+            customers: Dict[str, Customer] = {}
+            with self._session_scope() as session, stage(DB_QUERY):
+                if self._cpf_key_mode != CPF_KEY_STRING:
+                    keys = [int(cpf) for cpf in cpf_digits]
+                    models = (
+                        self._query(session)
+                        .filter(CustomerModel.cpf_numero.in_(keys))
+                        .all()
+                    )
+                    count_rows(len(models))
+                    customers.update(self._by_cpf(models))
+
+                missing = [cpf for cpf in cpf_digits if cpf not in customers]
+                if missing and self._cpf_key_mode != CPF_KEY_INTEGER:
+                    models = (
+                        self._query(session)
+                        .filter(CustomerModel.cpf.in_(stored_cpf_forms_many(missing)))
+                        .all()
+                    )
+                    count_rows(len(models))
+                    customers.update(self._by_cpf(models))
+
+            return customers
+
+        except Exception as e:
+            raise CustomerLookupError("Customer lookup failed") from e
+
+    def iter_cpfs(self, batch_size: int = 10000) -> Iterator[str]:
+        """
+        Stream every stored CPF as bare digits.
+
+        Used to build the known-CPF Bloom filter; rows are fetched in
+        batches so memory stays flat regardless of table size.
+        """
+        with self._session_scope() as session:
+            rows = (
+                session.query(CustomerModel.cpf)
+                .filter(CustomerModel.cpf.isnot(None))
+                .yield_per(batch_size)
+            )
+            for (cpf,) in rows:
+                yield "".join(filter(str.isdigit, cpf))
+
+    def _query(self, session: Session) -> Query:
+        """Customer query; string mode defers cpf_numero and never loads it."""
+        query = session.query(CustomerModel)
+        if self._cpf_key_mode == CPF_KEY_STRING:
+            query = query.options(defer(CustomerModel.cpf_numero, raiseload=True))
+        return query
+
+    @classmethod
+    def _by_cpf(cls, models: Sequence[CustomerModel]) -> Dict[str, Customer]:
+        customers = (cls._to_entity(model) for model in models)
+        return {customer.cpf: customer for customer in customers}
 
     @staticmethod
     def _to_entity(model: CustomerModel) -> Customer:
         """Convert database model to domain entity."""
-        cpf_clean = "".join(filter(str.isdigit, model.cpf)) if model.cpf else ""
+        cpf_numero = None
+        if "cpf_numero" not in inspect(model).unloaded:
+            cpf_numero = model.cpf_numero
+
+        if cpf_numero is not None:
+            cpf_clean = f"{cpf_numero:011d}"
+        elif model.cpf:
+            cpf_clean = "".join(filter(str.isdigit, model.cpf))
+        else:
+            cpf_clean = ""
 
         return Customer(
             id=model.id,
@@ -0,0 +1,90 @@
+from typing import Dict, Optional, Sequence
+
+from src.domain.entities import Customer
+from src.application.use_cases.ports import ICustomerRepository
+from src.infrastructure.cache.bloom_filter import RefreshingBloomFilter
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class NegativeLookupCustomerRepository(ICustomerRepository):
+    """
+    Negative-result decorator for ICustomerRepository.
+
+    Answers definite misses from memory:
+    - a short-TTL cache of CPFs recently not found in the database
+    - an optional Bloom filter of every known CPF
+
+    A Bloom filter never yields false negatives for the CPFs it was built
+    from, so customers created after the last rebuild may be reported as
+    not found until the next refresh.
+
+    Misses are only cached after a successful lookup: a CustomerLookupError
+    from the wrapped repository propagates and records nothing, so a
+    database outage never turns into cached rejections.
+    """
+
+    def __init__(
+        self,
+        repository: ICustomerRepository,
+        miss_cache: Optional[TTLCache] = None,
+        bloom_filter: Optional[RefreshingBloomFilter] = None,
+    ):
+        self._repository = repository
+        self._miss_cache = miss_cache
+        self._bloom_filter = bloom_filter
+        self.bloom_rejections = 0
+
+    @property
+    def miss_cache(self) -> Optional[TTLCache]:
+        """Cache of recent misses (exposes hit/miss counters)."""
+        return self._miss_cache
+
+    def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        """
+        Find customer by CPF, short-circuiting known misses.
+
+        Args:
+            cpf: Clean CPF number (only digits)
+
+        Returns:
+            Customer entity or None if not found
+        """
+        key = "".join(filter(str.isdigit, cpf))
+
+        if self._is_known_miss(key):
+            return None
+
+        customer = self._repository.find_by_cpf(cpf)
+        if customer is None:
+            self._remember_miss(key)
+
+        return customer
+
+    def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """Find customers by CPF, querying only those not known to be missing."""
+        keys = dict.fromkeys("".join(filter(str.isdigit, cpf)) for cpf in cpfs)
+        candidates = [key for key in keys if not self._is_known_miss(key)]
+        if not candidates:
+            return {}
+
+        found = self._repository.find_many_by_cpf(candidates)
+        for key in candidates:
+            if key not in found:
+                self._remember_miss(key)
+
+        return found
+
+    def _is_known_miss(self, key: str) -> bool:
+        if self._miss_cache is not None and self._miss_cache.get(key):
+            return True
+
+        if self._bloom_filter is not None:
+            if self._bloom_filter.might_contain(key) is False:
+                self.bloom_rejections += 1
+                return True
+
+        return False
+
+    def _remember_miss(self, key: str):
+        if self._miss_cache is not None:
+            self._miss_cache.set(key, True)
@@ -0,0 +1,274 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Executable
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.domain.entities import Customer
+from src.application.instrumentation import DB_QUERY, stage
+from src.application.use_cases.ports import (
+    CustomerLookupError,
+    IAsyncCustomerRepository,
+    ICustomerRepository,
+)
+from src.adapters.gateways.cpf_keys import (
+    CPF_KEY_INTEGER,
+    CPF_KEY_STRING,
+    check_cpf_key_mode,
+    cpf_digits_many,
+    stored_cpf_forms,
+    stored_cpf_forms_many,
+)
+from src.infrastructure.database.query_stats import count_rows
+from src.infrastructure.database.tables import customers_table
+
+_columns = customers_table.c
+
+_FIND_BY_CPF = (
+    select(_columns.id, _columns.cpf, _columns.nome)
+    .where(_columns.cpf.in_(bindparam("cpf_forms", expanding=True)))
+    .limit(1)
+)
+
+_FIND_MANY_BY_CPF = select(_columns.id, _columns.cpf, _columns.nome).where(
+    _columns.cpf.in_(bindparam("cpf_forms", expanding=True))
+)
+
+_FIND_BY_CPF_KEY = (
+    select(_columns.id, _columns.nome)
+    .where(_columns.cpf_numero == bindparam("cpf_key"))
+    .limit(1)
+)
+
+_FIND_MANY_BY_CPF_KEY = select(_columns.id, _columns.cpf_numero, _columns.nome).where(
+    _columns.cpf_numero.in_(bindparam("cpf_keys", expanding=True))
+)
+
+_ALL_CPFS = select(_columns.cpf).where(_columns.cpf.isnot(None))
+
+
+class _ReadOnlyLookups:
+    """Statements and row mapping shared by the sync and async repositories."""
+
+    def __init__(self, cpf_key_mode: str):
+        self._cpf_key_mode = check_cpf_key_mode(cpf_key_mode)
+
+    def _lookups(self, cpf_digits: str) -> List[Tuple[Executable, Dict[str, Any]]]:
+        """Single-CPF queries to try in order (integer key, then text column)."""
+        lookups: List[Tuple[Executable, Dict[str, Any]]] = []
+        if self._cpf_key_mode != CPF_KEY_STRING:
+            lookups.append((_FIND_BY_CPF_KEY, {"cpf_key": int(cpf_digits)}))
+        if self._cpf_key_mode != CPF_KEY_INTEGER:
+            lookups.append((_FIND_BY_CPF, {"cpf_forms": stored_cpf_forms(cpf_digits)}))
+        return lookups
+
+    def _key_lookup_many(
+        self, cpf_digits: List[str]
+    ) -> Optional[Tuple[Executable, Dict[str, Any]]]:
+        """IN (...) query on the integer key, or None in string mode."""
+        if self._cpf_key_mode == CPF_KEY_STRING:
+            return None
+        return _FIND_MANY_BY_CPF_KEY, {"cpf_keys": [int(cpf) for cpf in cpf_digits]}
+
+    def _text_lookup_many(
+        self, cpf_digits: List[str], customers: Dict[str, Customer]
+    ) -> Optional[Tuple[Executable, Dict[str, Any]]]:
+        """IN (...) query on clientes.cpf for CPFs not found yet, if any."""
+        missing = [cpf for cpf in cpf_digits if cpf not in customers]
+        if not missing or self._cpf_key_mode == CPF_KEY_INTEGER:
+            return None
+        return _FIND_MANY_BY_CPF, {"cpf_forms": stored_cpf_forms_many(missing)}
+
+    @classmethod
+    def _by_key(cls, rows) -> Iterator[Tuple[str, Customer]]:
+        """(clean CPF, Customer) pairs from integer-key rows."""
+        return (cls._customer(row, f"{row.cpf_numero:011d}") for row in rows)
+
+    @classmethod
+    def _by_cpf(cls, rows) -> Iterator[Tuple[str, Customer]]:
+        """(clean CPF, Customer) pairs from text-column rows."""
+        return (
+            cls._customer(row, "".join(filter(str.isdigit, row.cpf))) for row in rows
+        )
+
+    @staticmethod
+    def _customer(row, cpf_digits: str) -> Tuple[str, Customer]:
+        """Map a (id, nome) row to a (clean CPF, Customer) pair."""
+        return cpf_digits, Customer(id=row.id, cpf=cpf_digits, nome=row.nome)
+
+
+class ReadOnlyCustomerRepository(_ReadOnlyLookups, ICustomerRepository):
+    """
+    Read-only Customer Repository.
+
+    Fast path for authentication lookups: selects only the columns the
+    use case needs (id, cpf, nome) with SQLAlchemy Core on an autocommit
+    connection, skipping ORM hydration, the identity map and the commit
+    round trip. Returned customers carry no contact or audit fields.
+    Queries target the Core ``customers_table``, so this path never
+    imports ``sqlalchemy.orm``.
+
+    ``cpf_key_mode`` selects the lookup column, as in ``CustomerRepository``.
+    """
+
+    def __init__(
+        self,
+        connection_scope: Callable[[], ContextManager[Connection]],
+        cpf_key_mode: str = CPF_KEY_STRING,
+    ):
+        super().__init__(cpf_key_mode)
+        self._connection_scope = connection_scope
+
+    def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        """
+        Find customer by CPF.
+
+        Args:
+            cpf: Clean CPF number (only digits)
+
+        Returns:
+            Customer entity or None if not found
+
+        Raises:
+            CustomerLookupError: If the database could not be queried
+        """
+        try:
+            cpf_digits = "".join(filter(str.isdigit, cpf))
+            if len(cpf_digits) != 11:
+                return None
+
+            with self._connection_scope() as connection, stage(DB_QUERY):
+                for statement, params in self._lookups(cpf_digits):
+                    row = connection.execute(statement, params).first()
+                    count_rows(int(row is not None))
+                    if row is not None:
+                        return self._customer(row, cpf_digits)[1]
+            return None
+
+        except Exception as e:
+            raise CustomerLookupError("Customer lookup failed") from e
+
+    def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """
+        Find customers by CPF with a single IN (...) query.
+
+        Args:
+            cpfs: Clean CPF numbers (only digits)
+
+        Returns:
+            Customers found, keyed by clean CPF
+
+        Raises:
+            CustomerLookupError: If the database could not be queried
+        """
+        try:
+            cpf_digits = cpf_digits_many(cpfs)
+            if not cpf_digits:
+                return {}
+
+            customers: Dict[str, Customer] = {}
+            with self._connection_scope() as connection, stage(DB_QUERY):
+                query = self._key_lookup_many(cpf_digits)
+                if query is not None:
+                    rows = connection.execute(*query).all()
+                    count_rows(len(rows))
+                    customers.update(self._by_key(rows))
+
+                query = self._text_lookup_many(cpf_digits, customers)
+                if query is not None:
+                    rows = connection.execute(*query).all()
+                    count_rows(len(rows))
+                    customers.update(self._by_cpf(rows))
+
+            return customers
+
+        except Exception as e:
+            raise CustomerLookupError("Customer lookup failed") from e
+
+    def iter_cpfs(self, batch_size: int = 10000) -> Iterator[str]:
+        """Stream every stored CPF as bare digits."""
+        with self._connection_scope() as connection:
+            result = connection.execution_options(yield_per=batch_size).execute(
+                _ALL_CPFS
+            )
+            for (cpf,) in result:
+                yield "".join(filter(str.isdigit, cpf))
+
+
+class AsyncReadOnlyCustomerRepository(_ReadOnlyLookups, IAsyncCustomerRepository):
+    """
+    asyncio variant of ReadOnlyCustomerRepository.
+
+    Runs the same Core statements on connections from an async engine
+    (e.g. ``DatabaseConnection.get_async_connection``), so lookups yield
+    to the event loop while the database answers.
+    """
+
+    def __init__(
+        self,
+        connection_scope: Callable[[], AsyncContextManager["AsyncConnection"]],
+        cpf_key_mode: str = CPF_KEY_STRING,
+    ):
+        super().__init__(cpf_key_mode)
+        self._connection_scope = connection_scope
+
+    async def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        """Find customer by CPF (clean digits); None if not found."""
+        try:
+            cpf_digits = "".join(filter(str.isdigit, cpf))
+            if len(cpf_digits) != 11:
+                return None
+
+            async with self._connection_scope() as connection:
+                with stage(DB_QUERY):
+                    for statement, params in self._lookups(cpf_digits):
+                        row = (await connection.execute(statement, params)).first()
+                        count_rows(int(row is not None))
+                        if row is not None:
+                            return self._customer(row, cpf_digits)[1]
+            return None
+
+        except Exception as e:
+            raise CustomerLookupError("Customer lookup failed") from e
+
+    async def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """Find customers by CPF with a single IN (...) query, keyed by clean CPF."""
+        try:
+            cpf_digits = cpf_digits_many(cpfs)
+            if not cpf_digits:
+                return {}
+
+            customers: Dict[str, Customer] = {}
+            async with self._connection_scope() as connection:
+                with stage(DB_QUERY):
+                    query = self._key_lookup_many(cpf_digits)
+                    if query is not None:
+                        rows = (await connection.execute(*query)).all()
+                        count_rows(len(rows))
+                        customers.update(self._by_key(rows))
+
+                    query = self._text_lookup_many(cpf_digits, customers)
+                    if query is not None:
+                        rows = (await connection.execute(*query)).all()
+                        count_rows(len(rows))
+                        customers.update(self._by_cpf(rows))
+
+            return customers
+
+        except Exception as e:
+            raise CustomerLookupError("Customer lookup failed") from e
@@ -0,0 +1,93 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Iterator, Optional
+
+# Stage names, in request order
+PARSE = "parse"
+VALIDATE = "validate"
+DB_CONNECT = "db_connect"
+DB_QUERY = "db_query"
+SIGN = "sign"
+VERIFY = "verify"
+SERIALIZE = "serialize"
+TOTAL = "total"
+
+
+class Timings:
+    """Stage durations (seconds) recorded for one request."""
+
+    __slots__ = ("cold_start", "stages")
+
+    def __init__(self, cold_start: bool = False):
+        self.cold_start = cold_start
+        self.stages: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float):
+        """Add to a stage; stages entered repeatedly accumulate."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def milliseconds(self) -> Dict[str, float]:
+        """Stage durations in milliseconds, rounded to microseconds."""
+        return {name: round(s * 1000, 3) for name, s in self.stages.items()}
+
+
+_current: ContextVar[Optional[Timings]] = ContextVar("timings", default=None)
+
+
+class _Stage:
+    __slots__ = ("_timings", "_name", "_started")
+
+    def __init__(self, timings: Timings, name: str):
+        self._timings = timings
+        self._name = name
+
+    def __enter__(self):
+        self._started = perf_counter()
+
+    def __exit__(self, *exc_info):
+        self._timings.add(self._name, perf_counter() - self._started)
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name: str):
+    """
+    Context manager timing a stage of the current request.
+
+    Outside ``timed`` (instrumentation disabled) this returns a shared
+    no-op, so instrumented code pays one context variable lookup.
+    """
+    timings = _current.get()
+    if timings is None:
+        return _NO_STAGE
+    return _Stage(timings, name)
+
+
+@contextmanager
+def timed(cold_start: bool = False) -> Iterator[Timings]:
+    """
+    Record the stages entered inside the block, plus its ``total``.
+
+    The timings live in a context variable, so concurrent asyncio tasks
+    each record their own request.
+    """
+    timings = Timings(cold_start)
+    token = _current.set(timings)
+    started = perf_counter()
+    try:
+        yield timings
+    finally:
+        timings.add(TOTAL, perf_counter() - started)
+        _current.reset(token)
@@ -1,8 +1,20 @@
-from dataclasses import dataclass
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
+from src.domain.entities import Customer
 from src.domain.value_objects import CPF
-from src.application.use_cases.ports import ICustomerRepository, ITokenGenerator
+from src.application.instrumentation import VALIDATE, stage
+from src.application.use_cases.ports import (
+    IAsyncCustomerRepository,
+    ICustomerRepository,
+    IRefreshTokenRegistry,
+    ITokenGenerator,
+)
+
+INVALID_CPF = "INVALID_CPF"
+CUSTOMER_NOT_FOUND = "CUSTOMER_NOT_FOUND"
+INVALID_REFRESH_TOKEN = "INVALID_REFRESH_TOKEN"
 
 
 @dataclass
@@ -21,6 +33,31 @@ class AuthenticationResponse:
     message: Optional[str] = None
     customer_id: Optional[str] = None
     customer_name: Optional[str] = None
+    error_code: Optional[str] = None
+    refresh_token: Optional[str] = None
+
+
+@dataclass
+class RefreshRequest:
+    """Input data for refreshing an access token."""
+
+    refresh_token: str
+
+
+@dataclass
+class BatchAuthenticationRequest:
+    """Input data for batch authentication."""
+
+    cpfs: List[str]
+
+
+@dataclass
+class BatchAuthenticationResponse:
+    """Output data for batch authentication (one result per input CPF)."""
+
+    success: bool
+    results: List[AuthenticationResponse] = field(default_factory=list)
+    message: Optional[str] = None
 
 
 class AuthenticateCustomerUseCase:
@@ -31,17 +68,37 @@ class AuthenticateCustomerUseCase:
     1. Validate CPF format
     2. Find customer in database
     3. Check customer status
-    4. Generate JWT token
+    4. Generate JWT token (plus a refresh token when enabled)
+    5. Re-issue access tokens from refresh tokens, without a lookup
+
+    A failed lookup raises CustomerLookupError out of ``execute`` and
+    ``execute_batch``, so an outage is never reported as an unknown CPF.
+
+    Refresh token replays are only detected by ``refresh_token_registry``
+    when it has seen the first use: the in-memory registry is per
+    container, so a replay landing on another Lambda container succeeds.
 
     This class contains the application business logic,
     independent of frameworks and external systems.
     """
 
     def __init__(
-        self, customer_repository: ICustomerRepository, token_generator: ITokenGenerator
+        self,
+        customer_repository: ICustomerRepository,
+        token_generator: ITokenGenerator,
+        max_batch_size: int = 50,
+        refresh_expiration_minutes: int = 0,
+        refresh_max_lifetime_minutes: int = 0,
+        rotate_refresh_tokens: bool = True,
+        refresh_token_registry: Optional[IRefreshTokenRegistry] = None,
     ):
         self._customer_repository = customer_repository
         self._token_generator = token_generator
+        self._max_batch_size = max_batch_size
+        self._refresh_expiration_seconds = refresh_expiration_minutes * 60
+        self._refresh_max_lifetime_seconds = refresh_max_lifetime_minutes * 60
+        self._rotate_refresh_tokens = rotate_refresh_tokens
+        self._refresh_token_registry = refresh_token_registry
 
     def execute(self, request: AuthenticationRequest) -> AuthenticationResponse:
         """
@@ -52,19 +109,158 @@ class AuthenticateCustomerUseCase:
 
         Returns:
             AuthenticationResponse with token or error message
+
+        Raises:
+            CustomerLookupError: If the customer store could not be queried
         """
         try:
-            cpf = CPF(request.cpf)
+            with stage(VALIDATE):
+                cpf = CPF(request.cpf)
         except ValueError:
-            return AuthenticationResponse(success=False, message="CPF inválido")
+            return self._invalid_cpf()
 
         customer = self._customer_repository.find_by_cpf(cpf.clean())
+        return self._login(customer)
+
+    def execute_refresh(self, request: RefreshRequest) -> AuthenticationResponse:
+        """
+        Re-issue an access token from a refresh token.
+
+        Uses only the refresh token's claims: no CPF validation and no
+        repository lookup. With rotation, the presented token is consumed
+        and a new one (same ``auth_time``) is returned; presenting a
+        consumed token again is rejected.
+
+        Args:
+            request: Refresh request with the refresh token
+
+        Returns:
+            AuthenticationResponse with a new token or error message
+        """
+        if self._refresh_expiration_seconds <= 0:
+            return self._invalid_refresh_token()
+
+        try:
+            claims = self._token_generator.validate_refresh(request.refresh_token)
+        except ValueError:
+            return self._invalid_refresh_token()
+
+        now = int(time.time())
+        auth_time = claims["auth_time"]
+        if (
+            self._refresh_max_lifetime_seconds > 0
+            and now >= auth_time + self._refresh_max_lifetime_seconds
+        ):
+            return self._invalid_refresh_token(
+                "Sessão expirada, autentique-se novamente"
+            )
+
+        refresh_token = None
+        if self._rotate_refresh_tokens:
+            if self._refresh_token_registry is not None and not (
+                self._refresh_token_registry.consume(claims["jti"], claims["exp"])
+            ):
+                return self._invalid_refresh_token("Refresh token já utilizado")
+
+            refresh_token = self._refresh_token(
+                claims["sub"], claims["cpf"], claims.get("name"), auth_time, now
+            )
+
+        token = self._token_generator.generate(
+            customer_id=claims["sub"], cpf=claims["cpf"]
+        )
+
+        return AuthenticationResponse(
+            success=True,
+            token=token,
+            message="Token renovado com sucesso",
+            customer_id=claims["sub"],
+            customer_name=claims.get("name"),
+            refresh_token=refresh_token,
+        )
+
+    def execute_batch(
+        self, request: BatchAuthenticationRequest
+    ) -> BatchAuthenticationResponse:
+        """
+        Authenticate many customers with a single repository lookup.
+
+        Args:
+            request: Batch request with a list of CPFs
 
+        Returns:
+            BatchAuthenticationResponse with one result per CPF, in order
+
+        Raises:
+            CustomerLookupError: If the customer store could not be queried
+        """
+        rejected = self._reject_batch(request)
+        if rejected is not None:
+            return rejected
+
+        with stage(VALIDATE):
+            clean_cpfs = self._clean_batch(request.cpfs)
+        valid_cpfs = [cpf for cpf in dict.fromkeys(clean_cpfs) if cpf is not None]
+        customers: Dict[str, Customer] = {}
+        if valid_cpfs:
+            customers = self._customer_repository.find_many_by_cpf(valid_cpfs)
+        return self._batch_response(clean_cpfs, customers)
+
+    def _login(self, customer: Optional[Customer]) -> AuthenticationResponse:
         if not customer:
-            return AuthenticationResponse(
-                success=False, message="Cliente não encontrado"
+            return self._not_found()
+
+        response = self._authenticated(customer)
+        if self._refresh_expiration_seconds > 0:
+            now = int(time.time())
+            response.refresh_token = self._refresh_token(
+                str(customer.id), customer.cpf, customer.nome, auth_time=now, now=now
+            )
+        return response
+
+    def _reject_batch(
+        self, request: BatchAuthenticationRequest
+    ) -> Optional[BatchAuthenticationResponse]:
+        if not request.cpfs:
+            return BatchAuthenticationResponse(
+                success=False, message="Lista de CPFs vazia"
             )
 
+        if len(request.cpfs) > self._max_batch_size:
+            return BatchAuthenticationResponse(
+                success=False,
+                message=f"Limite de {self._max_batch_size} CPFs por lote excedido",
+            )
+        return None
+
+    @staticmethod
+    def _clean_batch(raw_cpfs: List[str]) -> List[Optional[str]]:
+        clean_cpfs: List[Optional[str]] = []
+        for raw_cpf in raw_cpfs:
+            try:
+                clean_cpfs.append(CPF(raw_cpf).clean())
+            except (TypeError, ValueError):
+                clean_cpfs.append(None)
+        return clean_cpfs
+
+    def _batch_response(
+        self, clean_cpfs: List[Optional[str]], customers: Dict[str, Customer]
+    ) -> BatchAuthenticationResponse:
+        tokens: Dict[str, AuthenticationResponse] = {}
+        results = []
+        for cpf in clean_cpfs:
+            if cpf is None:
+                results.append(self._invalid_cpf())
+            elif cpf not in customers:
+                results.append(self._not_found())
+            else:
+                if cpf not in tokens:
+                    tokens[cpf] = self._authenticated(customers[cpf])
+                results.append(tokens[cpf])
+
+        return BatchAuthenticationResponse(success=True, results=results)
+
+    def _authenticated(self, customer) -> AuthenticationResponse:
         token = self._token_generator.generate(
             customer_id=customer.id, cpf=customer.cpf
         )
@@ -76,3 +272,94 @@ class AuthenticateCustomerUseCase:
             customer_id=customer.id,
             customer_name=customer.nome,
         )
+
+    def _refresh_token(
+        self,
+        customer_id: str,
+        cpf: str,
+        customer_name: Optional[str],
+        auth_time: int,
+        now: int,
+    ) -> str:
+        expires_at = now + self._refresh_expiration_seconds
+        if self._refresh_max_lifetime_seconds > 0:
+            expires_at = min(expires_at, auth_time + self._refresh_max_lifetime_seconds)
+
+        return self._token_generator.generate_refresh(
+            customer_id=customer_id,
+            cpf=cpf,
+            customer_name=customer_name,
+            auth_time=auth_time,
+            expires_at=expires_at,
+        )
+
+    @staticmethod
+    def _invalid_refresh_token(
+        message: str = "Refresh token inválido",
+    ) -> AuthenticationResponse:
+        return AuthenticationResponse(
+            success=False, message=message, error_code=INVALID_REFRESH_TOKEN
+        )
+
+    @staticmethod
+    def _invalid_cpf() -> AuthenticationResponse:
+        return AuthenticationResponse(
+            success=False, message="CPF inválido", error_code=INVALID_CPF
+        )
+
+    @staticmethod
+    def _not_found() -> AuthenticationResponse:
+        return AuthenticationResponse(
+            success=False,
+            message="Cliente não encontrado",
+            error_code=CUSTOMER_NOT_FOUND,
+        )
+
+
+class AsyncAuthenticateCustomerUseCase(AuthenticateCustomerUseCase):
+    """
+    asyncio variant of AuthenticateCustomerUseCase.
+
+    Same rules and responses; repository lookups are awaited on an
+    ``IAsyncCustomerRepository``, so a single event loop can serve many
+    concurrent logins. Token signing stays synchronous (CPU-bound).
+    """
+
+    def __init__(
+        self,
+        customer_repository: IAsyncCustomerRepository,
+        token_generator: ITokenGenerator,
+        **options,
+    ):
+        super().__init__(customer_repository, token_generator, **options)
+
+    async def execute(self, request: AuthenticationRequest) -> AuthenticationResponse:
+        """Execute authentication use case."""
+        try:
+            with stage(VALIDATE):
+                cpf = CPF(request.cpf)
+        except ValueError:
+            return self._invalid_cpf()
+
+        customer = await self._customer_repository.find_by_cpf(cpf.clean())
+        return self._login(customer)
+
+    async def execute_refresh(self, request: RefreshRequest) -> AuthenticationResponse:
+        """Re-issue an access token from a refresh token (no lookup)."""
+        return super().execute_refresh(request)
+
+    async def execute_batch(
+        self, request: BatchAuthenticationRequest
+    ) -> BatchAuthenticationResponse:
+        """Authenticate many customers with a single repository lookup."""
+        rejected = self._reject_batch(request)
+        if rejected is not None:
+            return rejected
+
+        with stage(VALIDATE):
+            clean_cpfs = self._clean_batch(request.cpfs)
+        valid_cpfs = [cpf for cpf in dict.fromkeys(clean_cpfs) if cpf is not None]
+        customers: Dict[str, Customer] = {}
+        if valid_cpfs:
+            customers = await self._customer_repository.find_many_by_cpf(valid_cpfs)
+        return self._batch_response(clean_cpfs, customers)
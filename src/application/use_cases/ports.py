@@ -1,9 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 from src.domain.entities import Customer
 
 
+class CustomerLookupError(Exception):
+    """
+    The customer store could not be queried.
+
+    Raised by repositories instead of reporting the customer as missing,
+    so callers never mistake an outage for an unknown CPF.
+    """
+
+
 class ICustomerRepository(ABC):
     """Interface for customer data access."""
 
@@ -12,6 +21,25 @@ class ICustomerRepository(ABC):
         """Find customer by CPF."""
         pass
 
+    @abstractmethod
+    def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """Find customers by CPF in one lookup, keyed by clean CPF."""
+        pass
+
+
+class IAsyncCustomerRepository(ABC):
+    """Interface for customer data access from asyncio code."""
+
+    @abstractmethod
+    async def find_by_cpf(self, cpf: str) -> Optional[Customer]:
+        """Find customer by CPF."""
+        pass
+
+    @abstractmethod
+    async def find_many_by_cpf(self, cpfs: Sequence[str]) -> Dict[str, Customer]:
+        """Find customers by CPF in one lookup, keyed by clean CPF."""
+        pass
+
 
 class ITokenGenerator(ABC):
     """Interface for JWT token generation."""
@@ -25,3 +53,29 @@ class ITokenGenerator(ABC):
     def validate(self, token: str) -> dict:
         """Validate and decode JWT token."""
         pass
+
+    @abstractmethod
+    def generate_refresh(
+        self,
+        customer_id: str,
+        cpf: str,
+        customer_name: str,
+        auth_time: int,
+        expires_at: int,
+    ) -> str:
+        """Generate a refresh token carrying the claims needed to re-issue."""
+        pass
+
+    @abstractmethod
+    def validate_refresh(self, token: str) -> dict:
+        """Validate and decode a refresh token."""
+        pass
+
+
+class IRefreshTokenRegistry(ABC):
+    """Interface for tracking refresh tokens already exchanged (rotation)."""
+
+    @abstractmethod
+    def consume(self, token_id: str, expires_at: int) -> bool:
+        """Mark token_id as used. Returns False if it was already used."""
+        pass
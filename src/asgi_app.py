@@ -0,0 +1,69 @@
+from functools import lru_cache
+from typing import Optional
+
+from src.adapters.controllers.asgi_adapter import ASGIAdapter
+from src.adapters.controllers.authentication_controller import (
+    AsyncAuthenticationController,
+)
+from src.adapters.controllers.response_builder import ResponseBuilder
+from src.adapters.gateways.readonly_customer_repository import (
+    AsyncReadOnlyCustomerRepository,
+)
+from src.application.use_cases.authenticate_customer import (
+    AsyncAuthenticateCustomerUseCase,
+)
+from src.infrastructure.cache.refresh_token_registry import (
+    build_refresh_token_registry,
+)
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.query_stats import QueryBudget, build_query_budget
+from src.infrastructure.observability.logging import configure_logging
+from src.infrastructure.security.jwt_service import JWTTokenGenerator
+from src.infrastructure.security.keyring import build_keyring
+from src.infrastructure.serialization.json_encoder import get_json_encoder
+
+
+@lru_cache()
+def get_async_controller() -> AsyncAuthenticationController:
+    """
+    Get the process-lifetime object graph for the async serving mode.
+
+    Same use case rules and response mapping as ``lambda_handler``, with
+    customer lookups awaited on the async read-only repository. The async
+    engine and its pool are created by the first lookup.
+    """
+    settings = get_settings()
+    configure_logging(settings)
+
+    use_case = AsyncAuthenticateCustomerUseCase(
+        customer_repository=AsyncReadOnlyCustomerRepository(
+            DatabaseConnection.get_async_connection, settings.customer_cpf_key
+        ),
+        token_generator=JWTTokenGenerator(
+            keyring=build_keyring(settings, background_refresh=True)
+        ),
+        max_batch_size=settings.auth_batch_max_size,
+        refresh_expiration_minutes=settings.jwt_refresh_expiration_minutes,
+        refresh_max_lifetime_minutes=settings.jwt_refresh_max_lifetime_minutes,
+        rotate_refresh_tokens=settings.refresh_token_rotation,
+        refresh_token_registry=build_refresh_token_registry(settings),
+    )
+
+    return AsyncAuthenticationController(
+        use_case, ResponseBuilder(get_json_encoder(settings.json_encoder))
+    )
+
+
+@lru_cache()
+def get_query_budget() -> Optional[QueryBudget]:
+    """Get the per-request query budget (None when QUERY_BUDGET_MODE=off)."""
+    return build_query_budget(get_settings())
+
+
+# ASGI entry point, e.g. `uvicorn src.asgi_app:app`
+app = ASGIAdapter(
+    get_async_controller,
+    on_shutdown=DatabaseConnection.dispose_async,
+    query_budget_factory=get_query_budget,
+)
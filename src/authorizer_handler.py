@@ -0,0 +1,59 @@
+from functools import lru_cache
+from typing import Any, Dict
+
+from src.adapters.controllers.authorizer_controller import AuthorizerController
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.observability.logging import configure_logging, flush_logs
+from src.infrastructure.security.jwt_service import JWTTokenGenerator
+from src.infrastructure.security.keyring import build_keyring
+
+
+@lru_cache()
+def get_authorizer() -> AuthorizerController:
+    """
+    Get the container-lifetime authorizer (composition root).
+
+    The verified-token cache lives as long as the warm container, so a
+    token presented again skips signature verification entirely.
+    """
+    settings = get_settings()
+    configure_logging(settings)
+
+    token_cache = None
+    if settings.token_cache_max_size > 0 and settings.token_cache_ttl_seconds > 0:
+        token_cache = TTLCache(
+            max_size=settings.token_cache_max_size,
+            ttl_seconds=settings.token_cache_ttl_seconds,
+        )
+
+    token_generator = JWTTokenGenerator(
+        token_cache=token_cache,
+        failure_ttl_seconds=settings.token_failure_cache_seconds,
+        keyring=build_keyring(settings),
+    )
+
+    return AuthorizerController(
+        token_generator,
+        allowed_roles=settings.authorizer_allowed_roles,
+        revoked_token_ids=settings.authorizer_revoked_token_ids,
+        simple_responses=settings.authorizer_simple_responses,
+    )
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    AWS Lambda REQUEST authorizer for protected routes.
+
+    Args:
+        event: API Gateway authorizer event
+        context: Lambda context
+
+    Returns:
+        Simple response or IAM policy document
+    """
+    authorizer = get_authorizer()
+    try:
+        return authorizer.handle(event)
+    finally:
+        flush_logs()
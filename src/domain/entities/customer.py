@@ -13,15 +13,18 @@ class Customer:
 
     Note: Production database doesn't have status field, so all customers
     with valid CPF in the database are considered active.
+
+    Contact and audit fields are optional so read paths that only need
+    identity (id, cpf, nome) can skip loading them.
     """
 
     id: str
     cpf: str
     nome: str
-    email: Optional[str]
-    telefone: Optional[str]
-    criado_em: datetime
-    atualizado_em: datetime
+    email: Optional[str] = None
+    telefone: Optional[str] = None
+    criado_em: Optional[datetime] = None
+    atualizado_em: Optional[datetime] = None
 
     def is_active(self) -> bool:
         """
@@ -1,3 +1,4 @@
 from .cpf import CPF
+from .cpf_bulk import CPFBulkValidation, validate_cpfs
 
-__all__ = ["CPF"]
+__all__ = ["CPF", "CPFBulkValidation", "validate_cpfs"]
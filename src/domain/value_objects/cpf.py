@@ -47,6 +47,17 @@ class CPF:
         """Return CPF without formatting."""
         return self._clean()
 
+    def to_int(self) -> int:
+        """Return CPF as an integer key (leading zeros are implied)."""
+        return int(self._clean())
+
+    @classmethod
+    def from_int(cls, number: int) -> "CPF":
+        """Create CPF from its integer key."""
+        if not 0 <= number < 10**11:
+            raise ValueError(f"Invalid CPF: {number}")
+        return cls(f"{number:011d}")
+
     def format(self) -> str:
         """Return formatted CPF (XXX.XXX.XXX-XX)."""
         cpf = self._clean()
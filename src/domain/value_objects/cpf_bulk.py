@@ -0,0 +1,137 @@
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence
+
+# NumPy is imported on the first bulk validation rather than with the
+# package: it costs more to import than the rest of the domain layer, and
+# the single-CPF login path never needs it.
+_NOT_LOADED: Any = object()
+np: Any = _NOT_LOADED
+
+_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_DROP_ASCII_NON_DIGITS = {code: None for code in range(128) if not chr(code).isdigit()}
+
+
+@dataclass(frozen=True)
+class CPFBulkValidation:
+    """
+    Result of validating many CPFs at once.
+
+    ``mask[i]`` tells whether input ``i`` is a valid CPF; ``canonical[i]``
+    is its digits-only form (exactly ``CPF(value).clean()``) when valid,
+    None otherwise. ``mask`` is a NumPy bool array when NumPy was used,
+    a list of bools otherwise.
+    """
+
+    mask: Sequence[bool]
+    canonical: List[Optional[str]]
+
+    @property
+    def valid_count(self) -> int:
+        """Number of valid CPFs."""
+        return int(sum(self.mask))
+
+    def __len__(self) -> int:
+        return len(self.canonical)
+
+
+def validate_cpfs(values: Iterable[Any], use_numpy: bool = True) -> CPFBulkValidation:
+    """
+    Validate many raw CPF strings with the same rules as ``CPF``.
+
+    Formatting is stripped exactly as ``CPF`` does (every Unicode decimal
+    digit is kept). Check digits are computed for all 11-digit candidates
+    at once with NumPy when installed, or with a tight pure-Python loop.
+    Non-string values are reported invalid instead of raising.
+
+    Args:
+        values: Iterable or array of raw CPF strings
+        use_numpy: Set False to force the pure-Python implementation
+
+    Returns:
+        CPFBulkValidation with the validity mask and canonical forms
+    """
+    digits = [_digits(value) for value in values]
+
+    if use_numpy and load_numpy() is not None:
+        return _validate_numpy(digits)
+    return _validate_python(digits)
+
+
+def load_numpy() -> Any:
+    """Import NumPy on first use; returns the module, or None if absent."""
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - exercised when numpy is absent
+            numpy = None
+        np = numpy
+    return np
+
+
+def _digits(value: Any) -> Optional[str]:
+    """Digits-only form, as ``CPF._clean``; None for non-strings."""
+    if not isinstance(value, str):
+        return None
+    if value.isascii():
+        return value if value.isdigit() else value.translate(_DROP_ASCII_NON_DIGITS)
+    return "".join(filter(str.isdecimal, value))
+
+
+def _ascii(digits: str) -> str:
+    """Map any Unicode decimal digits to ASCII for arithmetic."""
+    if digits.isascii():
+        return digits
+    return "".join(str(unicodedata.decimal(char)) for char in digits)
+
+
+def _validate_python(digits: List[Optional[str]]) -> CPFBulkValidation:
+    mask: List[bool] = []
+    canonical: List[Optional[str]] = []
+
+    for cpf in digits:
+        valid = cpf is not None and len(cpf) == 11 and _check_digits_match(_ascii(cpf))
+        mask.append(valid)
+        canonical.append(cpf if valid else None)
+
+    return CPFBulkValidation(mask=mask, canonical=canonical)
+
+
+def _check_digits_match(cpf: str) -> bool:
+    if cpf == cpf[0] * 11:
+        return False
+
+    numbers = [ord(char) - 48 for char in cpf]
+    first = sum(a * b for a, b in zip(numbers, _FIRST_WEIGHTS)) * 10 % 11 % 10
+    if first != numbers[9]:
+        return False
+    second = sum(a * b for a, b in zip(numbers, _SECOND_WEIGHTS)) * 10 % 11 % 10
+    return second == numbers[10]
+
+
+def _validate_numpy(digits: List[Optional[str]]) -> CPFBulkValidation:
+    mask = np.zeros(len(digits), dtype=bool)
+    candidates = [
+        i for i, cpf in enumerate(digits) if cpf is not None and len(cpf) == 11
+    ]
+
+    if candidates:
+        packed = "".join(_ascii(digits[i]) for i in candidates).encode("ascii")
+        matrix = (
+            np.frombuffer(packed, dtype=np.uint8).reshape(-1, 11).astype(np.int32) - 48
+        )
+
+        first = matrix[:, :9] @ np.array(_FIRST_WEIGHTS, dtype=np.int32) * 10 % 11 % 10
+        second = (
+            matrix[:, :10] @ np.array(_SECOND_WEIGHTS, dtype=np.int32) * 10 % 11 % 10
+        )
+        repeated = (matrix == matrix[:, :1]).all(axis=1)
+
+        mask[candidates] = (
+            (first == matrix[:, 9]) & (second == matrix[:, 10]) & ~repeated
+        )
+
+    canonical = [cpf if valid else None for cpf, valid in zip(digits, mask.tolist())]
+    return CPFBulkValidation(mask=mask, canonical=canonical)
@@ -0,0 +1,178 @@
+import hashlib
+import math
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from loguru import logger
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized from the expected number of items and target false-positive
+    rate; ``max_bytes`` caps memory, trading a higher false-positive
+    rate for a smaller bit array.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = 0.01,
+        max_bytes: Optional[int] = None,
+    ):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        num_bits = math.ceil(
+            -capacity * math.log(false_positive_rate) / (math.log(2) ** 2)
+        )
+        if max_bytes is not None:
+            num_bits = min(num_bits, max_bytes * 8)
+        num_bits = max(num_bits, 8)
+
+        self._num_bits = num_bits
+        self._num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+        self.count = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the bit array."""
+        return len(self._bits)
+
+    @property
+    def num_hashes(self) -> int:
+        """Number of hash functions applied per item."""
+        return self._num_hashes
+
+    def add(self, item: str):
+        """Add item to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """False means definitely absent; True means possibly present."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def _positions(self, item: str):
+        """Kirsch-Mitzenmacher double hashing over a single 128-bit digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._num_bits for i in range(self._num_hashes))
+
+
+class RefreshingBloomFilter:
+    """
+    Bloom filter rebuilt periodically from a loader of known items.
+
+    The filter is rebuilt in-process once it is older than
+    ``refresh_seconds``, so warm containers pick up new customers without
+    a redeploy or cold start. While a rebuild runs, the previous filter
+    keeps serving lookups.
+
+    Every rebuild runs the loader in full (for customers, a scan of
+    clientes), in every container. On Lambda a background rebuild thread
+    is frozen between invocations, so it can take many invocations to
+    finish and holds its DB connection meanwhile.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[str]],
+        capacity: int,
+        false_positive_rate: float = 0.01,
+        max_bytes: Optional[int] = None,
+        refresh_seconds: float = 300.0,
+        background: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._max_bytes = max_bytes
+        self._refresh_seconds = refresh_seconds
+        self._background = background
+        self._clock = clock
+
+        self._filter: Optional[BloomFilter] = None
+        self._built_at: Optional[float] = None
+        self._refreshing = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether a filter has been built."""
+        return self._filter is not None
+
+    def might_contain(self, item: str) -> Optional[bool]:
+        """
+        Check item against the current filter.
+
+        Returns:
+            None when no filter is available yet, otherwise the filter answer
+        """
+        if self._is_stale():
+            self._schedule_refresh()
+
+        current = self._filter
+        if current is None:
+            return None
+        return item in current
+
+    def refresh(self):
+        """Rebuild the filter synchronously from the loader."""
+        if not self._refreshing.acquire(blocking=False):
+            return
+        try:
+            self._rebuild()
+        finally:
+            self._refreshing.release()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._built_at is None
+            or self._clock() - self._built_at >= self._refresh_seconds
+        )
+
+    def _schedule_refresh(self):
+        if not self._background:
+            self.refresh()
+            return
+        if self._refreshing.locked():
+            return
+        threading.Thread(target=self.refresh, daemon=True).start()
+
+    def _rebuild(self):
+        started_at = self._clock()
+        try:
+            bloom = BloomFilter(
+                self._capacity, self._false_positive_rate, self._max_bytes
+            )
+            for item in self._loader():
+                bloom.add(item)
+        except Exception as e:
+            # Retry on the next stale check instead of on every lookup
+            self._built_at = started_at
+            logger.warning("Bloom filter rebuild failed", error=str(e))
+            return
+
+        if bloom.count > self._capacity:
+            logger.warning(
+                "Bloom filter over capacity",
+                count=bloom.count,
+                capacity=self._capacity,
+            )
+
+        self._filter = bloom
+        self._built_at = started_at
+        logger.info(
+            "Bloom filter rebuilt", count=bloom.count, size_bytes=bloom.size_bytes
+        )
@@ -0,0 +1,53 @@
+import time
+from typing import Callable, Optional
+
+from src.application.use_cases.ports import IRefreshTokenRegistry
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.config.settings import Settings
+
+
+class InMemoryRefreshTokenRegistry(IRefreshTokenRegistry):
+    """
+    Per-container record of refresh tokens already exchanged.
+
+    Each ``jti`` is kept until its token expires, after which the token is
+    rejected by signature validation anyway. Only replays that land on the
+    same warm container are detected; the registry is bounded, so under
+    pressure the oldest entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._clock = clock
+        # Every entry gets its own TTL from the token's wall-clock exp
+        self._used = TTLCache(max_size=max_size, ttl_seconds=1, clock=clock)
+
+    def consume(self, token_id: str, expires_at: int) -> bool:
+        """Mark token_id as used. Returns False if it was already used."""
+        if self._used.get(token_id) is not None:
+            return False
+
+        self._used.set(token_id, True, ttl_seconds=expires_at - self._clock())
+        return True
+
+
+def build_refresh_token_registry(
+    settings: Settings,
+) -> Optional[InMemoryRefreshTokenRegistry]:
+    """
+    Registry for REFRESH_TOKEN_ROTATION, if enabled.
+
+    None when rotation is off or REFRESH_TOKEN_REGISTRY_MAX_SIZE is 0:
+    refresh tokens still rotate, but replays are not detected.
+    """
+    if not settings.refresh_token_rotation:
+        return None
+    if settings.refresh_token_registry_max_size <= 0:
+        return None
+
+    return InMemoryRefreshTokenRegistry(
+        max_size=settings.refresh_token_registry_max_size
+    )
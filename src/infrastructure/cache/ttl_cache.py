@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    In-process cache with per-entry expiration and LRU eviction.
+
+    Lives for the lifetime of a warm Lambda container, so it is sized
+    explicitly and never grows beyond ``max_size`` entries.
+    Not thread-safe: Lambda invocations within a container are sequential.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Default (and, for callers that clamp, maximum) entry lifetime."""
+        return self._ttl_seconds
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return cached value, or None when missing or expired.
+
+        A hit marks the entry as most recently used.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """Store value, evicting the least recently used entry when full."""
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a single entry. Returns True if it was present."""
+        return self._entries.pop(key, None) is not None
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove every entry whose value matches predicate."""
+        keys = [key for key, (_, value) in self._entries.items() if predicate(value)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,6 +1,34 @@
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from functools import lru_cache
+from typing import Optional, Tuple
+
+ASYMMETRIC_JWT_ALGORITHMS = ("ES256", "EdDSA")
+
+
+@dataclass
+class LoggingSettings:
+    """
+    Logging settings (LOG_*).
+
+    Readable on their own, so handlers that need no database or signing
+    key (e.g. the protected endpoint) can configure logging without them.
+    """
+
+    log_level: str = "INFO"
+    log_json: bool = False
+    log_enqueue: bool = False
+    log_success_sample_rate: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "LoggingSettings":
+        """Create logging settings from environment variables."""
+        return cls(
+            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+            log_json=os.getenv("LOG_JSON", "false").lower() == "true",
+            log_enqueue=os.getenv("LOG_ENQUEUE", "false").lower() == "true",
+            log_success_sample_rate=float(os.getenv("LOG_SUCCESS_SAMPLE_RATE", "1.0")),
+        )
 
 
 @dataclass
@@ -16,9 +44,61 @@ class Settings:
     jwt_secret: str
 
     database_echo: bool = False
+    database_pool_mode: str = "null"
+    database_pool_max_age_seconds: int = 900
+    database_ping_after_idle_seconds: float = 30.0
+    database_async_url: Optional[str] = None
+    database_async_pool_size: int = 20
+    database_async_max_overflow: int = 10
+    customer_repository_mode: str = "readonly"
+    customer_cpf_key: str = "string"
     jwt_algorithm: str = "HS256"
     jwt_issuer: str = "serverless-auth"
     jwt_expiration_minutes: int = 60
+    jwt_private_key: Optional[str] = None
+    jwt_key_id: Optional[str] = None
+    jwt_keyring_file: Optional[str] = None
+    jwt_keyring_parameter: Optional[str] = None
+    jwt_keyring_refresh_seconds: float = 300.0
+    jwt_keyring_grace_seconds: float = 7 * 24 * 60 * 60
+    jwt_refresh_expiration_minutes: int = 7 * 24 * 60
+    jwt_refresh_max_lifetime_minutes: int = 30 * 24 * 60
+    refresh_token_rotation: bool = True
+    refresh_token_registry_max_size: int = 10000
+
+    auth_batch_max_size: int = 50
+    json_encoder: str = "stdlib"
+
+    customer_cache_max_size: int = 1024
+    customer_cache_ttl_seconds: float = 60.0
+
+    negative_cache_max_size: int = 4096
+    negative_cache_ttl_seconds: float = 30.0
+    bloom_filter_enabled: bool = False
+    bloom_filter_capacity: int = 1_000_000
+    bloom_filter_false_positive_rate: float = 0.01
+    bloom_filter_max_bytes: int = 4 * 1024 * 1024
+    bloom_filter_refresh_seconds: float = 300.0
+
+    token_cache_max_size: int = 1024
+    token_cache_ttl_seconds: float = 300.0
+    token_failure_cache_seconds: float = 5.0
+    authorizer_allowed_roles: Tuple[str, ...] = ("client",)
+    authorizer_revoked_token_ids: Tuple[str, ...] = ()
+    authorizer_simple_responses: bool = True
+
+    log_level: str = "INFO"
+    log_json: bool = False
+    log_enqueue: bool = False
+    log_success_sample_rate: float = 1.0
+
+    instrumentation_enabled: bool = False
+    instrumentation_server_timing: bool = False
+    instrumentation_metrics: bool = True
+    metrics_namespace: str = "ServerlessAuth"
+    query_budget_mode: str = "warn"
+    query_budget_max_statements: int = 4
+    query_budget_max_rows: int = 100
 
     environment: str = "production"
 
@@ -26,36 +106,168 @@ class Settings:
     def from_env(cls) -> "Settings":
         """Create settings from environment variables."""
 
+        database_url = os.getenv("DATABASE_URL")
+
         db_host = os.getenv("DB_HOST")
         db_port = os.getenv("DB_PORT", "3306")
         db_name = os.getenv("DB_NAME")
         db_user = os.getenv("DB_USER")
         db_password = os.getenv("DB_PASSWORD")
 
-        if not all([db_host, db_name, db_user, db_password]):
-            raise ValueError(
-                "Missing required database environment variables: "
-                "DB_HOST, DB_NAME, DB_USER, DB_PASSWORD"
+        if not database_url:
+            if not all([db_host, db_name, db_user, db_password]):
+                raise ValueError(
+                    "Missing required database environment variables: "
+                    "DB_HOST, DB_NAME, DB_USER, DB_PASSWORD"
+                )
+
+            database_url = (
+                f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
             )
 
-        database_url = (
-            f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+        jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        jwt_secret = os.getenv("JWT_SECRET", "")
+        jwt_private_key = cls._read_private_key()
+        jwt_keyring_file = os.getenv("JWT_KEYRING_FILE") or None
+        jwt_keyring_parameter = os.getenv("JWT_KEYRING_PARAMETER") or None
+        jwt_refresh_expiration_minutes = int(
+            os.getenv("JWT_REFRESH_EXPIRATION_MINUTES", str(7 * 24 * 60))
         )
 
-        jwt_secret = os.getenv("JWT_SECRET")
-        if not jwt_secret:
+        # With a keyring, keys and their algorithms come from the keyring
+        has_keyring = bool(jwt_keyring_file or jwt_keyring_parameter)
+
+        if jwt_algorithm in ASYMMETRIC_JWT_ALGORITHMS:
+            if not jwt_private_key and not has_keyring:
+                raise ValueError(
+                    "Missing required environment variable: JWT_PRIVATE_KEY "
+                    "(or JWT_PRIVATE_KEY_FILE)"
+                )
+        elif not jwt_secret and not has_keyring:
             raise ValueError("Missing required environment variable: JWT_SECRET")
 
         return cls(
             database_url=database_url,
             database_echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
+            database_pool_mode=os.getenv("DATABASE_POOL_MODE", "null").lower(),
+            database_pool_max_age_seconds=int(
+                os.getenv("DATABASE_POOL_MAX_AGE_SECONDS", "900")
+            ),
+            database_ping_after_idle_seconds=float(
+                os.getenv("DATABASE_PING_AFTER_IDLE_SECONDS", "30")
+            ),
+            database_async_url=os.getenv("DATABASE_ASYNC_URL") or None,
+            database_async_pool_size=int(os.getenv("DATABASE_ASYNC_POOL_SIZE", "20")),
+            database_async_max_overflow=int(
+                os.getenv("DATABASE_ASYNC_MAX_OVERFLOW", "10")
+            ),
+            customer_repository_mode=os.getenv(
+                "CUSTOMER_REPOSITORY_MODE", "readonly"
+            ).lower(),
+            customer_cpf_key=os.getenv("CUSTOMER_CPF_KEY", "string").lower(),
             jwt_secret=jwt_secret,
-            jwt_algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
+            jwt_algorithm=jwt_algorithm,
+            jwt_private_key=jwt_private_key,
+            jwt_key_id=os.getenv("JWT_KEY_ID") or None,
+            jwt_keyring_file=jwt_keyring_file,
+            jwt_keyring_parameter=jwt_keyring_parameter,
+            jwt_keyring_refresh_seconds=float(
+                os.getenv("JWT_KEYRING_REFRESH_SECONDS", "300")
+            ),
+            # Default: old keys outlive the longest-lived (refresh) token
+            jwt_keyring_grace_seconds=float(
+                os.getenv(
+                    "JWT_KEYRING_GRACE_SECONDS",
+                    str(jwt_refresh_expiration_minutes * 60),
+                )
+            ),
             jwt_issuer=os.getenv("JWT_ISSUER", "serverless-auth"),
             jwt_expiration_minutes=int(os.getenv("JWT_EXPIRATION_MINUTES", "60")),
+            jwt_refresh_expiration_minutes=jwt_refresh_expiration_minutes,
+            jwt_refresh_max_lifetime_minutes=int(
+                os.getenv("JWT_REFRESH_MAX_LIFETIME_MINUTES", str(30 * 24 * 60))
+            ),
+            refresh_token_rotation=os.getenv("REFRESH_TOKEN_ROTATION", "true").lower()
+            == "true",
+            refresh_token_registry_max_size=int(
+                os.getenv("REFRESH_TOKEN_REGISTRY_MAX_SIZE", "10000")
+            ),
+            auth_batch_max_size=int(os.getenv("AUTH_BATCH_MAX_SIZE", "50")),
+            json_encoder=os.getenv("JSON_ENCODER", "stdlib").lower(),
+            customer_cache_max_size=int(os.getenv("CUSTOMER_CACHE_MAX_SIZE", "1024")),
+            customer_cache_ttl_seconds=float(
+                os.getenv("CUSTOMER_CACHE_TTL_SECONDS", "60")
+            ),
+            negative_cache_max_size=int(os.getenv("NEGATIVE_CACHE_MAX_SIZE", "4096")),
+            negative_cache_ttl_seconds=float(
+                os.getenv("NEGATIVE_CACHE_TTL_SECONDS", "30")
+            ),
+            bloom_filter_enabled=os.getenv("BLOOM_FILTER_ENABLED", "false").lower()
+            == "true",
+            bloom_filter_capacity=int(os.getenv("BLOOM_FILTER_CAPACITY", "1000000")),
+            bloom_filter_false_positive_rate=float(
+                os.getenv("BLOOM_FILTER_FALSE_POSITIVE_RATE", "0.01")
+            ),
+            bloom_filter_max_bytes=int(
+                os.getenv("BLOOM_FILTER_MAX_BYTES", str(4 * 1024 * 1024))
+            ),
+            bloom_filter_refresh_seconds=float(
+                os.getenv("BLOOM_FILTER_REFRESH_SECONDS", "300")
+            ),
+            token_cache_max_size=int(os.getenv("TOKEN_CACHE_MAX_SIZE", "1024")),
+            token_cache_ttl_seconds=float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300")),
+            token_failure_cache_seconds=float(
+                os.getenv("TOKEN_FAILURE_CACHE_SECONDS", "5")
+            ),
+            authorizer_allowed_roles=cls._csv(
+                os.getenv("AUTHORIZER_ALLOWED_ROLES", "client")
+            ),
+            authorizer_revoked_token_ids=cls._csv(
+                os.getenv("AUTHORIZER_REVOKED_TOKEN_IDS", "")
+            ),
+            authorizer_simple_responses=os.getenv(
+                "AUTHORIZER_SIMPLE_RESPONSES", "true"
+            ).lower()
+            == "true",
+            **asdict(LoggingSettings.from_env()),
+            instrumentation_enabled=os.getenv(
+                "INSTRUMENTATION_ENABLED", "false"
+            ).lower()
+            == "true",
+            instrumentation_server_timing=os.getenv(
+                "INSTRUMENTATION_SERVER_TIMING", "false"
+            ).lower()
+            == "true",
+            instrumentation_metrics=os.getenv("INSTRUMENTATION_METRICS", "true").lower()
+            == "true",
+            metrics_namespace=os.getenv("METRICS_NAMESPACE", "ServerlessAuth"),
+            query_budget_mode=os.getenv("QUERY_BUDGET_MODE", "warn").lower(),
+            query_budget_max_statements=int(
+                os.getenv("QUERY_BUDGET_MAX_STATEMENTS", "4")
+            ),
+            query_budget_max_rows=int(os.getenv("QUERY_BUDGET_MAX_ROWS", "100")),
             environment=os.getenv("ENVIRONMENT", "production"),
         )
 
+    @staticmethod
+    def _csv(value: str) -> Tuple[str, ...]:
+        """Split a comma-separated env value, dropping blanks."""
+        return tuple(item.strip() for item in value.split(",") if item.strip())
+
+    @staticmethod
+    def _read_private_key() -> Optional[str]:
+        """Read the PEM signing key from JWT_PRIVATE_KEY or JWT_PRIVATE_KEY_FILE."""
+        key_file = os.getenv("JWT_PRIVATE_KEY_FILE")
+        if key_file:
+            with open(key_file) as f:
+                return f.read()
+
+        private_key = os.getenv("JWT_PRIVATE_KEY")
+        if private_key:
+            # Single-line env values carry escaped newlines
+            return private_key.replace("\\n", "\n")
+        return None
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -1,11 +1,23 @@
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import Connection, Engine
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+    from sqlalchemy.orm import Session
+
+from src.application.instrumentation import DB_CONNECT, stage
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.database.pooling import (
+    POOL_MODE_LAMBDA,
+    async_database_url,
+    async_engine_options,
+    engine_pool_options,
+    install_liveness_check,
+)
+from src.infrastructure.database.query_stats import install_query_stats
 
 
 class DatabaseConnection:
@@ -13,29 +25,148 @@ class DatabaseConnection:
     Database connection manager using SQLAlchemy.
 
     Implements the Singleton pattern for connection pooling.
-    Uses NullPool for AWS Lambda (connections don't persist).
+    Pooling is selected by DATABASE_POOL_MODE: NullPool (no connection
+    survives an invocation) or a single persistent connection with an
+    idle liveness check and max age (see pooling.py). Every engine counts
+    the statements, rows and DB time of tracked requests (query_stats.py).
+
+    Only the ORM session path imports ``sqlalchemy.orm``; the read-only
+    Core path never loads it. The async engine (long-lived server mode)
+    is separate and only imports ``sqlalchemy.ext.asyncio`` when used.
     """
 
     _engine = None
     _session_factory = None
+    _readonly_engine = None
+    _async_engine = None
+
+    @classmethod
+    def _create_engine(cls, **options) -> Engine:
+        """Create an engine using the configured pool mode."""
+        settings = get_settings()
+
+        engine = create_engine(
+            settings.database_url,
+            echo=settings.database_echo,
+            **engine_pool_options(settings),
+            **options,
+        )
+
+        if settings.database_pool_mode == POOL_MODE_LAMBDA:
+            install_liveness_check(engine, settings.database_ping_after_idle_seconds)
+        install_query_stats(engine)
+
+        return engine
 
     @classmethod
     def initialize(cls):
         """Initialize database engine and session factory."""
-        if cls._engine is None:
-            settings = get_settings()
+        from sqlalchemy.orm import sessionmaker
 
-            cls._engine = create_engine(
-                settings.database_url, poolclass=NullPool, echo=settings.database_echo
-            )
+        if cls._engine is None:
+            cls._engine = cls._create_engine()
 
             cls._session_factory = sessionmaker(
                 bind=cls._engine, autocommit=False, autoflush=False
             )
 
+    @classmethod
+    def initialize_readonly(cls):
+        """
+        Initialize the read-only engine.
+
+        Connections run in driver autocommit mode, so reads never open a
+        transaction and nothing is committed or rolled back on return.
+        """
+        if cls._readonly_engine is None:
+            cls._readonly_engine = cls._create_engine(
+                isolation_level="AUTOCOMMIT", pool_reset_on_return=None
+            )
+
+    @classmethod
+    def initialize_async(cls):
+        """
+        Initialize the async read-only engine.
+
+        Uses DATABASE_ASYNC_URL, or DATABASE_URL with its asyncio driver,
+        with a pool sized for a long-lived server (see pooling.py).
+        Connections run in autocommit mode, like the read-only engine.
+        """
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        if cls._async_engine is None:
+            settings = get_settings()
+            url = settings.database_async_url or async_database_url(
+                settings.database_url
+            )
+            cls._async_engine = create_async_engine(
+                url,
+                echo=settings.database_echo,
+                isolation_level="AUTOCOMMIT",
+                **async_engine_options(settings, url),
+            )
+            install_query_stats(cls._async_engine.sync_engine)
+
+    @classmethod
+    async def dispose_async(cls):
+        """Dispose the async engine so the next use re-initializes it."""
+        if cls._async_engine is not None:
+            await cls._async_engine.dispose()
+        cls._async_engine = None
+
+    @classmethod
+    def dispose(cls):
+        """
+        Dispose the engines so the next use re-initializes them.
+
+        The async engine's pool is only dropped here (its connections belong
+        to an event loop); close it with ``dispose_async`` from that loop.
+        """
+        for engine in (cls._engine, cls._readonly_engine):
+            if engine is not None:
+                engine.dispose()
+        if cls._async_engine is not None:
+            cls._async_engine.sync_engine.dispose(close=False)
+        cls._async_engine = None
+        cls._engine = None
+        cls._session_factory = None
+        cls._readonly_engine = None
+
+    @classmethod
+    @contextmanager
+    def get_readonly_connection(cls) -> Generator[Connection, None, None]:
+        """
+        Get a read-only Core connection (context manager).
+
+        Bypasses the ORM unit of work: no identity map, no flush and no
+        commit round trip. Use only for SELECTs. Engine creation and the
+        pool checkout are timed as the ``db_connect`` stage.
+        """
+        with stage(DB_CONNECT):
+            if cls._readonly_engine is None:
+                cls.initialize_readonly()
+            connection = cls._readonly_engine.connect()
+
+        with connection:
+            yield connection
+
+    @classmethod
+    @asynccontextmanager
+    async def get_async_connection(cls) -> AsyncGenerator["AsyncConnection", None]:
+        """Get an async read-only Core connection (async context manager)."""
+        with stage(DB_CONNECT):
+            if cls._async_engine is None:
+                cls.initialize_async()
+            connection = await cls._async_engine.connect()
+
+        try:
+            yield connection
+        finally:
+            await connection.close()
+
     @classmethod
     @contextmanager
-    def get_session(cls) -> Generator[Session, None, None]:
+    def get_session(cls) -> Generator["Session", None, None]:
         """
         Get database session (context manager).
 
@@ -1,8 +1,8 @@
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
+from src.infrastructure.database.tables import customers_table, metadata
+
+Base = declarative_base(metadata=metadata)
 
 
 class CustomerModel(Base):
@@ -10,20 +10,11 @@ class CustomerModel(Base):
     Customer database model.
 
     Maps to the 'clientes' table in MySQL.
-    Follows production database schema.
+    Follows production database schema (columns are defined in tables.py).
     """
 
+    __table__ = customers_table
     __tablename__ = "clientes"
 
-    id = Column(String(36), primary_key=True)
-    cpf = Column(String(14), unique=True, nullable=True, index=True)
-    nome = Column(String(100), nullable=False)
-    telefone = Column(String(20), nullable=True)
-    email = Column(String(100), nullable=True)
-    criado_em = Column(DateTime, nullable=False, default=datetime.utcnow)
-    atualizado_em = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
-
     def __repr__(self):
         return f"<Customer(id={self.id}, cpf={self.cpf}, nome={self.nome})>"
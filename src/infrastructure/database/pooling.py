@@ -0,0 +1,108 @@
+import time
+from typing import Any, Callable, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.infrastructure.config.settings import Settings
+
+POOL_MODE_NULL = "null"
+POOL_MODE_LAMBDA = "lambda"
+
+# Sync dialect -> asyncio driver used by the async serving mode
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def engine_pool_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Build create_engine pool arguments for the configured pool mode.
+
+    - ``null``: NullPool, a new connection per session (previous behavior)
+    - ``lambda``: one persistent connection reused across warm invocations,
+      recycled after ``database_pool_max_age_seconds``. Overflow connections
+      (e.g. a background Bloom filter rebuild) are closed on return.
+    """
+    if settings.database_pool_mode == POOL_MODE_NULL:
+        return {"poolclass": NullPool}
+
+    if settings.database_pool_mode == POOL_MODE_LAMBDA:
+        return {
+            "poolclass": QueuePool,
+            "pool_size": 1,
+            "max_overflow": 2,
+            "pool_recycle": settings.database_pool_max_age_seconds,
+        }
+
+    raise ValueError(f"Unknown database pool mode: {settings.database_pool_mode}")
+
+
+def async_database_url(database_url: str) -> str:
+    """Swap a sync driver URL for its asyncio driver (see ASYNC_DRIVERS)."""
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None or url.drivername in ASYNC_DRIVERS.values():
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def async_engine_options(settings: Settings, database_url: str) -> Dict[str, Any]:
+    """
+    Build create_async_engine pool arguments for a long-lived server.
+
+    Unlike the Lambda modes, many requests share the process, so a real
+    pool is kept: ``database_async_pool_size`` connections plus overflow,
+    recycled after ``database_pool_max_age_seconds`` and pinged on
+    checkout. SQLite keeps SQLAlchemy's default pool for its driver.
+    """
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+
+    return {
+        "pool_size": settings.database_async_pool_size,
+        "max_overflow": settings.database_async_max_overflow,
+        "pool_recycle": settings.database_pool_max_age_seconds,
+        "pool_pre_ping": True,
+    }
+
+
+def install_liveness_check(
+    engine: Engine,
+    idle_seconds: float,
+    clock: Callable[[], float] = time.monotonic,
+):
+    """
+    Ping pooled connections that sat idle, e.g. while the container was frozen.
+
+    Connections checked in less than ``idle_seconds`` ago are trusted as-is,
+    so back-to-back invocations pay no extra round trip. A failed ping raises
+    DisconnectionError, which makes the pool discard the connection and
+    transparently open a new one.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = clock()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or clock() - checked_in_at < idle_seconds:
+            return
+
+        try:
+            ping = getattr(dbapi_connection, "ping", None)
+            if ping is not None:
+                ping(False)
+            else:
+                cursor = dbapi_connection.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                finally:
+                    cursor.close()
+        except Exception as e:
+            raise exc.DisconnectionError() from e
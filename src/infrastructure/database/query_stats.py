@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from src.infrastructure.config.settings import Settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+BUDGET_OFF = "off"
+BUDGET_WARN = "warn"
+BUDGET_RAISE = "raise"
+BUDGET_MODES = (BUDGET_OFF, BUDGET_WARN, BUDGET_RAISE)
+
+_STARTED = "query_stats_started"
+
+
+class QueryStats:
+    """
+    SQL statements executed, rows fetched and DB time for one request.
+
+    Statements and DB time come from the engine hooks; rows are reported
+    by the repositories through ``count_rows``.
+    """
+
+    __slots__ = ("statements", "rows", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the SQL run inside the block on engines with install_query_stats.
+
+    Scoped by a context variable, like stage timings: statements issued by
+    other requests, asyncio tasks or background threads are not counted.
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def count_rows(rows: int):
+    """
+    Add rows fetched by a repository lookup to the tracked request.
+
+    Called where the rows are materialized; a no-op outside
+    ``track_queries``.
+    """
+    stats = _current.get()
+    if stats is not None:
+        stats.rows += rows
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        # A failed statement leaves this behind; the next one overwrites it
+        conn.info[_STARTED] = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.pop(_STARTED, None)
+    if stats is None or started is None:
+        return
+    stats.statements += 1
+    stats.seconds += perf_counter() - started
+
+
+def install_query_stats(engine: "Engine"):
+    """
+    Register the statement and DB time hooks on engine.
+
+    Outside ``track_queries`` each hook returns after one context
+    variable lookup. For an AsyncEngine, pass its ``sync_engine``.
+    """
+    # Imported here so Instrumentation can track queries without SQLAlchemy
+    from sqlalchemy import event
+
+    if event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more statements or fetched more rows than budgeted."""
+
+
+class QueryBudget:
+    """
+    Per-request ceiling on SQL statements and rows fetched.
+
+    ``check`` runs after the request and logs its totals. In ``warn`` mode
+    (production) an overrun is logged as a warning; in ``raise`` mode
+    (tests) it raises QueryBudgetExceeded, so a lookup that starts scanning
+    the table fails the suite instead of slowing production down.
+    """
+
+    def __init__(self, max_statements: int, max_rows: int, mode: str = BUDGET_WARN):
+        if mode not in (BUDGET_WARN, BUDGET_RAISE):
+            raise ValueError(f"Unknown query budget mode: {mode}")
+
+        self._max_statements = max_statements
+        self._max_rows = max_rows
+        self._mode = mode
+
+    def check(self, stats: QueryStats, label: str):
+        """Log the request's totals; warn or raise when they exceed the budget."""
+        from loguru import logger
+
+        totals = {
+            "statements": stats.statements,
+            "rows": stats.rows,
+            "db_ms": round(stats.seconds * 1000, 3),
+        }
+        overruns = []
+        if stats.statements > self._max_statements:
+            overruns.append(f"{stats.statements} statements > {self._max_statements}")
+        if stats.rows > self._max_rows:
+            overruns.append(f"{stats.rows} rows > {self._max_rows}")
+        if not overruns:
+            logger.info(f"Query totals for {label}", **totals)
+            return
+
+        message = f"Query budget exceeded for {label}: {', '.join(overruns)}"
+        if self._mode == BUDGET_RAISE:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message, **totals)
+
+
+def build_query_budget(settings: Settings) -> Optional[QueryBudget]:
+    """Budget configured by the QUERY_BUDGET_* settings (None when off)."""
+    if settings.query_budget_mode == BUDGET_OFF:
+        return None
+
+    return QueryBudget(
+        max_statements=settings.query_budget_max_statements,
+        max_rows=settings.query_budget_max_rows,
+        mode=settings.query_budget_mode,
+    )
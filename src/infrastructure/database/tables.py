@@ -0,0 +1,27 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, DateTime, MetaData, String, Table
+
+metadata = MetaData()
+
+# SQLAlchemy Core definition of the 'clientes' table. The read-only lookup
+# path selects from it directly, so it never imports or configures the ORM;
+# CustomerModel (models.py) maps onto this same Table.
+customers_table = Table(
+    "clientes",
+    metadata,
+    Column("id", String(36), primary_key=True),
+    Column("cpf", String(14), unique=True, nullable=True, index=True),
+    # Canonical integer CPF key (11 digits, 8 bytes); backfilled by migrate.py
+    Column("cpf_numero", BigInteger, unique=True, nullable=True, index=True),
+    Column("nome", String(100), nullable=False),
+    Column("telefone", String(20), nullable=True),
+    Column("email", String(100), nullable=True),
+    Column("criado_em", DateTime, nullable=False, default=datetime.utcnow),
+    Column(
+        "atualizado_em",
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    ),
+)
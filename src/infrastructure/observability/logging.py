@@ -0,0 +1,54 @@
+import random
+import sys
+from typing import Callable, Union
+
+from loguru import logger
+
+from src.infrastructure.config.settings import LoggingSettings, Settings
+
+# Lazy logger: keyword values are zero-argument callables, evaluated only
+# when some sink accepts the level (loguru checks the level first).
+lazy_logger = logger.opt(lazy=True)
+
+_sample_rate = 1.0
+_random: Callable[[], float] = random.random
+_enqueued = False
+
+
+def configure_logging(settings: Union[Settings, LoggingSettings]):
+    """
+    Install the single stdout sink configured by settings.
+
+    Replaces loguru's default handler. ``log_enqueue`` moves formatting
+    and the stdout write to loguru's background worker; ``flush_logs``
+    then has to run before each invocation returns, since a frozen Lambda
+    sandbox would otherwise hold undelivered lines.
+    """
+    global _sample_rate, _enqueued
+
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        level=settings.log_level,
+        serialize=settings.log_json,
+        enqueue=settings.log_enqueue,
+        backtrace=False,
+        diagnose=False,
+    )
+    _sample_rate = settings.log_success_sample_rate
+    _enqueued = settings.log_enqueue
+
+
+def sampled() -> bool:
+    """
+    Whether to emit this occurrence of a high-volume event.
+
+    Checked before the logging call, so dropped events cost no record.
+    """
+    return _sample_rate >= 1.0 or _random() < _sample_rate
+
+
+def flush_logs():
+    """Wait for enqueued log messages to be written (no-op otherwise)."""
+    if _enqueued:
+        logger.complete()
@@ -0,0 +1,153 @@
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, TextIO
+
+from src.application.instrumentation import Timings, timed
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.database.query_stats import (
+    QueryBudget,
+    QueryStats,
+    build_query_budget,
+    track_queries,
+)
+
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def server_timing(timings: Timings, queries: Optional[QueryStats] = None) -> str:
+    """Server-Timing header value, e.g. ``db_query;dur=0.812, total;dur=2.4``."""
+    metrics = [f"{name};dur={ms}" for name, ms in timings.milliseconds().items()]
+    if queries is not None:
+        metrics.append(
+            f"db;dur={round(queries.seconds * 1000, 3)}"
+            f';desc="statements={queries.statements} rows={queries.rows}"'
+        )
+    if timings.cold_start:
+        metrics.append('cold_start;desc="cold start"')
+    return ", ".join(metrics)
+
+
+def emf_record(
+    timings: Timings,
+    namespace: str,
+    dimensions: Dict[str, str],
+    properties: Optional[Dict[str, Any]] = None,
+    queries: Optional[QueryStats] = None,
+) -> Dict[str, Any]:
+    """
+    CloudWatch embedded metric format record for one request.
+
+    Each stage becomes a millisecond metric and ``cold_start`` a 0/1
+    count; ``queries`` adds ``db_time``, ``db_statements`` and ``db_rows``.
+    ``properties`` are searchable in Logs Insights but not metrics.
+    """
+    values: Dict[str, Any] = timings.milliseconds()
+    metrics = [{"Name": name, "Unit": "Milliseconds"} for name in values]
+    counts = {"cold_start": int(timings.cold_start)}
+    if queries is not None:
+        values["db_time"] = round(queries.seconds * 1000, 3)
+        metrics.append({"Name": "db_time", "Unit": "Milliseconds"})
+        counts["db_statements"] = queries.statements
+        counts["db_rows"] = queries.rows
+    values.update(counts)
+    metrics.extend({"Name": name, "Unit": "Count"} for name in counts)
+
+    return {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [list(dimensions)],
+                    "Metrics": metrics,
+                }
+            ],
+        },
+        **dimensions,
+        **(properties or {}),
+        **values,
+    }
+
+
+class Instrumentation:
+    """
+    Per-stage latency instrumentation for one entry point.
+
+    ``run`` times a handler call with ``timed``, then optionally adds a
+    ``Server-Timing`` header to the response and writes an EMF line to
+    ``stream`` (CloudWatch Logs extracts the metrics). The first ``run``
+    in the container is flagged as the cold start. The SQL statements,
+    rows and DB time of the call are reported alongside the stages.
+
+    With a ``query_budget``, the call's queries are checked against it
+    even when instrumentation is disabled. With neither, ``run`` only
+    calls the handler and every ``stage`` is a no-op.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        server_timing: bool = False,
+        emit_metrics: bool = True,
+        namespace: str = "ServerlessAuth",
+        stream: Optional[TextIO] = None,
+        query_budget: Optional[QueryBudget] = None,
+    ):
+        self._enabled = enabled
+        self._server_timing = server_timing
+        self._emit_metrics = emit_metrics
+        self._namespace = namespace
+        self._stream = stream
+        self._query_budget = query_budget
+        self._cold_start = True
+
+    def run(
+        self,
+        handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+        event: Dict[str, Any],
+        request_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Call handler(event), recording its stages when enabled."""
+        cold_start, self._cold_start = self._cold_start, False
+        if not self._enabled and self._query_budget is None:
+            return handler(event)
+
+        route = event.get("rawPath") or event.get("path") or "/"
+        if not self._enabled:
+            with track_queries() as queries:
+                response = handler(event)
+            self._query_budget.check(queries, route)
+            return response
+
+        with track_queries() as queries, timed(cold_start) as timings:
+            response = handler(event)
+
+        if self._server_timing:
+            headers = response.setdefault("headers", {})
+            headers["Server-Timing"] = server_timing(timings, queries)
+            headers["Timing-Allow-Origin"] = "*"
+        if self._emit_metrics:
+            record = emf_record(
+                timings,
+                self._namespace,
+                {"Route": route},
+                {"request_id": request_id, "status_code": response.get("statusCode")},
+                queries,
+            )
+            stream = self._stream or sys.stdout
+            stream.write(_COMPACT_JSON.encode(record) + "\n")
+        if self._query_budget is not None:
+            self._query_budget.check(queries, route)
+        return response
+
+
+def build_instrumentation(settings: Settings) -> Instrumentation:
+    """Instrumentation configured by the INSTRUMENTATION_* and QUERY_BUDGET_*."""
+    return Instrumentation(
+        enabled=settings.instrumentation_enabled,
+        server_timing=settings.instrumentation_server_timing,
+        emit_metrics=settings.instrumentation_metrics,
+        namespace=settings.metrics_namespace,
+        query_budget=build_query_budget(settings),
+    )
@@ -0,0 +1,48 @@
+import hashlib
+import json
+from typing import Any, Dict
+
+from cryptography.hazmat.primitives import serialization
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
+
+from src.infrastructure.security.jws_signer import base64url_encode
+
+# Required members per key type for RFC 7638 thumbprints
+_THUMBPRINT_MEMBERS = {
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+
+def load_private_key(pem: str) -> Any:
+    """Parse an unencrypted PEM private key (done once per container)."""
+    return serialization.load_pem_private_key(pem.encode(), password=None)
+
+
+def public_jwk(public_key: Any, algorithm: str) -> Dict[str, Any]:
+    """
+    Build the public JWK for a signing key.
+
+    Args:
+        public_key: EC P-256 or Ed25519 public key
+        algorithm: JWS algorithm (ES256 or EdDSA)
+
+    Returns:
+        JWK dict with ``use`` and ``alg`` members (no ``kid``)
+    """
+    if algorithm == "ES256":
+        jwk = ECAlgorithm.to_jwk(public_key, as_dict=True)
+    elif algorithm == "EdDSA":
+        jwk = OKPAlgorithm.to_jwk(public_key, as_dict=True)
+    else:
+        raise ValueError(f"No public JWK for algorithm: {algorithm}")
+
+    jwk.update({"use": "sig", "alg": algorithm})
+    return jwk
+
+
+def jwk_thumbprint(jwk: Dict[str, Any]) -> str:
+    """RFC 7638 JWK thumbprint (SHA-256), used as the default ``kid``."""
+    members = {name: jwk[name] for name in _THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    return base64url_encode(hashlib.sha256(canonical.encode()).digest()).decode()
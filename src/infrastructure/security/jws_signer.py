@@ -0,0 +1,124 @@
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any, Dict, Optional
+
+from jwt.algorithms import HMACAlgorithm, get_default_algorithms
+
+from src.infrastructure.config.settings import ASYMMETRIC_JWT_ALGORITHMS
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Same compact separators PyJWT uses for the header and payload
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+_SORTED_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+
+
+def base64url_encode(data: bytes) -> bytes:
+    """Base64url without padding (RFC 7515)."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _header_segment(algorithm: str, headers: Optional[Dict[str, Any]]) -> bytes:
+    """Serialize the JOSE header exactly like PyJWT, plus the trailing dot."""
+    header = {"typ": "JWT", "alg": algorithm, **(headers or {})}
+    return base64url_encode(_SORTED_COMPACT_JSON.encode(header).encode()) + b"."
+
+
+class HMACSigner:
+    """
+    Compact JWS signer specialized for one HMAC algorithm and key.
+
+    Produces the same bytes as ``jwt.encode`` for payloads with integer
+    timestamps, but does the constant work once:
+    - the header segment is serialized and base64url-encoded up front
+    - the key is validated/prepared once and the keyed HMAC state
+      (inner/outer pads) is precomputed and copied per token
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str = "HS256",
+        headers: Optional[Dict[str, Any]] = None,
+    ):
+        if algorithm not in _HMAC_DIGESTS:
+            raise ValueError(f"Unsupported HMAC algorithm: {algorithm}")
+
+        digest = _HMAC_DIGESTS[algorithm]
+        key = HMACAlgorithm(digest).prepare_key(secret)
+
+        self._header_segment = _header_segment(algorithm, headers)
+        self._mac = hmac.new(key, digestmod=digest)
+
+    @staticmethod
+    def supports(algorithm: str) -> bool:
+        """Whether algorithm can be signed by HMACSigner."""
+        return algorithm in _HMAC_DIGESTS
+
+    def sign(self, payload: Dict[str, Any]) -> str:
+        """
+        Sign payload and return the compact JWT.
+
+        Args:
+            payload: Claims; time claims must already be integers
+
+        Returns:
+            Encoded JWT string
+        """
+        signing_input = self._header_segment + base64url_encode(
+            _COMPACT_JSON.encode(payload).encode()
+        )
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + base64url_encode(mac.digest())).decode()
+
+
+class AsymmetricSigner:
+    """
+    Compact JWS signer for ES256 and EdDSA with a preloaded private key.
+
+    The key is parsed and prepared once per container and the header
+    segment (including ``kid``) is precomputed; signing is delegated to
+    PyJWT's algorithm implementation, so signatures use the JWS encodings
+    PyJWT verifies (raw r||s for ECDSA).
+    """
+
+    def __init__(
+        self,
+        private_key: Any,
+        algorithm: str,
+        headers: Optional[Dict[str, Any]] = None,
+    ):
+        if algorithm not in ASYMMETRIC_JWT_ALGORITHMS:
+            raise ValueError(f"Unsupported asymmetric algorithm: {algorithm}")
+
+        self._algorithm = get_default_algorithms()[algorithm]
+        self._key = self._algorithm.prepare_key(private_key)
+        self._header_segment = _header_segment(algorithm, headers)
+
+    @staticmethod
+    def supports(algorithm: str) -> bool:
+        """Whether algorithm can be signed by AsymmetricSigner."""
+        return algorithm in ASYMMETRIC_JWT_ALGORITHMS
+
+    def sign(self, payload: Dict[str, Any]) -> str:
+        """
+        Sign payload and return the compact JWT.
+
+        Args:
+            payload: Claims; time claims must already be integers
+
+        Returns:
+            Encoded JWT string
+        """
+        signing_input = self._header_segment + base64url_encode(
+            _COMPACT_JSON.encode(payload).encode()
+        )
+        signature = self._algorithm.sign(signing_input, self._key)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
@@ -1,22 +1,80 @@
-from datetime import datetime, timedelta
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import time
 import uuid
 
 import jwt
 
+from src.application.instrumentation import SIGN, VERIFY, stage
 from src.application.use_cases.ports import ITokenGenerator
+from src.infrastructure.cache.ttl_cache import TTLCache
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.security.jwks import (
+    jwk_thumbprint,
+    load_private_key,
+    public_jwk,
+)
+from src.infrastructure.security.jws_signer import AsymmetricSigner, HMACSigner
+from src.infrastructure.security.keyring import Keyring
+
+ACCESS_AUDIENCE = "api-client"
+REFRESH_AUDIENCE = "auth-refresh"
 
 
 class JWTTokenGenerator(ITokenGenerator):
     """
     JWT Token Generator implementation.
 
-    Uses PyJWT library to generate and validate JWT tokens.
+    Uses PyJWT library to validate JWT tokens. Tokens are signed by a
+    precomputed signer built once per container:
+    - HS256/384/512: HMACSigner (byte-identical to ``jwt.encode``)
+    - ES256/EdDSA: AsymmetricSigner with the private key parsed once; the
+      ``kid`` header lets verifiers pick the key from ``jwks()``
+    Other algorithms fall back to PyJWT.
+
+    With a ``keyring``, the JWT_SECRET/JWT_PRIVATE_KEY settings are ignored:
+    tokens are signed by the keyring's signing key (``kid`` header) and
+    verified by the key their ``kid`` names, so keys rotate in warm
+    containers. Tokens without ``kid`` are checked against the signing key.
+
+    With a ``token_cache``, ``validate`` remembers verified claims keyed by
+    the SHA-256 digest of the token, until the token's ``exp`` or the
+    cache TTL, whichever comes first. Rejections are remembered for at most
+    ``failure_ttl_seconds`` (0 disables it).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        token_cache: Optional[TTLCache] = None,
+        failure_ttl_seconds: float = 0.0,
+        keyring: Optional[Keyring] = None,
+    ):
         self._settings = get_settings()
+        self._token_cache = token_cache
+        self._failure_ttl_seconds = failure_ttl_seconds
+        self._keyring = keyring
+        algorithm = self._settings.jwt_algorithm
+
+        self._signer = None
+        self._verification_key: Any = self._settings.jwt_secret
+        self._public_jwks: List[Dict[str, Any]] = []
+
+        if keyring is not None:
+            # Signers and verification keys come from the keyring
+            return
+
+        if AsymmetricSigner.supports(algorithm):
+            private_key = load_private_key(self._settings.jwt_private_key)
+            jwk = public_jwk(private_key.public_key(), algorithm)
+            jwk["kid"] = self._settings.jwt_key_id or jwk_thumbprint(jwk)
+
+            self._signer = AsymmetricSigner(
+                private_key, algorithm, headers={"kid": jwk["kid"]}
+            )
+            self._verification_key = private_key.public_key()
+            self._public_jwks.append(jwk)
+        elif HMACSigner.supports(algorithm):
+            self._signer = HMACSigner(self._settings.jwt_secret, algorithm)
 
     def generate(self, customer_id: int, cpf: str, expiration_minutes: int = 60) -> str:
         """
@@ -30,26 +88,82 @@ class JWTTokenGenerator(ITokenGenerator):
         Returns:
             JWT token string
         """
-        now = datetime.utcnow()
-        expiration = now + timedelta(minutes=expiration_minutes)
+        now = int(time.time())
+        expiration = now + expiration_minutes * 60
         trace_id = str(uuid.uuid4())
 
         payload = {
             "sub": str(customer_id),
             "cpf": cpf,
             "role": "client",
-            "aud": "api-client",
+            "aud": ACCESS_AUDIENCE,
             "trace_id": trace_id,
             "iat": now,
             "exp": expiration,
             "iss": self._settings.jwt_issuer,
         }
 
-        token = jwt.encode(
-            payload, self._settings.jwt_secret, algorithm=self._settings.jwt_algorithm
-        )
+        return self._sign(payload)
+
+    def generate_refresh(
+        self,
+        customer_id: str,
+        cpf: str,
+        customer_name: str,
+        auth_time: int,
+        expires_at: int,
+    ) -> str:
+        """
+        Generate a refresh token.
+
+        Carries everything needed to mint a new access token (sub, cpf,
+        name) so refreshing needs no database lookup. ``auth_time`` is the
+        original login time and survives rotation; ``jti`` identifies this
+        token for replay detection.
+
+        Args:
+            customer_id: Customer ID
+            cpf: Customer CPF
+            customer_name: Customer name
+            auth_time: Login time (epoch seconds)
+            expires_at: Expiration time (epoch seconds)
+
+        Returns:
+            JWT refresh token string
+        """
+        payload = {
+            "sub": str(customer_id),
+            "cpf": cpf,
+            "name": customer_name,
+            "role": "client",
+            "aud": REFRESH_AUDIENCE,
+            "jti": uuid.uuid4().hex,
+            "auth_time": auth_time,
+            "iat": int(time.time()),
+            "exp": expires_at,
+            "iss": self._settings.jwt_issuer,
+        }
+
+        return self._sign(payload)
 
-        return token
+    def _sign(self, payload: Dict[str, Any]) -> str:
+        """Sign with the keyring or precomputed signer, or PyJWT as fallback."""
+        with stage(SIGN):
+            if self._keyring is not None:
+                return self._keyring.signing_key().signer.sign(payload)
+            if self._signer is not None:
+                return self._signer.sign(payload)
+
+            return jwt.encode(
+                payload,
+                self._settings.jwt_secret,
+                algorithm=self._settings.jwt_algorithm,
+            )
+
+    @property
+    def token_cache(self) -> Optional[TTLCache]:
+        """Verified-token cache (exposes hit/miss counters), if enabled."""
+        return self._token_cache
 
     def validate(self, token: str) -> Dict:
         """
@@ -59,21 +173,98 @@ class JWTTokenGenerator(ITokenGenerator):
             token: JWT token string
 
         Returns:
-            Decoded payload
+            Decoded payload (a fresh copy on every call)
 
         Raises:
-            jwt.InvalidTokenError: If token is invalid or expired
+            ValueError: If token is invalid or expired
         """
+        if self._token_cache is None:
+            return self._decode(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            payload, error = cached
+            if error is not None:
+                raise ValueError(error)
+            return dict(payload)
+
         try:
-            payload = jwt.decode(
-            token,
-            self._settings.jwt_secret,
-            algorithms=[self._settings.jwt_algorithm],
-            issuer=self._settings.jwt_issuer,
-            audience="api-client",
+            payload = self._decode(token)
+        except ValueError as e:
+            ttl = min(self._failure_ttl_seconds, self._token_cache.ttl_seconds)
+            self._token_cache.set(key, (None, str(e)), ttl_seconds=ttl)
+            raise
+
+        ttl = self._token_cache.ttl_seconds
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        self._token_cache.set(key, (payload, None), ttl_seconds=ttl)
+        return dict(payload)
+
+    def validate_refresh(self, token: str) -> Dict:
+        """
+        Validate and decode a refresh token.
+
+        Refresh tokens use their own audience, so they are never accepted
+        by ``validate`` (and access tokens never accepted here).
+
+        Raises:
+            ValueError: If token is invalid or expired
+        """
+        return self._decode(
+            token, audience=REFRESH_AUDIENCE, require=["exp", "jti", "auth_time"]
         )
-            return payload
-        except jwt.ExpiredSignatureError:
-            raise ValueError("Token expirado")
-        except jwt.InvalidTokenError as e:
-            raise ValueError(f"Token inválido: {str(e)}")
+
+    def _decode(
+        self,
+        token: str,
+        audience: str = ACCESS_AUDIENCE,
+        require: Optional[List[str]] = None,
+    ) -> Dict:
+        """Verify signature and claims with PyJWT."""
+        with stage(VERIFY):
+            try:
+                key, algorithm = self._key_for(token)
+                return jwt.decode(
+                    token,
+                    key,
+                    algorithms=[algorithm],
+                    issuer=self._settings.jwt_issuer,
+                    audience=audience,
+                    options={"require": require} if require else None,
+                )
+            except jwt.ExpiredSignatureError:
+                raise ValueError("Token expirado")
+            except jwt.InvalidTokenError as e:
+                raise ValueError(f"Token inválido: {str(e)}")
+
+    def _key_for(self, token: str) -> Tuple[Any, str]:
+        """Verification key and algorithm for token (by ``kid`` with a keyring)."""
+        if self._keyring is None:
+            return self._verification_key, self._settings.jwt_algorithm
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            key = self._keyring.signing_key()
+        else:
+            key = self._keyring.verification_key(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return key.verification_key, key.algorithm
+
+    @property
+    def key_version(self) -> int:
+        """Changes whenever the keyring reloads new keys (0 without one)."""
+        return 0 if self._keyring is None else self._keyring.version
+
+    def jwks(self) -> Dict[str, Any]:
+        """
+        JSON Web Key Set with the public verification keys.
+
+        Empty for HMAC algorithms: shared secrets are never published.
+        With a keyring, lists every asymmetric key that still verifies.
+        """
+        if self._keyring is not None:
+            return {"keys": self._keyring.jwks()}
+        return {"keys": [dict(jwk) for jwk in self._public_jwks]}
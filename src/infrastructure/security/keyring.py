@@ -0,0 +1,301 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+from cryptography.hazmat.primitives import serialization
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.security.jwks import load_private_key, public_jwk
+from src.infrastructure.security.jws_signer import AsymmetricSigner, HMACSigner
+
+KeySource = Callable[[], str]
+
+
+class KeyringKey(NamedTuple):
+    """One keyring key, prepared once per load."""
+
+    kid: str
+    algorithm: str
+    verification_key: Any
+    signer: Optional[Any]
+    jwk: Optional[Dict[str, Any]]
+    verify_until: Optional[float]
+
+    def verifies_at(self, now: float) -> bool:
+        """Whether tokens signed with this key still verify at ``now``."""
+        return self.verify_until is None or now < self.verify_until
+
+
+def parse_keyring(document: str) -> Tuple[str, Dict[str, KeyringKey]]:
+    """
+    Parse a keyring document.
+
+    Format (JSON)::
+
+        {
+          "signing_kid": "2024-06",
+          "keys": [
+            {"kid": "2024-06", "alg": "HS256", "secret": "..."},
+            {"kid": "2024-05", "alg": "HS256", "secret": "...",
+             "verify_until": 1719792000},
+            {"kid": "ec-1", "alg": "ES256", "private_key": "-----BEGIN ..."},
+            {"kid": "ec-0", "alg": "ES256", "public_key": "-----BEGIN ..."}
+          ]
+        }
+
+    ``alg`` defaults to HS256; ``verify_until`` (epoch seconds) retires a
+    key; ``public_key`` entries only verify.
+
+    Returns:
+        (signing kid, keys by kid)
+
+    Raises:
+        ValueError: If the document is malformed or the signing key cannot sign
+    """
+    data = json.loads(document)
+    keys: Dict[str, KeyringKey] = {}
+    for entry in data.get("keys", []):
+        key = _parse_key(entry)
+        if key.kid in keys:
+            raise ValueError(f"Duplicate keyring kid: {key.kid}")
+        keys[key.kid] = key
+
+    signing_kid = data.get("signing_kid")
+    signing_key = keys.get(signing_kid)
+    if signing_key is None or signing_key.signer is None:
+        raise ValueError(f"No signing key for keyring signing_kid: {signing_kid}")
+    return signing_kid, keys
+
+
+def _parse_key(entry: Dict[str, Any]) -> KeyringKey:
+    """Prepare the signer, verification key and public JWK of one entry."""
+    kid = entry.get("kid")
+    if not kid:
+        raise ValueError("Keyring key without kid")
+    algorithm = entry.get("alg", "HS256")
+    verify_until = entry.get("verify_until")
+    headers = {"kid": kid}
+
+    if HMACSigner.supports(algorithm):
+        secret = entry.get("secret")
+        if not secret:
+            raise ValueError(f"Keyring key {kid} has no secret")
+        signer = HMACSigner(secret, algorithm, headers=headers)
+        return KeyringKey(kid, algorithm, secret, signer, None, verify_until)
+
+    if AsymmetricSigner.supports(algorithm):
+        signer = None
+        if entry.get("private_key"):
+            private_key = load_private_key(entry["private_key"])
+            public_key = private_key.public_key()
+            signer = AsymmetricSigner(private_key, algorithm, headers=headers)
+        elif entry.get("public_key"):
+            public_key = serialization.load_pem_public_key(entry["public_key"].encode())
+        else:
+            raise ValueError(f"Keyring key {kid} has no private_key or public_key")
+        jwk = {**public_jwk(public_key, algorithm), "kid": kid}
+        return KeyringKey(kid, algorithm, public_key, signer, jwk, verify_until)
+
+    raise ValueError(f"Unsupported keyring algorithm: {algorithm}")
+
+
+class Keyring:
+    """
+    JWT keys reloaded from a source without restarting the container.
+
+    Holds every key that may verify tokens (selected by the token ``kid``)
+    and the one key that signs new tokens (``signing_kid``). The source is
+    read again once the keyring is older than ``refresh_seconds``, on the
+    request path; an unchanged document is not re-parsed, and a failed or
+    invalid reload keeps the current keys until the next attempt.
+
+    With ``background_refresh`` the stale read runs on a daemon thread
+    instead, and requests keep using the current keys meanwhile. The async
+    (ASGI) server uses it so a file or SSM read never blocks the event loop.
+    Lambda keeps the inline read: a frozen sandbox would stall the thread.
+
+    Rotating without rejecting live tokens:
+    1. add the new key (the JWKS publishes it to verifiers)
+    2. point ``signing_kid`` at it
+    3. drop the old key, or keep it with ``verify_until``
+
+    A key dropped from the source keeps verifying in warm containers for
+    ``grace_seconds``; containers started later only know the source, so
+    keep the old key there with ``verify_until`` until its tokens expire.
+    """
+
+    def __init__(
+        self,
+        source: KeySource,
+        refresh_seconds: float = 300.0,
+        grace_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        background_refresh: bool = False,
+    ):
+        self._source = source
+        self._refresh_seconds = refresh_seconds
+        self._grace_seconds = grace_seconds
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._background_refresh = background_refresh
+        self._reload_lock = threading.Lock()
+        self._reload_thread: Optional[threading.Thread] = None
+
+        self._document: Optional[str] = None
+        # (signing kid, keys by kid), swapped as one object so readers on
+        # other threads never see a new kid with the old keys
+        self._state: Tuple[str, Dict[str, KeyringKey]] = ("", {})
+        self._version = 0
+
+        # The first load fails loudly: there is nothing to fall back to
+        self._loaded_at = clock()
+        self._install(source())
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever a reload changes the keys."""
+        self._refresh_if_stale()
+        return self._version
+
+    def signing_key(self) -> KeyringKey:
+        """Key that signs new tokens."""
+        self._refresh_if_stale()
+        signing_kid, keys = self._state
+        return keys[signing_kid]
+
+    def verification_key(self, kid: str) -> Optional[KeyringKey]:
+        """Key for a token ``kid``; None when unknown or retired."""
+        self._refresh_if_stale()
+        key = self._state[1].get(kid)
+        if key is None or not key.verifies_at(self._wall_clock()):
+            return None
+        return key
+
+    def jwks(self) -> List[Dict[str, Any]]:
+        """Public JWKs of the asymmetric keys that still verify."""
+        self._refresh_if_stale()
+        now = self._wall_clock()
+        return [
+            dict(key.jwk)
+            for key in self._state[1].values()
+            if key.jwk is not None and key.verifies_at(now)
+        ]
+
+    def reload(self) -> bool:
+        """
+        Read the source now.
+
+        Returns:
+            Whether the keys changed
+        """
+        self._loaded_at = self._clock()
+        try:
+            return self._install(self._source())
+        except Exception as e:
+            # Imported here so the JWKS handler's cold start stays lean
+            from loguru import logger
+
+            logger.warning("JWT keyring reload failed", error=str(e))
+            return False
+
+    def _refresh_if_stale(self):
+        if self._clock() - self._loaded_at < self._refresh_seconds:
+            return
+        if not self._background_refresh:
+            self.reload()
+            return
+        # One reload at a time; until it finishes the current keys are used
+        if self._reload_lock.acquire(blocking=False):
+            self._loaded_at = self._clock()
+            self._reload_thread = threading.Thread(
+                target=self._reload_in_background, name="jwt-keyring", daemon=True
+            )
+            self._reload_thread.start()
+
+    def _reload_in_background(self):
+        try:
+            self.reload()
+        finally:
+            self._reload_lock.release()
+
+    def _install(self, document: str) -> bool:
+        if document == self._document:
+            return False
+
+        signing_kid, keys = parse_keyring(document)
+        now = self._wall_clock()
+        for kid, key in self._state[1].items():
+            if kid in keys:
+                continue
+            until = now + self._grace_seconds
+            if key.verify_until is not None:
+                until = min(until, key.verify_until)
+            if until > now:
+                keys[kid] = key._replace(verify_until=until)
+
+        self._document = document
+        self._state = (signing_kid, keys)
+        self._version += 1
+        return True
+
+
+class FileKeySource:
+    """Keyring document from a local file (mounted volume, EFS, /tmp)."""
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def __call__(self) -> str:
+        with open(self._path) as f:
+            return f.read()
+
+
+class ParameterStoreKeySource:
+    """
+    Keyring document from an SSM parameter (SecureString).
+
+    Read through the AWS Parameters and Secrets Lambda Extension's local
+    HTTP endpoint, so no AWS SDK is imported and the extension caches it.
+    """
+
+    def __init__(self, name: str, timeout_seconds: float = 2.0):
+        port = os.getenv("PARAMETERS_SECRETS_EXTENSION_HTTP_PORT", "2773")
+        self._url = (
+            f"http://localhost:{port}/systemsmanager/parameters/get"
+            f"?name={quote(name, safe='')}&withDecryption=true"
+        )
+        self._timeout_seconds = timeout_seconds
+
+    def __call__(self) -> str:
+        request = Request(
+            self._url,
+            headers={
+                "X-Aws-Parameters-Secrets-Token": os.getenv("AWS_SESSION_TOKEN", "")
+            },
+        )
+        with urlopen(request, timeout=self._timeout_seconds) as response:
+            return json.load(response)["Parameter"]["Value"]
+
+
+def build_keyring(
+    settings: Settings, background_refresh: bool = False
+) -> Optional[Keyring]:
+    """Keyring from JWT_KEYRING_FILE or JWT_KEYRING_PARAMETER, if configured."""
+    if settings.jwt_keyring_file:
+        source: KeySource = FileKeySource(settings.jwt_keyring_file)
+    elif settings.jwt_keyring_parameter:
+        source = ParameterStoreKeySource(settings.jwt_keyring_parameter)
+    else:
+        return None
+
+    return Keyring(
+        source,
+        refresh_seconds=settings.jwt_keyring_refresh_seconds,
+        grace_seconds=settings.jwt_keyring_grace_seconds,
+        background_refresh=background_refresh,
+    )
@@ -0,0 +1,55 @@
+import json
+from typing import Any, Callable
+
+JsonEncoder = Callable[[Any], str]
+
+JSON_ENCODER_AUTO = "auto"
+JSON_ENCODER_ORJSON = "orjson"
+JSON_ENCODER_STDLIB = "stdlib"
+
+
+def stdlib_encoder() -> JsonEncoder:
+    """
+    Reusable stdlib encoder.
+
+    Output is byte-identical to ``json.dumps(data, ensure_ascii=False)``
+    without rebuilding a JSONEncoder on every call.
+    """
+    return json.JSONEncoder(ensure_ascii=False).encode
+
+
+def orjson_encoder() -> JsonEncoder:
+    """
+    orjson-backed encoder (raises ImportError when orjson is missing).
+
+    Output is compact (no spaces after separators) UTF-8 JSON, decoded to
+    ``str`` because API Gateway response bodies are strings.
+    """
+    import orjson
+
+    dumps = orjson.dumps
+
+    def encode(data: Any) -> str:
+        return dumps(data).decode()
+
+    return encode
+
+
+def get_json_encoder(name: str = JSON_ENCODER_STDLIB) -> JsonEncoder:
+    """
+    Select the JSON encoder for response bodies.
+
+    ``stdlib`` is the default; orjson is an optional dependency, so
+    ``orjson`` and ``auto`` (orjson when installed, else the stdlib) are
+    opt-in.
+    """
+    if name == JSON_ENCODER_STDLIB:
+        return stdlib_encoder()
+    if name == JSON_ENCODER_ORJSON:
+        return orjson_encoder()
+    if name == JSON_ENCODER_AUTO:
+        try:
+            return orjson_encoder()
+        except ImportError:
+            return stdlib_encoder()
+    raise ValueError(f"Unknown JSON encoder: {name}")
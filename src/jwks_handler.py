@@ -0,0 +1,51 @@
+import json
+from functools import lru_cache
+from typing import Any, Dict
+
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.security.jwt_service import JWTTokenGenerator
+from src.infrastructure.security.keyring import build_keyring
+
+
+@lru_cache()
+def get_token_generator() -> JWTTokenGenerator:
+    """
+    Container-lifetime token generator (composition root).
+
+    The signing key (or keyring) is parsed when the generator is created.
+    """
+    settings = get_settings()
+    return JWTTokenGenerator(keyring=build_keyring(settings))
+
+
+@lru_cache(maxsize=1)
+def _serialize_jwks(key_version: int) -> str:
+    return json.dumps(get_token_generator().jwks())
+
+
+def get_jwks_body() -> str:
+    """
+    Serialized JWKS document, rebuilt only when the keys change.
+
+    Warm invocations return the cached string until a keyring reload
+    publishes new keys.
+    """
+    return _serialize_jwks(get_token_generator().key_version)
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    AWS Lambda handler publishing the JSON Web Key Set.
+
+    Downstream services fetch and cache these public keys to verify
+    ES256/EdDSA tokens offline, selecting the key by the token ``kid``.
+    """
+    return {
+        "statusCode": 200,
+        "headers": {
+            "Content-Type": "application/json",
+            "Cache-Control": "public, max-age=3600",
+            "Access-Control-Allow-Origin": "*",
+        },
+        "body": get_jwks_body(),
+    }
@@ -1,19 +1,150 @@
+from functools import lru_cache
 from typing import Dict, Any
 from loguru import logger
 
 from src.adapters.controllers.authentication_controller import AuthenticationController
-from src.adapters.gateways.customer_repository import CustomerRepository
+from src.adapters.controllers.response_builder import ResponseBuilder
+from src.adapters.gateways.cached_customer_repository import CachedCustomerRepository
+from src.adapters.gateways.negative_lookup_repository import (
+    NegativeLookupCustomerRepository,
+)
+from src.application.use_cases.ports import ICustomerRepository
+from src.infrastructure.cache.bloom_filter import RefreshingBloomFilter
+from src.infrastructure.cache.refresh_token_registry import (
+    build_refresh_token_registry,
+)
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.infrastructure.config.settings import Settings, get_settings
 from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.observability.logging import (
+    configure_logging,
+    flush_logs,
+    sampled,
+)
+from src.infrastructure.observability.metrics import (
+    Instrumentation,
+    build_instrumentation,
+)
 from src.infrastructure.security.jwt_service import JWTTokenGenerator
+from src.infrastructure.security.keyring import build_keyring
+from src.infrastructure.serialization.json_encoder import get_json_encoder
 from src.application.use_cases.authenticate_customer import AuthenticateCustomerUseCase
 
 
+def build_customer_repository(settings: Settings) -> ICustomerRepository:
+    """
+    Build the customer repository stack.
+
+    CachedCustomerRepository -> NegativeLookupCustomerRepository ->
+    ReadOnlyCustomerRepository (or the ORM CustomerRepository), each layer
+    enabled by settings. The base repository opens a connection or session
+    per lookup, so the whole stack is container-lifetime.
+
+    Only the selected base repository is imported: the read-only stack
+    never loads ``sqlalchemy.orm``, and the ORM stack configures its
+    mappers here, while the container is built, rather than on the first
+    query.
+    """
+    if settings.customer_repository_mode == "orm":
+        from sqlalchemy.orm import configure_mappers
+        from src.adapters.gateways.customer_repository import CustomerRepository
+
+        configure_mappers()
+        base_repository = CustomerRepository(
+            DatabaseConnection.get_session, settings.customer_cpf_key
+        )
+    elif settings.customer_repository_mode == "readonly":
+        from src.adapters.gateways.readonly_customer_repository import (
+            ReadOnlyCustomerRepository,
+        )
+
+        base_repository = ReadOnlyCustomerRepository(
+            DatabaseConnection.get_readonly_connection, settings.customer_cpf_key
+        )
+    else:
+        raise ValueError(
+            f"Unknown customer repository mode: {settings.customer_repository_mode}"
+        )
+    repository: ICustomerRepository = base_repository
+
+    negative_cache = None
+    if settings.negative_cache_max_size > 0 and settings.negative_cache_ttl_seconds > 0:
+        negative_cache = TTLCache(
+            max_size=settings.negative_cache_max_size,
+            ttl_seconds=settings.negative_cache_ttl_seconds,
+        )
+
+    bloom_filter = None
+    if settings.bloom_filter_enabled:
+        bloom_filter = RefreshingBloomFilter(
+            loader=base_repository.iter_cpfs,
+            capacity=settings.bloom_filter_capacity,
+            false_positive_rate=settings.bloom_filter_false_positive_rate,
+            max_bytes=settings.bloom_filter_max_bytes,
+            refresh_seconds=settings.bloom_filter_refresh_seconds,
+        )
+
+    if negative_cache is not None or bloom_filter is not None:
+        repository = NegativeLookupCustomerRepository(
+            repository, negative_cache, bloom_filter
+        )
+
+    if settings.customer_cache_max_size > 0 and settings.customer_cache_ttl_seconds > 0:
+        repository = CachedCustomerRepository(
+            repository,
+            TTLCache(
+                max_size=settings.customer_cache_max_size,
+                ttl_seconds=settings.customer_cache_ttl_seconds,
+            ),
+        )
+
+    return repository
+
+
+@lru_cache()
+def get_controller() -> AuthenticationController:
+    """
+    Get the container-lifetime object graph (composition root).
+
+    Built on the first invocation and reused by every warm invocation;
+    only database sessions are request-scoped. The database engine is
+    created lazily by the first lookup, so requests rejected before
+    find_by_cpf (OPTIONS, bad JSON, missing or invalid CPF) do no DB I/O.
+    """
+    settings = get_settings()
+    configure_logging(settings)
+
+    use_case = AuthenticateCustomerUseCase(
+        customer_repository=build_customer_repository(settings),
+        token_generator=JWTTokenGenerator(keyring=build_keyring(settings)),
+        max_batch_size=settings.auth_batch_max_size,
+        refresh_expiration_minutes=settings.jwt_refresh_expiration_minutes,
+        refresh_max_lifetime_minutes=settings.jwt_refresh_max_lifetime_minutes,
+        rotate_refresh_tokens=settings.refresh_token_rotation,
+        refresh_token_registry=build_refresh_token_registry(settings),
+    )
+
+    return AuthenticationController(
+        use_case, ResponseBuilder(get_json_encoder(settings.json_encoder))
+    )
+
+
+@lru_cache()
+def get_instrumentation() -> Instrumentation:
+    """
+    Get the container-lifetime stage instrumentation.
+
+    Its first request is reported as the cold start. Disabled by default
+    (INSTRUMENTATION_ENABLED), in which case it adds no per-stage work.
+    """
+    return build_instrumentation(get_settings())
+
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     AWS Lambda handler for authentication.
 
     This is the entry point for AWS Lambda.
-    Implements Dependency Injection manually (composition root).
 
     Args:
         event: API Gateway event
@@ -22,21 +153,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         API Gateway response
     """
+    controller = get_controller()
+    instrumentation = get_instrumentation()
     logger.info("Authentication Lambda invoked", request_id=context.aws_request_id)
 
-    DatabaseConnection.initialize()
-    logger.debug("Database connection initialized")
-
-    with DatabaseConnection.get_session() as session:
-        customer_repository = CustomerRepository(session)
-        token_generator = JWTTokenGenerator()
-
-        use_case = AuthenticateCustomerUseCase(
-            customer_repository=customer_repository, token_generator=token_generator
+    try:
+        response = instrumentation.run(
+            controller.handle, event, request_id=context.aws_request_id
         )
-
-        controller = AuthenticationController(use_case)
-
-        response = controller.handle(event)
-        logger.info("Authentication request completed", status_code=response.get('statusCode'))
+        status_code = response.get("statusCode")
+        if status_code >= 400 or sampled():
+            logger.info("Authentication request completed", status_code=status_code)
         return response
+    finally:
+        flush_logs()
@@ -1,16 +1,53 @@
 import json
+from functools import lru_cache
+from typing import Any, Dict
+
 from loguru import logger
 
+from src.infrastructure.config.settings import LoggingSettings
+from src.infrastructure.observability.logging import (
+    configure_logging,
+    flush_logs,
+    lazy_logger,
+)
+
+
+@lru_cache()
+def setup_logging():
+    """
+    Install the configured log sink once per container.
+
+    Reads only the LOG_* variables: this handler needs no database URL or
+    JWT secret.
+    """
+    configure_logging(LoggingSettings.from_env())
+
+
+def _redacted(claims: Dict[str, Any]) -> Dict[str, Any]:
+    """Claims safe to log: the CPF is masked."""
+    if "cpf" not in claims:
+        return claims
+    return {**claims, "cpf": "***"}
+
+
 def lambda_handler(event, context):
-    logger.info("Protected endpoint accessed", request_id=context.aws_request_id)
-    
-    claims = event.get("requestContext", {}).get("authorizer", {})
-    logger.debug("JWT claims extracted", claims=claims)
-    
-    return {
-        "statusCode": 200,
-        "body": json.dumps({
-            "message": "Acesso autorizado",
-            "claims": claims
-        })
-    }
+    setup_logging()
+    try:
+        logger.info("Protected endpoint accessed", request_id=context.aws_request_id)
+
+        authorizer = event.get("requestContext", {}).get("authorizer", {})
+        # Lambda authorizer context (HTTP API), JWT authorizer claims, or the
+        # flat REST API authorizer context
+        claims = (
+            authorizer.get("lambda")
+            or authorizer.get("jwt", {}).get("claims")
+            or authorizer
+        )
+        lazy_logger.debug("JWT claims extracted", claims=lambda: _redacted(claims))
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({"message": "Acesso autorizado", "claims": claims}),
+        }
+    finally:
+        flush_logs()
@@ -1,6 +1,7 @@
+import os
 import pytest
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.domain.entities import Customer
 from src.domain.value_objects import CPF
@@ -60,3 +61,70 @@ def mock_token_generator():
     from src.application.use_cases.ports import ITokenGenerator
 
     return Mock(spec=ITokenGenerator)
+
+
+@pytest.fixture
+def sqlite_database(tmp_path):
+    """
+    Seeded SQLite database used as a local stand-in for RDS MySQL.
+
+    Points DATABASE_URL at the file and resets every container-lifetime
+    singleton before and after the test.
+    """
+    from sqlalchemy import create_engine
+
+    from src.infrastructure.config.settings import get_settings
+    from src.infrastructure.database.connection import DatabaseConnection
+    from src.infrastructure.database.models import Base, CustomerModel
+    from src.lambda_handler import get_controller, get_instrumentation
+
+    url = f"sqlite:///{tmp_path / 'clientes.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            CustomerModel.__table__.insert(),
+            [
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440000",
+                    "cpf": "111.444.777-35",
+                    "nome": "João da Silva",
+                    "criado_em": datetime(2024, 1, 1),
+                    "atualizado_em": datetime(2024, 1, 1),
+                },
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440001",
+                    "cpf": "52998224725",
+                    "nome": "Maria Santos",
+                    "criado_em": datetime(2024, 1, 1),
+                    "atualizado_em": datetime(2024, 1, 1),
+                },
+            ],
+        )
+    engine.dispose()
+
+    def reset():
+        get_settings.cache_clear()
+        get_controller.cache_clear()
+        get_instrumentation.cache_clear()
+        DatabaseConnection.dispose()
+
+    reset()
+    with patch.dict(
+        os.environ,
+        {
+            "DATABASE_URL": url,
+            "JWT_SECRET": "test-secret",
+            # Requests over the default query budget fail the test
+            "QUERY_BUDGET_MODE": "raise",
+        },
+        clear=True,
+    ):
+        yield url
+        reset()
+
+
+@pytest.fixture
+def lambda_context():
+    """Minimal AWS Lambda context."""
+    return Mock(aws_request_id="test-request-id")
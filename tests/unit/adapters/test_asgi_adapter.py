@@ -0,0 +1,185 @@
+"""Unit tests for the ASGI adapter."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.adapters.controllers.asgi_adapter import ASGIAdapter
+from src.infrastructure.database.query_stats import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    install_query_stats,
+)
+
+
+def request(app, method="POST", path="/auth", body=b"", chunks=None, **scope):
+    """Drive one HTTP request through app; return (status, headers, body)."""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True}
+        for chunk in (chunks or [])
+    ]
+    messages.append({"type": "http.request", "body": body, "more_body": False})
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, **scope}
+    asyncio.run(app(scope, receive, send))
+
+    start, body_message = sent
+    return start["status"], dict(start["headers"]), body_message["body"]
+
+
+def lifespan(app, *events):
+    """Send lifespan events to app; return the message types it answered."""
+    messages = [{"type": f"lifespan.{event}"} for event in events]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+    return sent
+
+
+@pytest.fixture
+def controller():
+    """Async controller answering every request with 200."""
+    controller = Mock()
+    controller.handle = AsyncMock(
+        return_value={
+            "statusCode": 200,
+            "headers": {"Content-Type": "application/json"},
+            "body": '{"ok": true}',
+        }
+    )
+    return controller
+
+
+@pytest.fixture
+def app(controller):
+    """Adapter over the mock controller."""
+    return ASGIAdapter(lambda: controller, max_body_bytes=16)
+
+
+class TestASGIAdapter:
+    """Test suite for ASGIAdapter."""
+
+    def test_forwards_payload_v2_event(self, app, controller):
+        """Test that requests reach the controller as API Gateway v2 events."""
+        status, headers, body = request(
+            app,
+            body=b'{"cpf": "1"}',
+            headers=[(b"Content-Type", b"application/json"), (b"X-A", b"1")],
+            query_string=b"a=1",
+            client=("10.0.0.1", 5000),
+        )
+
+        assert status == 200
+        assert body == b'{"ok": true}'
+        assert headers[b"content-type"] == b"application/json"
+        assert headers[b"content-length"] == b"12"
+
+        event = controller.handle.await_args.args[0]
+        assert event["version"] == "2.0"
+        assert event["rawPath"] == "/auth"
+        assert event["rawQueryString"] == "a=1"
+        assert event["headers"] == {"content-type": "application/json", "x-a": "1"}
+        assert event["requestContext"]["http"]["method"] == "POST"
+        assert event["requestContext"]["http"]["sourceIp"] == "10.0.0.1"
+        assert event["body"] == '{"cpf": "1"}'
+
+    def test_joins_chunked_body_and_repeated_headers(self, app, controller):
+        """Test that streamed bodies and repeated headers are merged."""
+        request(
+            app,
+            chunks=[b'{"cpf"', b": "],
+            body=b'"1"}',
+            headers=[(b"accept", b"a"), (b"accept", b"b")],
+        )
+
+        event = controller.handle.await_args.args[0]
+        assert event["body"] == '{"cpf": "1"}'
+        assert event["headers"]["accept"] == "a,b"
+
+    @pytest.mark.parametrize(
+        "method, path, status_code",
+        [
+            ("POST", "/unknown", 404),
+            ("GET", "/auth", 405),
+            ("DELETE", "/auth/batch", 405),
+        ],
+    )
+    def test_routing_errors(self, app, controller, method, path, status_code):
+        """Test that unrouted requests never reach the controller."""
+        status, _, body = request(app, method=method, path=path)
+
+        assert status == status_code
+        assert "error" in json.loads(body)
+        controller.handle.assert_not_awaited()
+
+    def test_body_too_large(self, app, controller):
+        """Test that bodies over max_body_bytes get 413."""
+        status, _, _ = request(app, chunks=[b"x" * 10], body=b"x" * 10)
+
+        assert status == 413
+        controller.handle.assert_not_awaited()
+
+    @pytest.mark.parametrize("method", ["GET", "HEAD"])
+    def test_health_check(self, app, controller, method):
+        """Test that the health path answers without the controller."""
+        status, _, body = request(app, method=method, path="/health")
+
+        assert status == 200
+        assert json.loads(body) == {"status": "ok"}
+        controller.handle.assert_not_awaited()
+
+    def test_lifespan_builds_controller_and_runs_shutdown(self, controller):
+        """Test that startup builds the graph and shutdown runs the hook."""
+        factory = Mock(return_value=controller)
+        on_shutdown = AsyncMock()
+        app = ASGIAdapter(factory, on_shutdown=on_shutdown)
+
+        sent = lifespan(app, "startup", "shutdown")
+
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        factory.assert_called_once()
+        on_shutdown.assert_awaited_once()
+
+    def test_lifespan_startup_failure(self):
+        """Test that a failing factory reports startup failure."""
+        app = ASGIAdapter(Mock(side_effect=RuntimeError("no database")))
+
+        assert lifespan(app, "startup") == ["lifespan.startup.failed"]
+
+    def test_query_budget(self, controller):
+        """Test that the SQL run by each controller call is budgeted."""
+        from sqlalchemy import create_engine, text
+
+        engine = create_engine("sqlite://")
+        install_query_stats(engine)
+
+        async def handle(event):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1")).all()
+                connection.execute(text("SELECT 2")).all()
+            return {"statusCode": 200, "headers": {}, "body": "{}"}
+
+        controller.handle = AsyncMock(side_effect=handle)
+        budget = QueryBudget(max_statements=1, max_rows=10, mode="raise")
+        app = ASGIAdapter(lambda: controller, query_budget_factory=lambda: budget)
+
+        try:
+            with pytest.raises(QueryBudgetExceeded, match="/auth: 2 statements > 1"):
+                request(app)
+        finally:
+            engine.dispose()
@@ -1,11 +1,19 @@
 """Unit tests for AuthenticationController."""
 
+import asyncio
 import json
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
-from src.adapters.controllers.authentication_controller import AuthenticationController
-from src.application.use_cases.authenticate_customer import AuthenticationResponse
+from src.adapters.controllers.authentication_controller import (
+    AsyncAuthenticationController,
+    AuthenticationController,
+)
+from src.application.use_cases.authenticate_customer import (
+    AuthenticationResponse,
+    BatchAuthenticationResponse,
+)
+from src.application.use_cases.ports import CustomerLookupError
 
 
 class TestAuthenticationController:
@@ -113,6 +121,26 @@ class TestAuthenticationController:
         body = json.loads(response["body"])
         assert "Erro interno" in body["error"]
 
+    @pytest.mark.parametrize(
+        "method, event",
+        [
+            ("execute", {"body": json.dumps({"cpf": "11144477735"})}),
+            ("execute_batch", {"rawPath": "/auth/batch", "body": '{"cpfs": []}'}),
+        ],
+    )
+    def test_lookup_failure_returns_503(self, method, event):
+        """Test that a database outage is not reported as an unknown CPF."""
+        mock_use_case = Mock()
+        getattr(mock_use_case, method).side_effect = CustomerLookupError()
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        response = controller.handle(event)
+
+        assert response["statusCode"] == 503
+        assert json.loads(response["body"]) == {
+            "error": "Serviço temporariamente indisponível"
+        }
+
     def test_authentication_with_dict_body(self):
         """Test authentication when body is already a dict."""
         # Arrange
@@ -159,3 +187,288 @@ class TestAuthenticationController:
         # Assert
         assert "Access-Control-Allow-Origin" in response["headers"]
         assert response["headers"]["Access-Control-Allow-Origin"] == "*"
+
+    def test_cors_preflight_skips_use_case(self):
+        """Test that OPTIONS requests are answered without authentication."""
+        # Arrange
+        mock_use_case = Mock()
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        event = {"requestContext": {"http": {"method": "OPTIONS"}}}
+
+        # Act
+        response = controller.handle(event)
+
+        # Assert
+        assert response["statusCode"] == 204
+        assert response["headers"]["Access-Control-Allow-Origin"] == "*"
+        assert "POST" in response["headers"]["Access-Control-Allow-Methods"]
+        mock_use_case.execute.assert_not_called()
+
+
+class TestBatchAuthenticationController:
+    """Test suite for the batch authentication route."""
+
+    def test_batch_route_returns_per_item_results(self):
+        """Test that each CPF gets its own result and error code."""
+        # Arrange
+        mock_use_case = Mock()
+        mock_use_case.execute_batch.return_value = BatchAuthenticationResponse(
+            success=True,
+            results=[
+                AuthenticationResponse(
+                    success=True,
+                    token="fake-jwt-token",
+                    customer_id="1",
+                    customer_name="João da Silva",
+                ),
+                AuthenticationResponse(
+                    success=False, message="CPF inválido", error_code="INVALID_CPF"
+                ),
+            ],
+        )
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        event = {
+            "rawPath": "/auth/batch",
+            "body": json.dumps({"cpfs": ["11144477735", "00000000000"]}),
+        }
+
+        # Act
+        response = controller.handle(event)
+
+        # Assert
+        assert response["statusCode"] == 200
+        results = json.loads(response["body"])["results"]
+        assert results[0] == {
+            "cpf": "11144477735",
+            "success": True,
+            "token": "fake-jwt-token",
+            "customer": {"id": "1", "name": "João da Silva"},
+        }
+        assert results[1]["error"]["code"] == "INVALID_CPF"
+        mock_use_case.execute.assert_not_called()
+
+    def test_batch_requires_cpf_list(self):
+        """Test that the batch route requires a list of CPFs."""
+        mock_use_case = Mock()
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        event = {"rawPath": "/auth/batch", "body": json.dumps({"cpfs": "111"})}
+
+        response = controller.handle(event)
+
+        assert response["statusCode"] == 400
+        mock_use_case.execute_batch.assert_not_called()
+
+    def test_batch_rejected_by_use_case(self):
+        """Test that batch-level rejections are reported as bad requests."""
+        mock_use_case = Mock()
+        mock_use_case.execute_batch.return_value = BatchAuthenticationResponse(
+            success=False, message="Limite de 50 CPFs por lote excedido"
+        )
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        event = {"path": "/auth/batch", "body": json.dumps({"cpfs": ["1"] * 51})}
+
+        response = controller.handle(event)
+
+        assert response["statusCode"] == 400
+        assert "Limite" in json.loads(response["body"])["error"]
+
+    def test_batch_with_invalid_json(self):
+        """Test that invalid JSON on the batch route is a bad request."""
+        controller = AuthenticationController(use_case=Mock())
+
+        response = controller.handle({"rawPath": "/auth/batch", "body": "{"})
+
+        assert response["statusCode"] == 400
+
+    def test_batch_with_exception(self):
+        """Test that unexpected errors on the batch route return 500."""
+        mock_use_case = Mock()
+        mock_use_case.execute_batch.side_effect = Exception("Database error")
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        event = {"rawPath": "/auth/batch", "body": json.dumps({"cpfs": ["1"]})}
+
+        response = controller.handle(event)
+
+        assert response["statusCode"] == 500
+
+
+class TestRefreshController:
+    """Test suite for the refresh route."""
+
+    def test_login_includes_refresh_token(self):
+        """Test that a refresh token issued at login is returned."""
+        mock_use_case = Mock()
+        mock_use_case.execute.return_value = AuthenticationResponse(
+            success=True,
+            token="access-token",
+            message="Autenticação realizada com sucesso",
+            customer_id="1",
+            customer_name="João da Silva",
+            refresh_token="refresh-token",
+        )
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        response = controller.handle({"body": json.dumps({"cpf": "11144477735"})})
+
+        assert json.loads(response["body"])["refresh_token"] == "refresh-token"
+
+    def test_refresh_route(self):
+        """Test that /auth/refresh exchanges the refresh token."""
+        mock_use_case = Mock()
+        mock_use_case.execute_refresh.return_value = AuthenticationResponse(
+            success=True,
+            token="access-token",
+            message="Token renovado com sucesso",
+            customer_id="1",
+            customer_name="João da Silva",
+            refresh_token="rotated-token",
+        )
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        response = controller.handle(
+            {
+                "rawPath": "/auth/refresh",
+                "body": json.dumps({"refresh_token": "refresh-token"}),
+            }
+        )
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["token"] == "access-token"
+        assert body["refresh_token"] == "rotated-token"
+        request = mock_use_case.execute_refresh.call_args.args[0]
+        assert request.refresh_token == "refresh-token"
+        mock_use_case.execute.assert_not_called()
+
+    @pytest.mark.parametrize("body", ["{}", '{"refresh_token": 1}', "{"])
+    def test_refresh_bad_request(self, body):
+        """Test missing refresh token and invalid JSON."""
+        controller = AuthenticationController(use_case=Mock())
+
+        response = controller.handle({"rawPath": "/auth/refresh", "body": body})
+
+        assert response["statusCode"] == 400
+
+    def test_refresh_rejected(self):
+        """Test that invalid refresh tokens return 401."""
+        mock_use_case = Mock()
+        mock_use_case.execute_refresh.return_value = AuthenticationResponse(
+            success=False, message="Refresh token inválido"
+        )
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        response = controller.handle(
+            {"rawPath": "/auth/refresh", "body": json.dumps({"refresh_token": "x"})}
+        )
+
+        assert response["statusCode"] == 401
+
+    def test_refresh_with_exception(self):
+        """Test that unexpected errors on the refresh route return 500."""
+        mock_use_case = Mock()
+        mock_use_case.execute_refresh.side_effect = Exception("boom")
+        controller = AuthenticationController(use_case=mock_use_case)
+
+        response = controller.handle(
+            {"rawPath": "/auth/refresh", "body": json.dumps({"refresh_token": "x"})}
+        )
+
+        assert response["statusCode"] == 500
+
+
+class TestAsyncAuthenticationController:
+    """Test suite for the asyncio controller (same mapping, awaited use case)."""
+
+    @pytest.fixture
+    def use_case(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def controller(self, use_case):
+        return AsyncAuthenticationController(use_case)
+
+    def test_successful_authentication(self, controller, use_case):
+        """Test that the response matches the sync controller's."""
+        use_case.execute.return_value = AuthenticationResponse(
+            success=True,
+            token="fake-jwt-token",
+            message="Autenticação realizada com sucesso",
+            customer_id="1",
+            customer_name="João da Silva",
+        )
+        event = {"body": json.dumps({"cpf": "11144477735"})}
+
+        sync_use_case = Mock()
+        sync_use_case.execute.return_value = use_case.execute.return_value
+
+        response = asyncio.run(controller.handle(event))
+
+        assert response == AuthenticationController(sync_use_case).handle(event)
+        use_case.execute.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "event, status_code",
+        [
+            ({"requestContext": {"http": {"method": "OPTIONS"}}}, 204),
+            ({"body": "invalid-json"}, 400),
+            ({"body": json.dumps({})}, 400),
+            ({"rawPath": "/auth/batch", "body": json.dumps({"cpfs": "x"})}, 400),
+            ({"rawPath": "/auth/refresh", "body": json.dumps({})}, 400),
+        ],
+    )
+    def test_rejections_skip_use_case(self, controller, use_case, event, status_code):
+        """Test that preflight and invalid bodies never reach the use case."""
+        response = asyncio.run(controller.handle(event))
+
+        assert response["statusCode"] == status_code
+        assert use_case.mock_calls == []
+
+    def test_batch_route(self, controller, use_case):
+        """Test that the batch route awaits execute_batch."""
+        use_case.execute_batch.return_value = BatchAuthenticationResponse(
+            success=True,
+            results=[AuthenticationResponse(success=False, error_code="INVALID_CPF")],
+        )
+        event = {"rawPath": "/auth/batch", "body": json.dumps({"cpfs": ["1"]})}
+
+        response = asyncio.run(controller.handle_batch(event))
+
+        body = json.loads(response["body"])
+        assert body["results"][0]["error"]["code"] == "INVALID_CPF"
+
+    def test_refresh_route(self, controller, use_case):
+        """Test that the refresh route awaits execute_refresh."""
+        use_case.execute_refresh.return_value = AuthenticationResponse(
+            success=False, message="Refresh token inválido"
+        )
+        event = {"rawPath": "/auth/refresh", "body": json.dumps({"refresh_token": "t"})}
+
+        response = asyncio.run(controller.handle_refresh(event))
+
+        assert response["statusCode"] == 401
+
+    def test_lookup_failure_returns_503(self, controller, use_case):
+        """Test that awaited lookup failures map to 503 like the sync path."""
+        use_case.execute.side_effect = CustomerLookupError()
+
+        response = asyncio.run(
+            controller.handle({"body": json.dumps({"cpf": "11144477735"})})
+        )
+
+        assert response["statusCode"] == 503
+
+    def test_exception_returns_500(self, controller, use_case):
+        """Test that use case errors are mapped to a generic 500."""
+        use_case.execute.side_effect = RuntimeError("database down")
+
+        response = asyncio.run(
+            controller.handle({"body": json.dumps({"cpf": "11144477735"})})
+        )
+
+        assert response["statusCode"] == 500
+        assert "database down" not in response["body"]
@@ -0,0 +1,127 @@
+"""Unit tests for AuthorizerController."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.adapters.controllers.authorizer_controller import AuthorizerController
+
+ROUTE_ARN = "arn:aws:execute-api:us-east-2:123456789012:abc123/prod/GET/protected"
+
+CLAIMS = {
+    "sub": "1",
+    "cpf": "11144477735",
+    "role": "client",
+    "trace_id": "trace-1",
+    "aud": "api-client",
+    "iat": 1700000000,
+    "exp": 1700003600,
+}
+
+
+def http_api_event(authorization="Bearer good-token"):
+    """HTTP API REQUEST authorizer event (payload 2.0)."""
+    return {
+        "version": "2.0",
+        "type": "REQUEST",
+        "routeArn": ROUTE_ARN,
+        "identitySource": [authorization] if authorization else None,
+        "headers": {"authorization": authorization} if authorization else {},
+    }
+
+
+@pytest.fixture
+def token_generator():
+    generator = Mock()
+    generator.validate.return_value = dict(CLAIMS)
+    return generator
+
+
+class TestAuthorizerController:
+    """Test suite for the Lambda authorizer controller."""
+
+    def test_valid_token_is_authorized(self, token_generator):
+        """Test that a valid token yields a simple allow response."""
+        controller = AuthorizerController(token_generator)
+
+        response = controller.handle(http_api_event())
+
+        token_generator.validate.assert_called_once_with("good-token")
+        assert response == {
+            "isAuthorized": True,
+            "context": {
+                "sub": "1",
+                "cpf": "11144477735",
+                "role": "client",
+                "trace_id": "trace-1",
+                "exp": 1700003600,
+            },
+        }
+
+    def test_invalid_token_is_denied(self, token_generator):
+        """Test that validation errors become a deny decision."""
+        token_generator.validate.side_effect = ValueError("Token expirado")
+        controller = AuthorizerController(token_generator)
+
+        response = controller.handle(http_api_event())
+
+        assert response == {"isAuthorized": False, "context": {}}
+
+    @pytest.mark.parametrize(
+        "authorization", [None, "", "Basic dXNlcjpwYXNz", "Bearer ", "token-only"]
+    )
+    def test_missing_or_malformed_header_is_denied(
+        self, token_generator, authorization
+    ):
+        """Test that requests without a bearer token never reach validate."""
+        controller = AuthorizerController(token_generator)
+
+        response = controller.handle(http_api_event(authorization))
+
+        assert response["isAuthorized"] is False
+        token_generator.validate.assert_not_called()
+
+    def test_role_rule(self, token_generator):
+        """Test that roles outside the allowed set are denied."""
+        controller = AuthorizerController(token_generator, allowed_roles=("admin",))
+
+        assert controller.handle(http_api_event())["isAuthorized"] is False
+
+    def test_revoked_token_is_denied(self, token_generator):
+        """Test that revoked trace ids are denied."""
+        controller = AuthorizerController(
+            token_generator, revoked_token_ids=("trace-1",)
+        )
+
+        assert controller.handle(http_api_event())["isAuthorized"] is False
+
+    def test_iam_policy_covers_whole_stage(self, token_generator):
+        """Test IAM output scoped so cached policies work on every route."""
+        controller = AuthorizerController(token_generator, simple_responses=False)
+
+        response = controller.handle(http_api_event())
+
+        assert response["principalId"] == "1"
+        statement = response["policyDocument"]["Statement"][0]
+        assert statement["Effect"] == "Allow"
+        assert statement["Resource"] == (
+            "arn:aws:execute-api:us-east-2:123456789012:abc123/prod/*"
+        )
+        assert response["context"]["cpf"] == "11144477735"
+
+    def test_rest_token_event_gets_deny_policy(self, token_generator):
+        """Test payload 1.0 TOKEN events always get an IAM policy."""
+        token_generator.validate.side_effect = ValueError("Token inválido")
+        controller = AuthorizerController(token_generator)
+
+        response = controller.handle(
+            {
+                "type": "TOKEN",
+                "authorizationToken": "Bearer bad-token",
+                "methodArn": ROUTE_ARN,
+            }
+        )
+
+        token_generator.validate.assert_called_once_with("bad-token")
+        assert response["principalId"] == "anonymous"
+        statement = response["policyDocument"]["Statement"][0]
+        assert statement["Effect"] == "Deny"
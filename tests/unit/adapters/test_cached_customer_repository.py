@@ -0,0 +1,101 @@
+"""Unit tests for CachedCustomerRepository."""
+
+from src.adapters.gateways.cached_customer_repository import CachedCustomerRepository
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class TestCachedCustomerRepository:
+    """Test suite for the caching repository decorator."""
+
+    def test_repeat_lookup_skips_wrapped_repository(
+        self, mock_customer_repository, sample_customer
+    ):
+        """Test that a cached CPF is served without hitting the database."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        repository = CachedCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=60)
+        )
+
+        first = repository.find_by_cpf("11144477735")
+        second = repository.find_by_cpf("111.444.777-35")
+
+        assert first is sample_customer
+        assert second is sample_customer
+        mock_customer_repository.find_by_cpf.assert_called_once_with("11144477735")
+        assert repository.cache.hits == 1
+        assert repository.cache.misses == 1
+
+    def test_not_found_is_not_cached(self, mock_customer_repository):
+        """Test that misses always reach the wrapped repository."""
+        mock_customer_repository.find_by_cpf.return_value = None
+        repository = CachedCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=60)
+        )
+
+        assert repository.find_by_cpf("52998224725") is None
+        assert repository.find_by_cpf("52998224725") is None
+
+        assert mock_customer_repository.find_by_cpf.call_count == 2
+
+    def test_invalidate_cpf(self, mock_customer_repository, sample_customer):
+        """Test invalidation by CPF forces a new lookup."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        repository = CachedCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=60)
+        )
+        repository.find_by_cpf("11144477735")
+
+        assert repository.invalidate_cpf("111.444.777-35") is True
+        repository.find_by_cpf("11144477735")
+
+        assert mock_customer_repository.find_by_cpf.call_count == 2
+
+    def test_invalidate_customer(self, mock_customer_repository, sample_customer):
+        """Test invalidation by customer id."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        repository = CachedCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=60)
+        )
+        repository.find_by_cpf("11144477735")
+
+        assert repository.invalidate_customer(sample_customer.id) is True
+        assert repository.invalidate_customer(sample_customer.id) is False
+        assert len(repository.cache) == 0
+
+    def test_find_many_queries_only_uncached(
+        self, mock_customer_repository, sample_customer, inactive_customer
+    ):
+        """Test that batch lookups only query CPFs missing from the cache."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        mock_customer_repository.find_many_by_cpf.return_value = {
+            inactive_customer.cpf: inactive_customer
+        }
+        repository = CachedCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=60)
+        )
+        repository.find_by_cpf(sample_customer.cpf)
+
+        customers = repository.find_many_by_cpf(
+            [sample_customer.cpf, inactive_customer.cpf]
+        )
+
+        assert customers == {
+            sample_customer.cpf: sample_customer,
+            inactive_customer.cpf: inactive_customer,
+        }
+        mock_customer_repository.find_many_by_cpf.assert_called_once_with(
+            [inactive_customer.cpf]
+        )
+
+    def test_find_many_fully_cached(self, mock_customer_repository, sample_customer):
+        """Test that a fully cached batch skips the repository."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        repository = CachedCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=60)
+        )
+        repository.find_by_cpf(sample_customer.cpf)
+
+        assert repository.find_many_by_cpf([sample_customer.cpf]) == {
+            sample_customer.cpf: sample_customer
+        }
+        mock_customer_repository.find_many_by_cpf.assert_not_called()
@@ -1,14 +1,29 @@
 """Unit tests for CustomerRepository."""
 
 import pytest
+from contextlib import contextmanager
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
 
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
 from src.adapters.gateways.customer_repository import CustomerRepository
-from src.infrastructure.database.models import CustomerModel
+from src.application.use_cases.ports import CustomerLookupError
+from src.infrastructure.database.models import Base, CustomerModel
 from src.domain.entities import Customer
 
 
+def session_scope(session):
+    """Build a session scope that always yields the given session."""
+
+    @contextmanager
+    def scope():
+        yield session
+
+    return scope
+
+
 class TestCustomerRepository:
     """Test suite for CustomerRepository."""
 
@@ -28,10 +43,10 @@ class TestCustomerRepository:
         )
 
         mock_query = Mock()
-        mock_query.all.return_value = [customer_model]
-        mock_session.query.return_value = mock_query
+        mock_query.filter.return_value.first.return_value = customer_model
+        mock_session.query.return_value.options.return_value = mock_query
 
-        repository = CustomerRepository(mock_session)
+        repository = CustomerRepository(session_scope(mock_session))
 
         # Act
         customer = repository.find_by_cpf("11144477735")
@@ -46,6 +61,8 @@ class TestCustomerRepository:
         assert customer.telefone == "11987654321"
 
         mock_session.query.assert_called_once_with(CustomerModel)
+        mock_query.filter.return_value.first.assert_called_once_with()
+        mock_query.all.assert_not_called()
 
     def test_find_by_cpf_not_found(self):
         """Test finding a customer by CPF when customer doesn't exist."""
@@ -53,10 +70,10 @@ class TestCustomerRepository:
         mock_session = Mock()
 
         mock_query = Mock()
-        mock_query.all.return_value = []
-        mock_session.query.return_value = mock_query
+        mock_query.filter.return_value.first.return_value = None
+        mock_session.query.return_value.options.return_value = mock_query
 
-        repository = CustomerRepository(mock_session)
+        repository = CustomerRepository(session_scope(mock_session))
 
         # Act
         customer = repository.find_by_cpf("11144477735")
@@ -81,10 +98,10 @@ class TestCustomerRepository:
         )
 
         mock_query = Mock()
-        mock_query.all.return_value = [customer_model]
-        mock_session.query.return_value = mock_query
+        mock_query.filter.return_value.first.return_value = customer_model
+        mock_session.query.return_value.options.return_value = mock_query
 
-        repository = CustomerRepository(mock_session)
+        repository = CustomerRepository(session_scope(mock_session))
 
         # Act
         customer = repository.find_by_cpf("111.444.777-35")
@@ -97,7 +114,7 @@ class TestCustomerRepository:
         """Test conversion from database model to domain entity."""
         # Arrange
         mock_session = Mock()
-        repository = CustomerRepository(mock_session)
+        repository = CustomerRepository(session_scope(mock_session))
 
         customer_model = CustomerModel(
             id="550e8400-e29b-41d4-a716-446655440000",
@@ -121,15 +138,214 @@ class TestCustomerRepository:
         assert customer.telefone == "11987654321"
 
     def test_find_by_cpf_handles_database_error(self):
-        """Test that repository handles database errors gracefully."""
+        """Test that database errors are not reported as not found."""
         # Arrange
         mock_session = Mock()
         mock_session.query.side_effect = Exception("Database error")
 
-        repository = CustomerRepository(mock_session)
+        repository = CustomerRepository(session_scope(mock_session))
 
-        # Act
-        customer = repository.find_by_cpf("11144477735")
+        # Act / Assert
+        with pytest.raises(CustomerLookupError):
+            repository.find_by_cpf("11144477735")
 
-        # Assert
-        assert customer is None
+
+class TestCustomerRepositoryQueries:
+    """Tests for the SQL issued by CustomerRepository against a real engine."""
+
+    @pytest.fixture
+    def session(self):
+        """In-memory SQLite session seeded with formatted and bare CPFs."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add_all(
+            [
+                CustomerModel(
+                    id="1",
+                    cpf="111.444.777-35",
+                    nome="João da Silva",
+                    criado_em=datetime(2024, 1, 1),
+                    atualizado_em=datetime(2024, 1, 1),
+                ),
+                CustomerModel(
+                    id="2",
+                    cpf="52998224725",
+                    nome="Maria Santos",
+                    criado_em=datetime(2024, 1, 1),
+                    atualizado_em=datetime(2024, 1, 1),
+                ),
+            ]
+        )
+        session.commit()
+
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        session.statements = statements
+
+        yield session
+
+        session.close()
+        engine.dispose()
+
+    @pytest.mark.parametrize(
+        "cpf, expected_id",
+        [
+            ("11144477735", "1"),
+            ("111.444.777-35", "1"),
+            ("52998224725", "2"),
+            ("529.982.247-25", "2"),
+            ("39053344705", None),
+        ],
+    )
+    def test_find_by_cpf_matches_stored_forms(self, session, cpf, expected_id):
+        """Test lookup matches formatted and bare-digit rows like the old scan."""
+        repository = CustomerRepository(session_scope(session))
+
+        customer = repository.find_by_cpf(cpf)
+
+        if expected_id is None:
+            assert customer is None
+        else:
+            assert customer.id == expected_id
+            assert customer.cpf == "".join(filter(str.isdigit, cpf))
+
+    def test_find_by_cpf_issues_single_bounded_query(self, session):
+        """Test that a lookup is one indexed equality query bounded by first()."""
+        repository = CustomerRepository(session_scope(session))
+
+        repository.find_by_cpf("11144477735")
+
+        assert len(session.statements) == 1
+        statement = session.statements[0].upper()
+        assert "WHERE CLIENTES.CPF IN" in statement
+        assert "LIMIT" in statement
+
+    def test_find_by_cpf_with_wrong_length_skips_query(self, session):
+        """Test that CPFs without 11 digits never reach the database."""
+        repository = CustomerRepository(session_scope(session))
+
+        assert repository.find_by_cpf("123") is None
+        assert session.statements == []
+
+    def test_each_lookup_opens_its_own_session(self, session):
+        """Test that the repository asks for a session on every call."""
+        opened = []
+
+        @contextmanager
+        def scope():
+            opened.append(1)
+            yield session
+
+        repository = CustomerRepository(scope)
+
+        repository.find_by_cpf("11144477735")
+        repository.find_by_cpf("52998224725")
+
+        assert len(opened) == 2
+
+    def test_iter_cpfs_yields_bare_digits(self, session):
+        """Test streaming every stored CPF normalized to digits."""
+        repository = CustomerRepository(session_scope(session))
+
+        assert sorted(repository.iter_cpfs(batch_size=1)) == [
+            "11144477735",
+            "52998224725",
+        ]
+
+    def test_find_many_by_cpf_issues_single_query(self, session):
+        """Test that many CPFs are resolved with one IN (...) query."""
+        repository = CustomerRepository(session_scope(session))
+
+        customers = repository.find_many_by_cpf(
+            ["11144477735", "52998224725", "39053344705", "123"]
+        )
+
+        assert set(customers) == {"11144477735", "52998224725"}
+        assert customers["52998224725"].nome == "Maria Santos"
+        assert len(session.statements) == 1
+
+    def test_find_many_by_cpf_without_valid_cpfs(self, session):
+        """Test that no query is issued when there is nothing to look up."""
+        repository = CustomerRepository(session_scope(session))
+
+        assert repository.find_many_by_cpf(["123"]) == {}
+        assert session.statements == []
+
+    def test_find_many_by_cpf_handles_database_error(self):
+        """Test that database errors are not reported as no customers."""
+        mock_session = Mock()
+        mock_session.query.side_effect = Exception("Database error")
+        repository = CustomerRepository(session_scope(mock_session))
+
+        with pytest.raises(CustomerLookupError):
+            repository.find_many_by_cpf(["11144477735"])
+
+    @pytest.mark.parametrize(
+        "mode, cpf, expected_id, queries",
+        [
+            ("dual", "11144477735", "1", 1),
+            ("dual", "52998224725", "2", 2),
+            ("integer", "52998224725", None, 1),
+        ],
+    )
+    def test_find_by_cpf_integer_key(self, session, mode, cpf, expected_id, queries):
+        """Test lookups against cpf_numero with the text fallback."""
+        session.get(CustomerModel, "1").cpf_numero = 11144477735
+        session.commit()
+        session.statements.clear()
+        repository = CustomerRepository(session_scope(session), mode)
+
+        customer = repository.find_by_cpf(cpf)
+
+        assert (customer.id if customer else None) == expected_id
+        assert len(session.statements) == queries
+
+    def test_find_many_by_cpf_integer_key(self, session):
+        """Test batch lookups in dual mode find backfilled and legacy rows."""
+        session.get(CustomerModel, "1").cpf_numero = 11144477735
+        session.commit()
+        session.statements.clear()
+        repository = CustomerRepository(session_scope(session), "dual")
+
+        customers = repository.find_many_by_cpf(["11144477735", "52998224725"])
+
+        assert set(customers) == {"11144477735", "52998224725"}
+        assert len(session.statements) == 2
+
+    def test_string_mode_without_cpf_numero_column(self):
+        """Test that string mode works on tables not yet migrated."""
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE TABLE clientes (id VARCHAR(36) PRIMARY KEY, "
+                    "cpf VARCHAR(14), nome VARCHAR(100) NOT NULL, "
+                    "telefone VARCHAR(20), email VARCHAR(100), "
+                    "criado_em DATETIME NOT NULL, atualizado_em DATETIME NOT NULL)"
+                )
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO clientes (id, cpf, nome, criado_em, atualizado_em) "
+                    "VALUES ('1', '111.444.777-35', 'João da Silva', "
+                    "'2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+                )
+            )
+        session = sessionmaker(bind=engine)()
+        repository = CustomerRepository(session_scope(session))
+
+        try:
+            customer = repository.find_by_cpf("11144477735")
+            customers = repository.find_many_by_cpf(["11144477735"])
+        finally:
+            session.close()
+            engine.dispose()
+
+        assert customer.id == "1"
+        assert customer.cpf == "11144477735"
+        assert set(customers) == {"11144477735"}
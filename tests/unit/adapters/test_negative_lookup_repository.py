@@ -0,0 +1,139 @@
+"""Unit tests for NegativeLookupCustomerRepository."""
+
+import pytest
+
+from src.adapters.gateways.negative_lookup_repository import (
+    NegativeLookupCustomerRepository,
+)
+from src.application.use_cases.ports import CustomerLookupError
+from src.infrastructure.cache.bloom_filter import RefreshingBloomFilter
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class TestNegativeLookupCustomerRepository:
+    """Test suite for the negative lookup decorator."""
+
+    def test_recent_miss_is_served_from_memory(self, mock_customer_repository):
+        """Test that a repeated unknown CPF does not reach the database."""
+        mock_customer_repository.find_by_cpf.return_value = None
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=30)
+        )
+
+        assert repository.find_by_cpf("52998224725") is None
+        assert repository.find_by_cpf("529.982.247-25") is None
+
+        mock_customer_repository.find_by_cpf.assert_called_once_with("52998224725")
+        assert repository.miss_cache.hits == 1
+
+    def test_found_customer_passes_through(
+        self, mock_customer_repository, sample_customer
+    ):
+        """Test that found customers are returned and never cached as misses."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=30)
+        )
+
+        assert repository.find_by_cpf("11144477735") is sample_customer
+        assert len(repository.miss_cache) == 0
+
+    def test_bloom_filter_rejects_unknown_cpf(
+        self, mock_customer_repository, sample_customer
+    ):
+        """Test that CPFs absent from the Bloom filter skip the database."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        bloom = RefreshingBloomFilter(
+            loader=lambda: ["11144477735"], capacity=10, background=False
+        )
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, bloom_filter=bloom
+        )
+
+        assert repository.find_by_cpf("52998224725") is None
+        assert repository.find_by_cpf("11144477735") is sample_customer
+
+        mock_customer_repository.find_by_cpf.assert_called_once_with("11144477735")
+        assert repository.bloom_rejections == 1
+
+    def test_unavailable_bloom_filter_falls_through(self, mock_customer_repository):
+        """Test that lookups proceed to the database until the filter is built."""
+
+        def loader():
+            raise RuntimeError("db down")
+
+        mock_customer_repository.find_by_cpf.return_value = None
+        bloom = RefreshingBloomFilter(loader=loader, capacity=10, background=False)
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, bloom_filter=bloom
+        )
+
+        assert repository.find_by_cpf("52998224725") is None
+        mock_customer_repository.find_by_cpf.assert_called_once()
+
+    def test_find_many_skips_known_misses(
+        self, mock_customer_repository, sample_customer
+    ):
+        """Test that batch lookups exclude CPFs known to be missing."""
+        mock_customer_repository.find_many_by_cpf.return_value = {
+            sample_customer.cpf: sample_customer
+        }
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=30)
+        )
+
+        repository.find_many_by_cpf([sample_customer.cpf, "52998224725"])
+        repository.find_many_by_cpf([sample_customer.cpf, "52998224725"])
+
+        mock_customer_repository.find_many_by_cpf.assert_called_with(
+            [sample_customer.cpf]
+        )
+
+    def test_find_many_all_known_misses(self, mock_customer_repository):
+        """Test that a batch of known misses never reaches the repository."""
+        mock_customer_repository.find_by_cpf.return_value = None
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=30)
+        )
+        repository.find_by_cpf("52998224725")
+
+        assert repository.find_many_by_cpf(["52998224725"]) == {}
+        mock_customer_repository.find_many_by_cpf.assert_not_called()
+
+    def test_failed_lookup_is_not_cached(
+        self, mock_customer_repository, sample_customer
+    ):
+        """Test that a CPF looked up during an outage is found once it is over."""
+        mock_customer_repository.find_by_cpf.side_effect = [
+            CustomerLookupError("db down"),
+            sample_customer,
+        ]
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=30)
+        )
+
+        with pytest.raises(CustomerLookupError):
+            repository.find_by_cpf("11144477735")
+
+        assert repository.find_by_cpf("11144477735") is sample_customer
+        assert len(repository.miss_cache) == 0
+
+    def test_failed_batch_lookup_is_not_cached(
+        self, mock_customer_repository, sample_customer
+    ):
+        """Test that batch lookups during an outage cache no misses."""
+        mock_customer_repository.find_many_by_cpf.side_effect = [
+            CustomerLookupError("db down"),
+            {sample_customer.cpf: sample_customer},
+        ]
+        repository = NegativeLookupCustomerRepository(
+            mock_customer_repository, TTLCache(max_size=10, ttl_seconds=30)
+        )
+
+        with pytest.raises(CustomerLookupError):
+            repository.find_many_by_cpf([sample_customer.cpf, "52998224725"])
+        found = repository.find_many_by_cpf([sample_customer.cpf, "52998224725"])
+
+        assert found == {sample_customer.cpf: sample_customer}
+        assert mock_customer_repository.find_many_by_cpf.call_count == 2
+        assert len(repository.miss_cache) == 1
@@ -0,0 +1,324 @@
+"""Unit tests for ReadOnlyCustomerRepository."""
+
+import asyncio
+import pytest
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.adapters.gateways.readonly_customer_repository import (
+    AsyncReadOnlyCustomerRepository,
+    ReadOnlyCustomerRepository,
+)
+from src.application.use_cases.ports import CustomerLookupError
+from src.infrastructure.database.models import Base, CustomerModel
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite autocommit engine seeded with two customers."""
+    engine = create_engine("sqlite://", isolation_level="AUTOCOMMIT")
+    Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(
+            CustomerModel.__table__.insert(),
+            [
+                {
+                    "id": "1",
+                    "cpf": "111.444.777-35",
+                    "nome": "João da Silva",
+                    "email": "joao@example.com",
+                    "criado_em": datetime(2024, 1, 1),
+                    "atualizado_em": datetime(2024, 1, 1),
+                },
+                {
+                    "id": "2",
+                    "cpf": "52998224725",
+                    "nome": "Maria Santos",
+                    "email": None,
+                    "criado_em": datetime(2024, 1, 1),
+                    "atualizado_em": datetime(2024, 1, 1),
+                },
+            ],
+        )
+
+    engine.statements = []
+    engine.commits = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: engine.statements.append(statement),
+    )
+    event.listen(engine, "commit", lambda conn: engine.commits.append(conn))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(engine):
+    """Repository opening a connection per call."""
+    return ReadOnlyCustomerRepository(engine.connect)
+
+
+class TestReadOnlyCustomerRepository:
+    """Test suite for the read-only lookup path."""
+
+    @pytest.mark.parametrize(
+        "cpf, expected_id",
+        [
+            ("11144477735", "1"),
+            ("111.444.777-35", "1"),
+            ("52998224725", "2"),
+            ("39053344705", None),
+            ("123", None),
+        ],
+    )
+    def test_find_by_cpf(self, repository, cpf, expected_id):
+        """Test lookup parity with the ORM repository."""
+        customer = repository.find_by_cpf(cpf)
+
+        if expected_id is None:
+            assert customer is None
+        else:
+            assert customer.id == expected_id
+            assert customer.cpf == "".join(filter(str.isdigit, cpf))
+
+    def test_selects_only_identity_columns(self, engine, repository):
+        """Test that one bounded query reads only id, cpf and nome."""
+        customer = repository.find_by_cpf("11144477735")
+
+        assert customer.nome == "João da Silva"
+        assert customer.email is None
+        assert len(engine.statements) == 1
+        statement = engine.statements[0].lower()
+        assert "email" not in statement
+        assert "criado_em" not in statement
+        assert "limit" in statement
+
+    def test_no_commit_round_trip(self, engine, repository):
+        """Test that lookups never commit."""
+        repository.find_by_cpf("11144477735")
+
+        assert engine.commits == []
+
+    def test_database_error_raises_lookup_error(self):
+        """Test that connection failures are not reported as not found."""
+
+        @contextmanager
+        def failing_scope():
+            raise RuntimeError("db down")
+            yield
+
+        repository = ReadOnlyCustomerRepository(failing_scope)
+
+        with pytest.raises(CustomerLookupError):
+            repository.find_by_cpf("11144477735")
+
+    def test_iter_cpfs_yields_bare_digits(self, repository):
+        """Test streaming every stored CPF normalized to digits."""
+        assert sorted(repository.iter_cpfs(batch_size=1)) == [
+            "11144477735",
+            "52998224725",
+        ]
+
+    def test_find_many_by_cpf(self, engine, repository):
+        """Test that many CPFs are resolved with one query."""
+        customers = repository.find_many_by_cpf(
+            ["11144477735", "52998224725", "39053344705"]
+        )
+
+        assert set(customers) == {"11144477735", "52998224725"}
+        assert len(engine.statements) == 1
+
+    def test_find_many_by_cpf_without_valid_cpfs(self, engine, repository):
+        """Test that no query is issued for an empty lookup."""
+        assert repository.find_many_by_cpf([]) == {}
+        assert engine.statements == []
+
+    def test_find_many_by_cpf_database_error(self):
+        """Test that connection failures are not reported as no customers."""
+
+        @contextmanager
+        def failing_scope():
+            raise RuntimeError("db down")
+            yield
+
+        repository = ReadOnlyCustomerRepository(failing_scope)
+
+        with pytest.raises(CustomerLookupError):
+            repository.find_many_by_cpf(["11144477735"])
+
+
+class TestIntegerCpfKey:
+    """Test suite for lookups against clientes.cpf_numero."""
+
+    @pytest.fixture
+    def backfilled(self, engine):
+        """Only João's row has been backfilled."""
+        with engine.connect() as connection:
+            connection.execute(
+                CustomerModel.__table__.update()
+                .where(CustomerModel.id == "1")
+                .values(cpf_numero=11144477735)
+            )
+        engine.statements.clear()
+        return engine
+
+    def test_dual_mode_uses_integer_key(self, backfilled):
+        """Test that a backfilled row is found with one integer equality."""
+        repository = ReadOnlyCustomerRepository(backfilled.connect, "dual")
+
+        customer = repository.find_by_cpf("111.444.777-35")
+
+        assert customer.id == "1"
+        assert customer.cpf == "11144477735"
+        assert len(backfilled.statements) == 1
+        assert "cpf_numero =" in backfilled.statements[0]
+
+    def test_dual_mode_falls_back_to_text_column(self, backfilled):
+        """Test that rows not yet backfilled are still found."""
+        repository = ReadOnlyCustomerRepository(backfilled.connect, "dual")
+
+        assert repository.find_by_cpf("52998224725").id == "2"
+        assert len(backfilled.statements) == 2
+
+    def test_integer_mode_skips_text_column(self, backfilled):
+        """Test that the integer mode never queries clientes.cpf."""
+        repository = ReadOnlyCustomerRepository(backfilled.connect, "integer")
+
+        assert repository.find_by_cpf("11144477735").id == "1"
+        assert repository.find_by_cpf("52998224725") is None
+        assert len(backfilled.statements) == 2
+
+    def test_find_many_dual_mode(self, backfilled):
+        """Test batch lookup: integer keys first, text forms for the rest."""
+        repository = ReadOnlyCustomerRepository(backfilled.connect, "dual")
+
+        customers = repository.find_many_by_cpf(
+            ["11144477735", "52998224725", "39053344705"]
+        )
+
+        assert {cpf: c.id for cpf, c in customers.items()} == {
+            "11144477735": "1",
+            "52998224725": "2",
+        }
+        assert len(backfilled.statements) == 2
+
+    def test_find_many_integer_mode(self, backfilled):
+        """Test that the integer mode resolves a batch with one query."""
+        repository = ReadOnlyCustomerRepository(backfilled.connect, "integer")
+
+        customers = repository.find_many_by_cpf(["11144477735", "52998224725"])
+
+        assert list(customers) == ["11144477735"]
+        assert len(backfilled.statements) == 1
+
+    def test_unknown_mode_raises(self, engine):
+        """Test that a misconfigured key mode fails fast."""
+        with pytest.raises(ValueError, match="Unknown CPF key mode"):
+            ReadOnlyCustomerRepository(engine.connect, "bigint")
+
+
+class TestAsyncReadOnlyCustomerRepository:
+    """Test suite for the asyncio repository (aiosqlite stand-in)."""
+
+    @pytest.fixture
+    def database_url(self, tmp_path):
+        """SQLite file with the two customers, João's row backfilled."""
+        pytest.importorskip("aiosqlite")
+        path = tmp_path / "clientes.db"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                CustomerModel.__table__.insert(),
+                [
+                    {
+                        "id": "1",
+                        "cpf": "111.444.777-35",
+                        "cpf_numero": 11144477735,
+                        "nome": "João da Silva",
+                        "criado_em": datetime(2024, 1, 1),
+                        "atualizado_em": datetime(2024, 1, 1),
+                    },
+                    {
+                        "id": "2",
+                        "cpf": "52998224725",
+                        "cpf_numero": None,
+                        "nome": "Maria Santos",
+                        "criado_em": datetime(2024, 1, 1),
+                        "atualizado_em": datetime(2024, 1, 1),
+                    },
+                ],
+            )
+        engine.dispose()
+        return f"sqlite+aiosqlite:///{path}"
+
+    @staticmethod
+    def run(database_url, lookup, cpf_key_mode="string"):
+        """Run lookup(repository) on a fresh async engine."""
+
+        async def main():
+            engine = create_async_engine(database_url, isolation_level="AUTOCOMMIT")
+            try:
+                return await lookup(
+                    AsyncReadOnlyCustomerRepository(engine.connect, cpf_key_mode)
+                )
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    @pytest.mark.parametrize(
+        "cpf, expected_id",
+        [("11144477735", "1"), ("52998224725", "2"), ("39053344705", None)],
+    )
+    def test_find_by_cpf(self, database_url, cpf, expected_id):
+        """Test lookups against formatted and bare-digit rows."""
+        customer = self.run(database_url, lambda repo: repo.find_by_cpf(cpf))
+
+        assert (customer.id if customer else None) == expected_id
+
+    @pytest.mark.parametrize("mode", ["string", "dual", "integer"])
+    def test_find_many_by_cpf(self, database_url, mode):
+        """Test batch lookups in every CPF key mode."""
+        customers = self.run(
+            database_url,
+            lambda repo: repo.find_many_by_cpf(["11144477735", "52998224725", "1"]),
+            mode,
+        )
+
+        expected = {"11144477735": "1", "52998224725": "2"}
+        if mode == "integer":
+            expected = {"11144477735": "1"}
+        assert {cpf: c.id for cpf, c in customers.items()} == expected
+
+    def test_integer_mode_skips_text_column(self, database_url):
+        """Test that rows without cpf_numero are not found in integer mode."""
+        customer = self.run(
+            database_url, lambda repo: repo.find_by_cpf("52998224725"), "integer"
+        )
+
+        assert customer is None
+
+    def test_short_cpf_returns_none(self, database_url):
+        """Test that malformed CPFs never reach the database."""
+        assert self.run(database_url, lambda repo: repo.find_by_cpf("123")) is None
+        assert self.run(database_url, lambda repo: repo.find_many_by_cpf(["1"])) == {}
+
+    def test_database_errors_raise_lookup_error(self):
+        """Test that connection failures are not read as 'not found'."""
+
+        @asynccontextmanager
+        async def failing_scope():
+            raise RuntimeError("db down")
+            yield
+
+        repository = AsyncReadOnlyCustomerRepository(failing_scope)
+
+        with pytest.raises(CustomerLookupError):
+            asyncio.run(repository.find_by_cpf("11144477735"))
+        with pytest.raises(CustomerLookupError):
+            asyncio.run(repository.find_many_by_cpf(["11144477735"]))
@@ -0,0 +1,104 @@
+"""Unit tests for ResponseBuilder."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.adapters.controllers.response_builder import ResponseBuilder
+from src.infrastructure.serialization.json_encoder import get_json_encoder
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def encode(request):
+    """Each supported response body encoder."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    return get_json_encoder(request.param)
+
+
+class TestResponseBuilder:
+    """Test suite for precomputed API Gateway responses."""
+
+    def test_ok_matches_previous_format(self):
+        """Test that the default encoder matches json.dumps(ensure_ascii=False)."""
+        data = {"token": "t", "customer": {"id": "1", "name": "João da Silva"}}
+
+        response = ResponseBuilder().ok(data)
+
+        assert response == {
+            "statusCode": 200,
+            "headers": {
+                "Content-Type": "application/json",
+                "Access-Control-Allow-Origin": "*",
+            },
+            "body": json.dumps(data, ensure_ascii=False),
+        }
+
+    def test_ok_body(self, encode):
+        """Test that success bodies are encoded with the configured encoder."""
+        data = {"token": "t", "customer": {"id": "1", "name": "João da Silva"}}
+
+        response = ResponseBuilder(encode).ok(data)
+
+        assert response["statusCode"] == 200
+        assert response["body"] == encode(data)
+        assert json.loads(response["body"]) == data
+
+    @pytest.mark.parametrize(
+        "method, status_code", [("bad_request", 400), ("unauthorized", 401)]
+    )
+    def test_error_bodies(self, encode, method, status_code):
+        """Test error responses keep the {"error": message} body."""
+        response = getattr(ResponseBuilder(encode), method)("CPF inválido")
+
+        assert response["statusCode"] == status_code
+        assert response["body"] == encode({"error": "CPF inválido"})
+        assert json.loads(response["body"]) == {"error": "CPF inválido"}
+
+    def test_default_error_body_format(self):
+        """Test that the default encoder keeps the json.dumps error format."""
+        response = ResponseBuilder().unauthorized("CPF inválido")
+
+        assert response["body"] == '{"error": "CPF inválido"}'
+
+    def test_error_body_encoded_once(self):
+        """Test that repeated errors reuse the encoded body."""
+        encode = Mock(side_effect=json.dumps)
+        responses = ResponseBuilder(encode)
+        encode.reset_mock()
+
+        responses.unauthorized("Cliente não encontrado")
+        responses.unauthorized("Cliente não encontrado")
+
+        assert encode.call_count == 1
+
+    def test_error_cache_is_bounded(self, encode):
+        """Test that unexpected messages beyond the bound are not retained."""
+        responses = ResponseBuilder(encode, max_cached_errors=2)
+
+        for i in range(5):
+            assert json.loads(responses.bad_request(str(i))["body"]) == {
+                "error": str(i)
+            }
+
+        assert len(responses._error_bodies) == 2
+
+    def test_internal_error_hides_details(self, encode):
+        """Test the constant 500 body."""
+        response = ResponseBuilder(encode).internal_error()
+
+        assert response["statusCode"] == 500
+        assert json.loads(response["body"]) == {"error": "Erro interno do servidor"}
+
+    def test_responses_do_not_share_headers(self):
+        """Test that mutating one response leaves later ones untouched."""
+        responses = ResponseBuilder()
+
+        responses.unauthorized("x")["headers"]["Server-Timing"] = "db;dur=1"
+        preflight = responses.preflight()
+        preflight["headers"]["X-Test"] = "1"
+
+        assert "Server-Timing" not in responses.unauthorized("x")["headers"]
+        assert "X-Test" not in responses.preflight()["headers"]
+        assert preflight["statusCode"] == 204
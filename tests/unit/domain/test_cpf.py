@@ -69,3 +69,19 @@ class TestCPF:
         for cpf_str in valid_cpfs:
             cpf = CPF(cpf_str)
             assert cpf.clean() == cpf_str.replace(".", "").replace("-", "")
+
+    def test_to_int(self):
+        """Test integer key conversion."""
+        assert CPF("111.444.777-35").to_int() == 11144477735
+        assert CPF("000.000.001-91").to_int() == 191
+
+    def test_from_int_restores_leading_zeros(self):
+        """Test that from_int pads to 11 digits."""
+        assert CPF.from_int(191).clean() == "00000000191"
+        assert CPF.from_int(11144477735) == CPF("11144477735")
+
+    @pytest.mark.parametrize("number", [-1, 10**11, 11144477736])
+    def test_from_int_invalid(self, number):
+        """Test that out-of-range or invalid keys raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid CPF"):
+            CPF.from_int(number)
@@ -0,0 +1,130 @@
+"""Unit tests for bulk CPF validation."""
+
+import random
+
+import pytest
+
+from src.domain.value_objects import CPF, validate_cpfs
+from src.domain.value_objects import cpf_bulk
+
+
+def reference(value):
+    """Canonical form according to the CPF value object, or None."""
+    try:
+        return CPF(value).clean()
+    except (TypeError, ValueError):
+        return None
+
+
+def random_inputs(count, seed=1234):
+    """Mix of valid, near-valid, formatted and malformed CPF strings."""
+    rng = random.Random(seed)
+    alphabet = "0123456789.- /x٣٤۵"
+    values = []
+    for _ in range(count):
+        digits = "".join(rng.choice("0123456789") for _ in range(9))
+        numbers = list(map(int, digits))
+        for weights in (range(10, 1, -1), range(11, 1, -1)):
+            remainder = sum(a * b for a, b in zip(numbers, weights)) * 10 % 11
+            numbers.append(0 if remainder == 10 else remainder)
+        cpf = "".join(map(str, numbers))
+
+        kind = rng.randrange(5)
+        if kind == 0:
+            values.append(cpf)
+        elif kind == 1:
+            values.append(f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}")
+        elif kind == 2:
+            position = rng.randrange(11)
+            wrong = str((int(cpf[position]) + rng.randrange(1, 10)) % 10)
+            values.append(cpf[:position] + wrong + cpf[position + 1 :])
+        elif kind == 3:
+            values.append(cpf[: rng.randrange(12)])
+        else:
+            length = rng.randrange(16)
+            values.append("".join(rng.choice(alphabet) for _ in range(length)))
+    return values
+
+
+EDGE_CASES = [
+    "111.444.777-35",
+    "11144477735",
+    " 111 444 777 35 ",
+    "00000000000",
+    "111.111.111-11",
+    "",
+    "abc",
+    "111444777350",
+    "١١١٤٤٤٧٧٧٣٥",
+    "¹¹¹⁴⁴⁴⁷⁷⁷³⁵",
+    None,
+    11144477735,
+]
+
+BACKENDS = [
+    pytest.param(True, id="numpy"),
+    pytest.param(False, id="python"),
+]
+
+
+class TestValidateCpfs:
+    """Test suite for validate_cpfs."""
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_edge_cases_match_cpf(self, use_numpy):
+        """Test formatting, repeated digits, Unicode digits and non-strings."""
+        result = validate_cpfs(EDGE_CASES, use_numpy=use_numpy)
+
+        assert result.canonical == [reference(value) for value in EDGE_CASES]
+        assert list(result.mask) == [
+            reference(value) is not None for value in EDGE_CASES
+        ]
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_random_inputs_match_cpf(self, use_numpy):
+        """Test agreement with CPF over a large randomized sample."""
+        values = random_inputs(5000)
+
+        result = validate_cpfs(values, use_numpy=use_numpy)
+
+        assert result.canonical == [reference(value) for value in values]
+        assert result.valid_count == sum(
+            reference(value) is not None for value in values
+        )
+        assert len(result) == len(values)
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_empty_input(self, use_numpy):
+        """Test that an empty input gives an empty result."""
+        result = validate_cpfs(iter(()), use_numpy=use_numpy)
+
+        assert len(result) == 0
+        assert result.valid_count == 0
+
+    def test_accepts_numpy_arrays(self):
+        """Test that NumPy string arrays are accepted as input."""
+        np = pytest.importorskip("numpy")
+
+        result = validate_cpfs(np.array(["11144477735", "11144477736"]))
+
+        assert result.mask.tolist() == [True, False]
+        assert result.canonical == ["11144477735", None]
+
+    def test_numpy_is_loaded_on_first_use(self, monkeypatch):
+        """Test that NumPy is imported lazily and then reused."""
+        np = pytest.importorskip("numpy")
+        monkeypatch.setattr(cpf_bulk, "np", cpf_bulk._NOT_LOADED)
+
+        result = validate_cpfs(["11144477735"])
+
+        assert cpf_bulk.np is np
+        assert cpf_bulk.load_numpy() is np
+        assert result.mask.tolist() == [True]
+
+    def test_falls_back_without_numpy(self, monkeypatch):
+        """Test the pure-Python path when NumPy is not installed."""
+        monkeypatch.setattr(cpf_bulk, "np", None)
+
+        result = validate_cpfs(["11144477735", "123"])
+
+        assert result.mask == [True, False]
@@ -0,0 +1,135 @@
+"""Unit tests for BloomFilter and RefreshingBloomFilter."""
+
+import time
+
+import pytest
+
+from src.infrastructure.cache.bloom_filter import BloomFilter, RefreshingBloomFilter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBloomFilter:
+    """Test suite for BloomFilter."""
+
+    def test_added_items_are_always_found(self):
+        """Test that a Bloom filter has no false negatives."""
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        items = [f"{i:011d}" for i in range(1000)]
+
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+
+    def test_false_positive_rate_is_close_to_target(self):
+        """Test that unknown items are mostly rejected."""
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"known-{i}")
+
+        false_positives = sum(f"unknown-{i}" in bloom for i in range(10000))
+
+        assert false_positives / 10000 < 0.03
+
+    def test_max_bytes_caps_memory(self):
+        """Test that the memory budget bounds the bit array."""
+        bloom = BloomFilter(capacity=1_000_000, false_positive_rate=0.001, max_bytes=1024)
+
+        assert bloom.size_bytes == 1024
+
+    @pytest.mark.parametrize("capacity, rate", [(0, 0.01), (10, 0), (10, 1)])
+    def test_invalid_configuration_raises(self, capacity, rate):
+        """Test that invalid sizing parameters are rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, false_positive_rate=rate)
+
+
+class TestRefreshingBloomFilter:
+    """Test suite for RefreshingBloomFilter."""
+
+    def test_builds_on_first_lookup(self):
+        """Test that the filter is built lazily from the loader."""
+        bloom = RefreshingBloomFilter(
+            loader=lambda: ["11144477735"], capacity=10, background=False
+        )
+
+        assert bloom.ready is False
+        assert bloom.might_contain("11144477735") is True
+        assert bloom.might_contain("52998224725") is False
+        assert bloom.ready is True
+
+    def test_refreshes_when_stale(self):
+        """Test that a stale filter is rebuilt with newly known items."""
+        clock = FakeClock()
+        known = ["11144477735"]
+        bloom = RefreshingBloomFilter(
+            loader=lambda: list(known),
+            capacity=10,
+            refresh_seconds=60,
+            background=False,
+            clock=clock,
+        )
+        assert bloom.might_contain("52998224725") is False
+
+        known.append("52998224725")
+        clock.now = 30
+        assert bloom.might_contain("52998224725") is False
+
+        clock.now = 60
+        assert bloom.might_contain("52998224725") is True
+
+    def test_loader_failure_keeps_previous_filter(self):
+        """Test that a failed rebuild leaves the previous filter serving."""
+        clock = FakeClock()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            if len(calls) > 1:
+                raise RuntimeError("db down")
+            return ["11144477735"]
+
+        bloom = RefreshingBloomFilter(
+            loader=loader,
+            capacity=10,
+            refresh_seconds=60,
+            background=False,
+            clock=clock,
+        )
+        bloom.might_contain("11144477735")
+
+        clock.now = 60
+        assert bloom.might_contain("11144477735") is True
+        assert bloom.might_contain("11144477735") is True
+        assert len(calls) == 2
+
+    def test_unavailable_filter_returns_none(self):
+        """Test that lookups before a successful build are inconclusive."""
+
+        def loader():
+            raise RuntimeError("db down")
+
+        bloom = RefreshingBloomFilter(loader=loader, capacity=10, background=False)
+
+        assert bloom.might_contain("11144477735") is None
+
+    def test_background_refresh(self):
+        """Test that the rebuild can run on a background thread."""
+        bloom = RefreshingBloomFilter(loader=lambda: ["11144477735"], capacity=10)
+
+        bloom.might_contain("11144477735")
+        deadline = time.monotonic() + 5
+        while not bloom.ready and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert bloom.might_contain("11144477735") is True
@@ -0,0 +1,119 @@
+"""Unit tests for DatabaseConnection."""
+
+import asyncio
+import pytest
+from unittest.mock import patch, Mock
+
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.infrastructure.database.connection import DatabaseConnection
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Settings pointing at a SQLite file."""
+    settings = Mock()
+    settings.database_url = f"sqlite:///{tmp_path / 'connection.db'}"
+    settings.database_echo = False
+    settings.database_pool_mode = "null"
+    settings.database_pool_max_age_seconds = 900
+    settings.database_ping_after_idle_seconds = 30
+    settings.database_async_url = None
+
+    DatabaseConnection.dispose()
+    with patch(
+        "src.infrastructure.database.connection.get_settings", return_value=settings
+    ):
+        yield settings
+    DatabaseConnection.dispose()
+
+
+class TestDatabaseConnection:
+    """Test suite for DatabaseConnection."""
+
+    def test_initialize_uses_null_pool_by_default(self, settings):
+        """Test that null pool mode keeps the previous behavior."""
+        DatabaseConnection.initialize()
+
+        assert isinstance(DatabaseConnection._engine.pool, NullPool)
+
+    def test_initialize_lambda_pool_mode(self, settings):
+        """Test that lambda pool mode keeps a persistent pool."""
+        settings.database_pool_mode = "lambda"
+
+        DatabaseConnection.initialize()
+
+        assert isinstance(DatabaseConnection._engine.pool, QueuePool)
+
+    def test_initialize_is_idempotent(self, settings):
+        """Test that the engine is created only once."""
+        DatabaseConnection.initialize()
+        engine = DatabaseConnection._engine
+
+        DatabaseConnection.initialize()
+
+        assert DatabaseConnection._engine is engine
+
+    def test_get_session_initializes_lazily(self, settings):
+        """Test that get_session creates the engine on first use."""
+        with DatabaseConnection.get_session() as session:
+            assert session.execute(text("SELECT 1")).scalar() == 1
+
+    def test_get_session_rolls_back_on_error(self, settings):
+        """Test that errors inside the session scope propagate."""
+        with pytest.raises(RuntimeError):
+            with DatabaseConnection.get_session():
+                raise RuntimeError("boom")
+
+    def test_dispose_resets_engine(self, settings):
+        """Test that dispose forces re-initialization."""
+        DatabaseConnection.initialize()
+
+        DatabaseConnection.dispose()
+
+        assert DatabaseConnection._engine is None
+
+    def test_get_readonly_connection_uses_autocommit(self, settings):
+        """Test that the read-only engine runs in autocommit mode."""
+        with DatabaseConnection.get_readonly_connection() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+            # pysqlite autocommit mode
+            assert connection.connection.dbapi_connection.isolation_level is None
+
+        assert DatabaseConnection._engine is None
+
+    def test_get_async_connection_uses_async_driver(self, settings):
+        """Test that the async engine derives its URL and runs queries."""
+        pytest.importorskip("aiosqlite")
+
+        async def query():
+            async with DatabaseConnection.get_async_connection() as connection:
+                value = (await connection.execute(text("SELECT 1"))).scalar()
+            url = DatabaseConnection._async_engine.url
+            await DatabaseConnection.dispose_async()
+            return value, url
+
+        value, url = asyncio.run(query())
+
+        assert value == 1
+        assert url.drivername == "sqlite+aiosqlite"
+        assert DatabaseConnection._async_engine is None
+
+    def test_async_url_override(self, settings, tmp_path):
+        """Test that DATABASE_ASYNC_URL takes precedence."""
+        pytest.importorskip("aiosqlite")
+        settings.database_async_url = f"sqlite+aiosqlite:///{tmp_path / 'a.db'}"
+
+        DatabaseConnection.initialize_async()
+
+        assert DatabaseConnection._async_engine.url.database.endswith("a.db")
+
+    def test_dispose_drops_async_engine(self, settings):
+        """Test that the sync dispose also forgets the async engine."""
+        pytest.importorskip("aiosqlite")
+        DatabaseConnection.initialize_async()
+
+        DatabaseConnection.dispose()
+
+        assert DatabaseConnection._async_engine is None
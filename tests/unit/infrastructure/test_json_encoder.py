@@ -0,0 +1,55 @@
+"""Unit tests for JSON encoder selection."""
+
+import builtins
+import json
+
+import pytest
+
+from src.infrastructure.serialization.json_encoder import (
+    get_json_encoder,
+    stdlib_encoder,
+)
+
+DATA = {"token": "abc", "customer": {"id": "1", "name": "João da Silva"}}
+
+
+class TestJsonEncoder:
+    """Test suite for the pluggable response encoder."""
+
+    def test_stdlib_is_byte_identical_to_json_dumps(self):
+        """Test the stdlib encoder output format."""
+        assert stdlib_encoder()(DATA) == json.dumps(DATA, ensure_ascii=False)
+
+    @pytest.mark.parametrize("name", ["auto", "orjson", "stdlib"])
+    def test_encoders_produce_equivalent_json(self, name):
+        """Test that every encoder yields the same document as a str."""
+        if name == "orjson":
+            pytest.importorskip("orjson")
+
+        body = get_json_encoder(name)(DATA)
+
+        assert isinstance(body, str)
+        assert "João" in body
+        assert json.loads(body) == DATA
+
+    def test_auto_falls_back_without_orjson(self, monkeypatch):
+        """Test that auto uses the stdlib when orjson is not installed."""
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "orjson":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+
+        assert get_json_encoder("auto")(DATA) == json.dumps(DATA, ensure_ascii=False)
+
+    def test_default_is_stdlib(self):
+        """Test that orjson is opt-in even when it is installed."""
+        assert get_json_encoder()(DATA) == json.dumps(DATA, ensure_ascii=False)
+
+    def test_unknown_encoder_raises(self):
+        """Test that a misconfigured encoder name fails fast."""
+        with pytest.raises(ValueError, match="Unknown JSON encoder"):
+            get_json_encoder("ujson")
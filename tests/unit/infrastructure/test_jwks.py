@@ -0,0 +1,45 @@
+"""Unit tests for JWKS helpers."""
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from src.infrastructure.security.jwks import jwk_thumbprint, public_jwk
+
+
+class TestJWKS:
+    """Test suite for public JWK construction and thumbprints."""
+
+    def test_es256_public_jwk(self):
+        """Test EC P-256 JWK members."""
+        key = ec.generate_private_key(ec.SECP256R1())
+
+        jwk = public_jwk(key.public_key(), "ES256")
+
+        assert jwk["kty"] == "EC"
+        assert jwk["crv"] == "P-256"
+        assert {"x", "y"} <= set(jwk)
+
+    def test_eddsa_public_jwk(self):
+        """Test Ed25519 JWK members."""
+        key = ed25519.Ed25519PrivateKey.generate()
+
+        jwk = public_jwk(key.public_key(), "EdDSA")
+
+        assert jwk["kty"] == "OKP"
+        assert jwk["crv"] == "Ed25519"
+
+    def test_unsupported_algorithm_raises(self):
+        """Test that only ES256 and EdDSA keys are published."""
+        key = ed25519.Ed25519PrivateKey.generate()
+
+        with pytest.raises(ValueError):
+            public_jwk(key.public_key(), "HS256")
+
+    def test_thumbprint_ignores_optional_members(self):
+        """Test that the RFC 7638 thumbprint only uses required members."""
+        jwk = {"kty": "OKP", "crv": "Ed25519", "x": "abc"}
+
+        assert jwk_thumbprint(jwk) == jwk_thumbprint(
+            {**jwk, "use": "sig", "alg": "EdDSA"}
+        )
+        assert jwk_thumbprint(jwk) != jwk_thumbprint({**jwk, "x": "abd"})
@@ -0,0 +1,69 @@
+"""Unit tests for HMACSigner."""
+
+import jwt
+import pytest
+
+from src.infrastructure.security.jws_signer import HMACSigner
+
+
+PAYLOAD = {
+    "sub": "550e8400-e29b-41d4-a716-446655440000",
+    "cpf": "11144477735",
+    "role": "client",
+    "aud": "api-client",
+    "trace_id": "4b1c3a0e-7f8a-4c55-9a2e-0d6f1a1d2c3b",
+    "iat": 1700000000,
+    "exp": 1700003600,
+    "iss": "serverless-auth",
+    "nome": "João",
+}
+
+
+class TestHMACSigner:
+    """Test suite for the precomputed HMAC JWS signer."""
+
+    @pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+    def test_tokens_are_byte_identical_to_pyjwt(self, algorithm):
+        """Test that signed tokens match jwt.encode exactly."""
+        signer = HMACSigner("test-secret", algorithm)
+
+        assert signer.sign(PAYLOAD) == jwt.encode(
+            PAYLOAD, "test-secret", algorithm=algorithm
+        )
+
+    def test_extra_headers_match_pyjwt(self):
+        """Test that extra headers are serialized like PyJWT (sorted)."""
+        signer = HMACSigner("test-secret", headers={"kid": "key-1"})
+
+        assert signer.sign(PAYLOAD) == jwt.encode(
+            PAYLOAD, "test-secret", algorithm="HS256", headers={"kid": "key-1"}
+        )
+
+    def test_signer_is_reusable(self):
+        """Test that the precomputed HMAC state is not consumed by signing."""
+        signer = HMACSigner("test-secret")
+
+        first = signer.sign(PAYLOAD)
+        second = signer.sign(PAYLOAD)
+
+        assert first == second
+        claims = jwt.decode(
+            second,
+            "test-secret",
+            algorithms=["HS256"],
+            audience="api-client",
+            options={"verify_exp": False},
+        )
+        assert claims["cpf"] == "11144477735"
+
+    def test_unsupported_algorithm_raises(self):
+        """Test that non-HMAC algorithms are rejected."""
+        assert HMACSigner.supports("ES256") is False
+
+        with pytest.raises(ValueError, match="Unsupported HMAC algorithm"):
+            HMACSigner("test-secret", "ES256")
+
+    def test_pem_like_secret_is_rejected(self):
+        """Test that the key is validated like PyJWT does."""
+        with pytest.raises(jwt.InvalidKeyError):
+            HMACSigner("-----BEGIN PUBLIC KEY-----\nabc\n-----END PUBLIC KEY-----")
@@ -1,11 +1,17 @@
 """Unit tests for JWT Token Generator."""
 
+import json
+import time
+
 import pytest
 import jwt
 from datetime import datetime, timedelta
 from unittest.mock import patch, Mock
 
+from src.infrastructure.cache.ttl_cache import TTLCache
 from src.infrastructure.security.jwt_service import JWTTokenGenerator
+from src.infrastructure.security.keyring import Keyring
+from tests.unit.infrastructure.test_ttl_cache import FakeClock
 
 
 class TestJWTTokenGenerator:
@@ -170,3 +176,376 @@ class TestJWTTokenGenerator:
         # Should be approximately 120 minutes
         delta = exp - iat
         assert 119 <= delta.total_seconds() / 60 <= 121
+
+    @patch("src.infrastructure.security.jwt_service.uuid.uuid4")
+    @patch("src.infrastructure.security.jwt_service.time.time")
+    @patch("src.infrastructure.security.jwt_service.get_settings")
+    def test_generated_token_is_byte_identical_to_pyjwt(
+        self, mock_get_settings, mock_time, mock_uuid4
+    ):
+        """Test that the fast signing path matches generic jwt.encode."""
+        # Arrange
+        mock_settings = Mock()
+        mock_settings.jwt_secret = "test-secret"
+        mock_settings.jwt_algorithm = "HS256"
+        mock_settings.jwt_issuer = "test-issuer"
+        mock_get_settings.return_value = mock_settings
+        mock_time.return_value = 1700000000.75
+        mock_uuid4.return_value = "4b1c3a0e-7f8a-4c55-9a2e-0d6f1a1d2c3b"
+
+        token_generator = JWTTokenGenerator()
+
+        # Act
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        # Assert
+        expected = jwt.encode(
+            {
+                "sub": "1",
+                "cpf": "12345678901",
+                "role": "client",
+                "aud": "api-client",
+                "trace_id": "4b1c3a0e-7f8a-4c55-9a2e-0d6f1a1d2c3b",
+                "iat": datetime.utcfromtimestamp(1700000000.75),
+                "exp": datetime.utcfromtimestamp(1700000000.75) + timedelta(hours=1),
+                "iss": "test-issuer",
+            },
+            "test-secret",
+            algorithm="HS256",
+        )
+        assert token == expected
+
+
+def private_key_pem(algorithm):
+    """Generate an unencrypted PEM private key for the algorithm."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    if algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+class TestAsymmetricJWTTokenGenerator:
+    """Test suite for ES256/EdDSA signing and the published JWKS."""
+
+    @pytest.fixture(params=["ES256", "EdDSA"])
+    def settings(self, request):
+        mock_settings = Mock()
+        mock_settings.jwt_secret = ""
+        mock_settings.jwt_algorithm = request.param
+        mock_settings.jwt_issuer = "test-issuer"
+        mock_settings.jwt_private_key = private_key_pem(request.param)
+        mock_settings.jwt_key_id = None
+        with patch(
+            "src.infrastructure.security.jwt_service.get_settings",
+            return_value=mock_settings,
+        ):
+            yield mock_settings
+
+    def test_generate_and_validate(self, settings):
+        """Test that asymmetric tokens round-trip through validate."""
+        token_generator = JWTTokenGenerator()
+
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        header = jwt.get_unverified_header(token)
+        assert header["alg"] == settings.jwt_algorithm
+        assert header["kid"] == token_generator.jwks()["keys"][0]["kid"]
+        assert token_generator.validate(token)["cpf"] == "12345678901"
+
+    def test_token_verifies_offline_with_published_jwks(self, settings):
+        """Test that downstream services can verify using only the JWKS."""
+        token_generator = JWTTokenGenerator()
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        jwk_set = jwt.PyJWKSet.from_dict(token_generator.jwks())
+        signing_key = jwk_set[jwt.get_unverified_header(token)["kid"]]
+        payload = jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=[settings.jwt_algorithm],
+            audience="api-client",
+            issuer="test-issuer",
+        )
+
+        assert payload["sub"] == "1"
+
+    def test_jwks_has_no_private_material(self, settings):
+        """Test that the JWKS only contains public key members."""
+        jwk = JWTTokenGenerator().jwks()["keys"][0]
+
+        assert "d" not in jwk
+        assert jwk["use"] == "sig"
+        assert jwk["alg"] == settings.jwt_algorithm
+
+    def test_configured_key_id(self, settings):
+        """Test that JWT_KEY_ID overrides the thumbprint kid."""
+        settings.jwt_key_id = "2025-01"
+        token_generator = JWTTokenGenerator()
+
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        assert jwt.get_unverified_header(token)["kid"] == "2025-01"
+
+    @patch("src.infrastructure.security.jwt_service.get_settings")
+    def test_hmac_jwks_is_empty(self, mock_get_settings, settings):
+        """Test that shared secrets are never published."""
+        mock_settings = Mock()
+        mock_settings.jwt_secret = "test-secret"
+        mock_settings.jwt_algorithm = "HS256"
+        mock_get_settings.return_value = mock_settings
+
+        assert JWTTokenGenerator().jwks() == {"keys": []}
+
+
+class TestVerifiedTokenCache:
+    """Test suite for the verified-token cache in validate."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def token_generator(self, clock):
+        mock_settings = Mock()
+        mock_settings.jwt_secret = "test-secret"
+        mock_settings.jwt_algorithm = "HS256"
+        mock_settings.jwt_issuer = "test-issuer"
+        with patch(
+            "src.infrastructure.security.jwt_service.get_settings",
+            return_value=mock_settings,
+        ):
+            yield JWTTokenGenerator(
+                token_cache=TTLCache(max_size=8, ttl_seconds=300, clock=clock),
+                failure_ttl_seconds=5,
+            )
+
+    def test_repeat_validation_skips_verification(self, token_generator):
+        """Test that a cached token is not decoded again."""
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        with patch(
+            "src.infrastructure.security.jwt_service.jwt.decode", wraps=jwt.decode
+        ) as decode:
+            first = token_generator.validate(token)
+            second = token_generator.validate(token)
+
+        assert decode.call_count == 1
+        assert first == second
+        assert token_generator.token_cache.hits == 1
+        assert token_generator.token_cache.misses == 1
+
+    def test_returns_copies(self, token_generator):
+        """Test that callers cannot mutate cached claims."""
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        token_generator.validate(token)["cpf"] = "tampered"
+
+        assert token_generator.validate(token)["cpf"] == "12345678901"
+
+    def test_entry_never_outlives_token_expiration(self, token_generator, clock):
+        """Test that the cache TTL is clamped to the token's exp."""
+        token = token_generator.generate(
+            customer_id=1, cpf="12345678901", expiration_minutes=1
+        )
+        token_generator.validate(token)
+
+        clock.now = 61
+
+        with patch(
+            "src.infrastructure.security.jwt_service.jwt.decode",
+            side_effect=jwt.ExpiredSignatureError,
+        ):
+            with pytest.raises(ValueError, match="expirado"):
+                token_generator.validate(token)
+
+    def test_failures_cached_for_short_window(self, token_generator, clock):
+        """Test that rejections are remembered only for failure_ttl_seconds."""
+        with patch(
+            "src.infrastructure.security.jwt_service.jwt.decode", wraps=jwt.decode
+        ) as decode:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="inválido"):
+                    token_generator.validate("not-a-token")
+            assert decode.call_count == 1
+
+            clock.now = 6
+            with pytest.raises(ValueError):
+                token_generator.validate("not-a-token")
+            assert decode.call_count == 2
+
+    @patch("src.infrastructure.security.jwt_service.get_settings")
+    def test_failures_not_cached_when_disabled(self, mock_get_settings):
+        """Test that failure_ttl_seconds=0 re-verifies every rejection."""
+        mock_settings = Mock()
+        mock_settings.jwt_secret = "test-secret"
+        mock_settings.jwt_algorithm = "HS256"
+        mock_get_settings.return_value = mock_settings
+        cache = TTLCache(max_size=8, ttl_seconds=300)
+        token_generator = JWTTokenGenerator(token_cache=cache)
+
+        with pytest.raises(ValueError):
+            token_generator.validate("not-a-token")
+
+        assert len(cache) == 0
+
+
+class TestRefreshTokens:
+    """Test suite for refresh token signing and validation."""
+
+    @pytest.fixture
+    def token_generator(self):
+        mock_settings = Mock()
+        mock_settings.jwt_secret = "test-secret"
+        mock_settings.jwt_algorithm = "HS256"
+        mock_settings.jwt_issuer = "test-issuer"
+        with patch(
+            "src.infrastructure.security.jwt_service.get_settings",
+            return_value=mock_settings,
+        ):
+            yield JWTTokenGenerator()
+
+    def refresh_token(self, token_generator, expires_in=3600):
+        now = int(time.time())
+        return token_generator.generate_refresh(
+            customer_id="1",
+            cpf="12345678901",
+            customer_name="João da Silva",
+            auth_time=now - 60,
+            expires_at=now + expires_in,
+        )
+
+    def test_round_trip(self, token_generator):
+        """Test that refresh claims carry what is needed to re-issue."""
+        claims = token_generator.validate_refresh(self.refresh_token(token_generator))
+
+        assert claims["aud"] == "auth-refresh"
+        assert claims["name"] == "João da Silva"
+        assert claims["cpf"] == "12345678901"
+        assert len(claims["jti"]) == 32
+
+    def test_each_refresh_token_has_unique_id(self, token_generator):
+        """Test that jti differs between tokens (replay detection key)."""
+        first = token_generator.validate_refresh(self.refresh_token(token_generator))
+        second = token_generator.validate_refresh(self.refresh_token(token_generator))
+
+        assert first["jti"] != second["jti"]
+
+    def test_audiences_are_not_interchangeable(self, token_generator):
+        """Test that access and refresh tokens are only valid for their use."""
+        refresh_token = self.refresh_token(token_generator)
+        access_token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        with pytest.raises(ValueError, match="inválido"):
+            token_generator.validate(refresh_token)
+        with pytest.raises(ValueError, match="inválido"):
+            token_generator.validate_refresh(access_token)
+
+    def test_expired_refresh_token(self, token_generator):
+        """Test that expired refresh tokens are rejected."""
+        token = self.refresh_token(token_generator, expires_in=-10)
+
+        with pytest.raises(ValueError, match="expirado"):
+            token_generator.validate_refresh(token)
+
+
+class TestKeyringJWTTokenGenerator:
+    """Test suite for signing and verification through a keyring."""
+
+    @pytest.fixture
+    def source(self):
+        return Mock(
+            return_value=json.dumps(
+                {"signing_kid": "k1", "keys": [{"kid": "k1", "secret": "secret-1"}]}
+            )
+        )
+
+    @pytest.fixture
+    def token_generator(self, source):
+        mock_settings = Mock()
+        mock_settings.jwt_secret = "ignored"
+        mock_settings.jwt_algorithm = "HS256"
+        mock_settings.jwt_issuer = "test-issuer"
+        with patch(
+            "src.infrastructure.security.jwt_service.get_settings",
+            return_value=mock_settings,
+        ):
+            yield JWTTokenGenerator(
+                keyring=Keyring(source, refresh_seconds=0, grace_seconds=3600)
+            )
+
+    def rotate(self, source, *keys, signing_kid):
+        source.return_value = json.dumps(
+            {"signing_kid": signing_kid, "keys": [dict(key) for key in keys]}
+        )
+
+    def test_tokens_carry_signing_kid(self, token_generator):
+        """Test that tokens are signed by the keyring signing key."""
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        assert jwt.get_unverified_header(token)["kid"] == "k1"
+        assert token_generator.validate(token)["sub"] == "1"
+
+    def test_old_tokens_verify_after_rotation(self, token_generator, source):
+        """Test that tokens signed before a rotation still verify."""
+        old_token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        self.rotate(source, {"kid": "k2", "secret": "secret-2"}, signing_kid="k2")
+        new_token = token_generator.generate(customer_id=2, cpf="12345678901")
+
+        assert jwt.get_unverified_header(new_token)["kid"] == "k2"
+        assert token_generator.validate(old_token)["sub"] == "1"
+        assert token_generator.validate(new_token)["sub"] == "2"
+
+    def test_retired_key_is_rejected(self, token_generator, source):
+        """Test that tokens of a key past verify_until are rejected."""
+        token = token_generator.generate(customer_id=1, cpf="12345678901")
+
+        self.rotate(
+            source,
+            {"kid": "k1", "secret": "secret-1", "verify_until": 1},
+            {"kid": "k2", "secret": "secret-2"},
+            signing_kid="k2",
+        )
+
+        with pytest.raises(ValueError, match="Unknown signing key: k1"):
+            token_generator.validate(token)
+
+    def test_token_without_kid_uses_signing_key(self, token_generator):
+        """Test that kid-less tokens (pre-keyring) check the signing key."""
+        payload = {"sub": "1", "aud": "api-client", "iss": "test-issuer"}
+        token = jwt.encode(payload, "secret-1", algorithm="HS256")
+
+        assert token_generator.validate(token)["sub"] == "1"
+
+    def test_algorithm_is_pinned_per_key(self, token_generator):
+        """Test that a token cannot pick another algorithm for a kid."""
+        payload = {"sub": "1", "aud": "api-client", "iss": "test-issuer"}
+        token = jwt.encode(
+            payload, "secret-1", algorithm="HS512", headers={"kid": "k1"}
+        )
+
+        with pytest.raises(ValueError, match="inválido"):
+            token_generator.validate(token)
+
+    def test_key_version_and_jwks(self, token_generator, source):
+        """Test that key_version follows reloads and JWKS comes from the ring."""
+        assert token_generator.key_version == 1
+        assert token_generator.jwks() == {"keys": []}
+
+        self.rotate(
+            source,
+            {"kid": "ec", "alg": "ES256", "private_key": private_key_pem("ES256")},
+            signing_kid="ec",
+        )
+
+        assert token_generator.key_version == 2
+        assert [key["kid"] for key in token_generator.jwks()["keys"]] == ["ec"]
@@ -0,0 +1,341 @@
+"""Unit tests for the hot-rotated JWT keyring."""
+
+import json
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.infrastructure.security.keyring import (
+    FileKeySource,
+    Keyring,
+    ParameterStoreKeySource,
+    build_keyring,
+    parse_keyring,
+)
+from tests.unit.infrastructure.test_jwt_service import private_key_pem
+from tests.unit.infrastructure.test_ttl_cache import FakeClock
+
+
+def document(signing_kid, *keys):
+    """Keyring JSON with HMAC keys given as kid or (kid, extra members)."""
+    entries = []
+    for key in keys:
+        kid, extra = key if isinstance(key, tuple) else (key, {})
+        entries.append({"kid": kid, "secret": f"secret-{kid}", **extra})
+    return json.dumps({"signing_kid": signing_kid, "keys": entries})
+
+
+class MutableSource:
+    """Keyring source whose document the test replaces."""
+
+    def __init__(self, text):
+        self.text = text
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        if isinstance(self.text, Exception):
+            raise self.text
+        return self.text
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def wall_clock():
+    wall_clock = FakeClock()
+    wall_clock.now = 1_000_000.0
+    return wall_clock
+
+
+@pytest.fixture
+def source():
+    return MutableSource(document("k1", "k1"))
+
+
+@pytest.fixture
+def keyring(source, clock, wall_clock):
+    return Keyring(
+        source,
+        refresh_seconds=60,
+        grace_seconds=3600,
+        clock=clock,
+        wall_clock=wall_clock,
+    )
+
+
+class TestParseKeyring:
+    """Test suite for keyring document parsing."""
+
+    def test_hmac_and_asymmetric_keys(self):
+        """Test that every key gets a verification key and signers as needed."""
+        signing_kid, keys = parse_keyring(
+            json.dumps(
+                {
+                    "signing_kid": "ec",
+                    "keys": [
+                        {"kid": "hs", "secret": "s", "verify_until": 5},
+                        {
+                            "kid": "ec",
+                            "alg": "ES256",
+                            "private_key": private_key_pem("ES256"),
+                        },
+                    ],
+                }
+            )
+        )
+
+        assert signing_kid == "ec"
+        assert keys["hs"].algorithm == "HS256"
+        assert keys["hs"].jwk is None
+        assert keys["hs"].verify_until == 5
+        assert keys["ec"].signer is not None
+        assert keys["ec"].jwk["kid"] == "ec"
+        assert "d" not in keys["ec"].jwk
+
+    def test_public_key_only_verifies(self):
+        """Test that public_key entries are verify-only."""
+        from cryptography.hazmat.primitives import serialization
+        from src.infrastructure.security.jwks import load_private_key
+
+        public_pem = (
+            load_private_key(private_key_pem("EdDSA"))
+            .public_key()
+            .public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode()
+        )
+
+        _, keys = parse_keyring(
+            json.dumps(
+                {
+                    "signing_kid": "k1",
+                    "keys": [
+                        {"kid": "k1", "secret": "s"},
+                        {"kid": "old", "alg": "EdDSA", "public_key": public_pem},
+                    ],
+                }
+            )
+        )
+
+        assert keys["old"].signer is None
+        assert keys["old"].jwk["crv"] == "Ed25519"
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("not json", "Expecting value"),
+            (document("missing", "k1"), "No signing key"),
+            (document("k1", "k1", "k1"), "Duplicate keyring kid"),
+            (document("k1", ("k1", {"secret": ""})), "has no secret"),
+            (document("k1", ("k1", {"alg": "RS256"})), "Unsupported"),
+            (document("k1", ("k1", {"alg": "ES256"})), "no private_key"),
+            (json.dumps({"signing_kid": "k1", "keys": [{"secret": "s"}]}), "kid"),
+        ],
+    )
+    def test_invalid_documents(self, text, message):
+        """Test that malformed documents are rejected with ValueError."""
+        with pytest.raises(ValueError, match=message):
+            parse_keyring(text)
+
+
+class TestKeyring:
+    """Test suite for Keyring reloads and grace periods."""
+
+    def test_initial_load_failure_raises(self):
+        """Test that a keyring never starts without keys."""
+        with pytest.raises(ValueError):
+            Keyring(MutableSource(document("missing")))
+
+    def test_reload_waits_for_ttl(self, keyring, source, clock):
+        """Test that the source is read again only after refresh_seconds."""
+        source.text = document("k2", "k1", "k2")
+
+        clock.now = 59
+        assert keyring.signing_key().kid == "k1"
+        clock.now = 60
+        assert keyring.signing_key().kid == "k2"
+        assert source.reads == 2
+        assert keyring.version == 2
+
+    def test_background_refresh_keeps_serving_current_keys(self, source, clock):
+        """Test that a stale read runs off the request path, one at a time."""
+        keyring = Keyring(
+            source, refresh_seconds=60, clock=clock, background_refresh=True
+        )
+        release = threading.Event()
+        read_started = threading.Event()
+
+        def slow_source():
+            read_started.set()
+            release.wait(5)
+            return document("k2", "k1", "k2")
+
+        keyring._source = slow_source
+        clock.now = 60
+
+        assert keyring.signing_key().kid == "k1"
+        assert read_started.wait(5)
+        clock.now = 120
+        assert keyring.signing_key().kid == "k1"
+
+        release.set()
+        keyring._reload_thread.join(5)
+
+        assert keyring.signing_key().kid == "k2"
+        assert keyring.version == 2
+
+    def test_background_refresh_failure_keeps_keys(self, source, clock):
+        """Test that a failed background read keeps keys and retries later."""
+        keyring = Keyring(
+            source, refresh_seconds=60, clock=clock, background_refresh=True
+        )
+        source.text = OSError("unreadable")
+        clock.now = 60
+
+        assert keyring.signing_key().kid == "k1"
+        keyring._reload_thread.join(5)
+        source.text = document("k2", "k1", "k2")
+        clock.now = 120
+        keyring.signing_key()
+        keyring._reload_thread.join(5)
+
+        assert keyring.signing_key().kid == "k2"
+        assert source.reads == 3
+
+    def test_unchanged_document_is_not_reparsed(self, keyring, clock):
+        """Test that a reload with the same document keeps the version."""
+        clock.now = 60
+
+        assert keyring.reload() is False
+        assert keyring.version == 1
+
+    def test_failed_reload_keeps_keys(self, keyring, source, clock):
+        """Test that source errors and bad documents keep current keys."""
+        for failure in (OSError("unreadable"), document("missing", "k1")):
+            source.text = failure
+            clock.now += 60
+
+            assert keyring.signing_key().kid == "k1"
+            assert keyring.version == 1
+
+    def test_dropped_key_verifies_during_grace(
+        self, keyring, source, clock, wall_clock
+    ):
+        """Test that keys removed from the source survive for grace_seconds."""
+        source.text = document("k2", "k2")
+        keyring.reload()
+
+        assert keyring.verification_key("k1").kid == "k1"
+        wall_clock.now += 3600
+        assert keyring.verification_key("k1") is None
+        assert keyring.verification_key("k2").kid == "k2"
+
+    def test_grace_is_not_extended_by_later_reloads(self, keyring, source, wall_clock):
+        """Test that a retained key keeps its original deadline."""
+        source.text = document("k2", "k2")
+        keyring.reload()
+        wall_clock.now += 1800
+        source.text = document("k3", "k2", "k3")
+        keyring.reload()
+
+        wall_clock.now += 1800
+        assert keyring.verification_key("k1") is None
+
+    def test_verify_until_retires_key(self, keyring, source, wall_clock):
+        """Test that verify_until bounds verification even within the source."""
+        until = wall_clock.now + 10
+        source.text = document("k2", ("k1", {"verify_until": until}), "k2")
+        keyring.reload()
+
+        assert keyring.verification_key("k1") is not None
+        wall_clock.now = until
+        assert keyring.verification_key("k1") is None
+
+    def test_unknown_kid(self, keyring):
+        """Test that unknown kids have no verification key."""
+        assert keyring.verification_key("nope") is None
+
+    def test_jwks_lists_verifying_asymmetric_keys(self, clock, wall_clock):
+        """Test that the JWKS skips HMAC keys and retired keys."""
+        text = json.dumps(
+            {
+                "signing_kid": "ec",
+                "keys": [
+                    {"kid": "hs", "secret": "s"},
+                    {
+                        "kid": "ec",
+                        "alg": "ES256",
+                        "private_key": private_key_pem("ES256"),
+                    },
+                    {
+                        "kid": "old",
+                        "alg": "EdDSA",
+                        "private_key": private_key_pem("EdDSA"),
+                        "verify_until": wall_clock.now + 1,
+                    },
+                ],
+            }
+        )
+        keyring = Keyring(MutableSource(text), clock=clock, wall_clock=wall_clock)
+
+        assert [jwk["kid"] for jwk in keyring.jwks()] == ["ec", "old"]
+        wall_clock.now += 1
+        assert [jwk["kid"] for jwk in keyring.jwks()] == ["ec"]
+
+
+class TestKeySources:
+    """Test suite for keyring sources and build_keyring."""
+
+    def test_file_source(self, tmp_path):
+        """Test that the file source reads the current file contents."""
+        path = tmp_path / "keyring.json"
+        path.write_text(document("k1", "k1"))
+
+        assert FileKeySource(str(path))() == document("k1", "k1")
+
+    def test_parameter_store_source(self):
+        """Test that the extension endpoint is called with the session token."""
+        response = Mock()
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+        response.read.return_value = json.dumps(
+            {"Parameter": {"Value": document("k1", "k1")}}
+        ).encode()
+
+        with (
+            patch.dict("os.environ", {"AWS_SESSION_TOKEN": "token"}),
+            patch(
+                "src.infrastructure.security.keyring.urlopen", return_value=response
+            ) as urlopen,
+        ):
+            text = ParameterStoreKeySource("/auth/jwt keyring")()
+
+        request = urlopen.call_args.args[0]
+        assert text == document("k1", "k1")
+        assert "name=%2Fauth%2Fjwt%20keyring" in request.full_url
+        assert "withDecryption=true" in request.full_url
+        assert request.get_header("X-aws-parameters-secrets-token") == "token"
+
+    def test_build_keyring(self, tmp_path):
+        """Test that build_keyring prefers the file and is off by default."""
+        path = tmp_path / "keyring.json"
+        path.write_text(document("k1", "k1"))
+        settings = Mock(
+            jwt_keyring_file=str(path),
+            jwt_keyring_parameter="/unused",
+            jwt_keyring_refresh_seconds=60,
+            jwt_keyring_grace_seconds=120,
+        )
+
+        assert build_keyring(settings).signing_key().kid == "k1"
+
+        settings.jwt_keyring_file = None
+        settings.jwt_keyring_parameter = None
+        assert build_keyring(settings) is None
@@ -0,0 +1,79 @@
+"""Unit tests for the logging setup."""
+
+import json
+import sys
+from dataclasses import replace
+
+import pytest
+from loguru import logger
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.observability import logging as observability
+
+SETTINGS = Settings(database_url="sqlite://", jwt_secret="secret")
+
+
+@pytest.fixture(autouse=True)
+def restore_logger(monkeypatch):
+    """Restore loguru's default sink and module state after each test."""
+    monkeypatch.setattr(observability, "_sample_rate", 1.0)
+    monkeypatch.setattr(observability, "_enqueued", False)
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+class TestLogging:
+    """Test suite for configure_logging, lazy_logger, sampled and flush_logs."""
+
+    def test_level_and_json_output(self, capsys):
+        """Test that the sink honors the level and serializes records."""
+        observability.configure_logging(
+            replace(SETTINGS, log_level="WARNING", log_json=True)
+        )
+
+        logger.info("dropped")
+        logger.warning("kept", reason="x")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])["record"]
+        assert record["message"] == "kept"
+        assert record["extra"] == {"reason": "x"}
+
+    def test_lazy_arguments_not_built_below_level(self, capsys):
+        """Test that lazy keyword values are only evaluated when logged."""
+        observability.configure_logging(SETTINGS)
+        calls = []
+
+        def expensive():
+            calls.append(1)
+            return ["cpf"]
+
+        observability.lazy_logger.debug("skipped", body_keys=expensive)
+        observability.lazy_logger.info("logged {body_keys}", body_keys=expensive)
+
+        assert calls == [1]
+        assert "logged ['cpf']" in capsys.readouterr().out
+
+    def test_enqueued_sink_flushed(self, capsys):
+        """Test that flush_logs delivers enqueued messages."""
+        observability.configure_logging(replace(SETTINGS, log_enqueue=True))
+
+        logger.info("background")
+        observability.flush_logs()
+
+        assert "background" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "rate, draw, expected",
+        [(1.0, 0.99, True), (0.0, 0.0, False), (0.25, 0.1, True), (0.25, 0.3, False)],
+    )
+    def test_sampled(self, monkeypatch, rate, draw, expected):
+        """Test per-event sampling against the configured rate."""
+        observability.configure_logging(
+            replace(SETTINGS, log_success_sample_rate=rate)
+        )
+        monkeypatch.setattr(observability, "_random", lambda: draw)
+
+        assert observability.sampled() is expected
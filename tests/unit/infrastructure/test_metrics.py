@@ -0,0 +1,214 @@
+"""Unit tests for stage metrics emission."""
+
+import io
+import json
+
+import pytest
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, text
+
+from src.application.instrumentation import Timings, stage
+from src.infrastructure.database.query_stats import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    QueryStats,
+    count_rows,
+    install_query_stats,
+)
+from src.infrastructure.observability.metrics import (
+    Instrumentation,
+    build_instrumentation,
+    emf_record,
+    server_timing,
+)
+
+
+def timings(cold_start=False, **stages):
+    """Timings with the given stage durations (seconds)."""
+    result = Timings(cold_start)
+    for name, seconds in stages.items():
+        result.add(name, seconds)
+    return result
+
+
+def handler(event):
+    """Handler entering one stage and returning a fresh response."""
+    with stage("db_query"):
+        pass
+    return {"statusCode": 200, "headers": {"Content-Type": "application/json"}}
+
+
+def query_stats(statements=0, rows=0, seconds=0.0):
+    """QueryStats with the given totals."""
+    result = QueryStats()
+    result.statements, result.rows, result.seconds = statements, rows, seconds
+    return result
+
+
+@pytest.fixture
+def querying_handler():
+    """Handler running two SELECTs on an engine with query stats installed."""
+    engine = create_engine("sqlite://")
+    install_query_stats(engine)
+
+    def handle(event):
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT 1 UNION ALL SELECT 2")).all()
+            connection.execute(text("SELECT 3")).first()
+        count_rows(len(rows) + 1)
+        return {"statusCode": 200, "headers": {}}
+
+    yield handle
+    engine.dispose()
+
+
+class TestFormats:
+    """Test suite for Server-Timing and EMF formatting."""
+
+    def test_server_timing(self):
+        """Test the header value, with the cold-start marker."""
+        value = server_timing(timings(True, db_query=0.002, total=0.0031))
+
+        assert value == 'db_query;dur=2.0, total;dur=3.1, cold_start;desc="cold start"'
+
+    def test_emf_record(self):
+        """Test that stages become millisecond metrics under one dimension set."""
+        record = emf_record(
+            timings(False, sign=0.0005),
+            "Auth",
+            {"Route": "/auth"},
+            {"request_id": "r1"},
+        )
+
+        directive = record["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "Auth"
+        assert directive["Dimensions"] == [["Route"]]
+        assert directive["Metrics"] == [
+            {"Name": "sign", "Unit": "Milliseconds"},
+            {"Name": "cold_start", "Unit": "Count"},
+        ]
+        assert record["Route"] == "/auth"
+        assert record["request_id"] == "r1"
+        assert record["sign"] == 0.5
+        assert record["cold_start"] == 0
+
+    def test_query_totals(self):
+        """Test the DB entry in Server-Timing and the DB metrics in EMF."""
+        queries = query_stats(statements=2, rows=3, seconds=0.0015)
+
+        value = server_timing(timings(False, total=0.004), queries)
+        record = emf_record(timings(), "Auth", {"Route": "/auth"}, queries=queries)
+
+        assert value == 'total;dur=4.0, db;dur=1.5;desc="statements=2 rows=3"'
+        assert record["_aws"]["CloudWatchMetrics"][0]["Metrics"] == [
+            {"Name": "db_time", "Unit": "Milliseconds"},
+            {"Name": "cold_start", "Unit": "Count"},
+            {"Name": "db_statements", "Unit": "Count"},
+            {"Name": "db_rows", "Unit": "Count"},
+        ]
+        assert (record["db_time"], record["db_statements"], record["db_rows"]) == (
+            1.5,
+            2,
+            3,
+        )
+
+
+class TestInstrumentation:
+    """Test suite for Instrumentation.run."""
+
+    def test_disabled_only_calls_handler(self):
+        """Test that disabled instrumentation adds nothing."""
+        stream = io.StringIO()
+        instrumentation = Instrumentation(server_timing=True, stream=stream)
+
+        response = instrumentation.run(handler, {})
+
+        assert "Server-Timing" not in response["headers"]
+        assert stream.getvalue() == ""
+
+    def test_header_and_metrics(self):
+        """Test Server-Timing, EMF output and the cold-start flag."""
+        stream = io.StringIO()
+        instrumentation = Instrumentation(
+            enabled=True, server_timing=True, namespace="Auth", stream=stream
+        )
+        event = {"rawPath": "/auth/batch"}
+
+        first = instrumentation.run(handler, event, request_id="r1")
+        second = instrumentation.run(handler, event, request_id="r2")
+
+        assert "db_query;dur=" in first["headers"]["Server-Timing"]
+        assert "cold_start" in first["headers"]["Server-Timing"]
+        assert "cold_start" not in second["headers"]["Server-Timing"]
+        assert first["headers"]["Timing-Allow-Origin"] == "*"
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [r["cold_start"] for r in records] == [1, 0]
+        assert [r["request_id"] for r in records] == ["r1", "r2"]
+        assert records[0]["Route"] == "/auth/batch"
+        assert records[0]["status_code"] == 200
+        assert {"db_query", "total"} <= set(records[0])
+
+    def test_metrics_can_be_disabled(self):
+        """Test header-only mode."""
+        stream = io.StringIO()
+        instrumentation = Instrumentation(
+            enabled=True, server_timing=True, emit_metrics=False, stream=stream
+        )
+
+        response = instrumentation.run(handler, {})
+
+        assert "Server-Timing" in response["headers"]
+        assert stream.getvalue() == ""
+
+    def test_query_totals_reported(self, querying_handler):
+        """Test that the statements and rows of the call are emitted."""
+        stream = io.StringIO()
+        instrumentation = Instrumentation(
+            enabled=True, server_timing=True, stream=stream
+        )
+
+        response = instrumentation.run(querying_handler, {})
+
+        assert 'desc="statements=2 rows=3"' in response["headers"]["Server-Timing"]
+        record = json.loads(stream.getvalue())
+        assert (record["db_statements"], record["db_rows"]) == (2, 3)
+
+    def test_query_budget_without_instrumentation(self, querying_handler):
+        """Test that a budget is enforced even when instrumentation is off."""
+        stream = io.StringIO()
+        instrumentation = Instrumentation(
+            stream=stream, query_budget=QueryBudget(1, 10, mode="raise")
+        )
+
+        with pytest.raises(QueryBudgetExceeded, match="2 statements > 1"):
+            instrumentation.run(querying_handler, {"rawPath": "/auth"})
+        assert stream.getvalue() == ""
+
+    def test_query_budget_checked_after_metrics(self, querying_handler):
+        """Test that the overrunning request is still reported."""
+        stream = io.StringIO()
+        instrumentation = Instrumentation(
+            enabled=True, stream=stream, query_budget=QueryBudget(5, 2, mode="raise")
+        )
+
+        with pytest.raises(QueryBudgetExceeded, match="for /auth: 3 rows > 2"):
+            instrumentation.run(querying_handler, {"rawPath": "/auth"})
+        assert json.loads(stream.getvalue())["db_rows"] == 3
+
+    def test_build_instrumentation(self):
+        """Test that settings configure the instrumentation."""
+        settings = Mock(
+            instrumentation_enabled=True,
+            instrumentation_server_timing=False,
+            instrumentation_metrics=True,
+            metrics_namespace="Auth",
+            query_budget_mode="off",
+        )
+
+        instrumentation = build_instrumentation(settings)
+
+        assert instrumentation._enabled is True
+        assert instrumentation._namespace == "Auth"
+        assert instrumentation._query_budget is None
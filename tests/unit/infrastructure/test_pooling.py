@@ -0,0 +1,159 @@
+"""Unit tests for Lambda-aware connection pooling."""
+
+import pytest
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.infrastructure.database.pooling import (
+    async_database_url,
+    async_engine_options,
+    engine_pool_options,
+    install_liveness_check,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File-backed SQLite engine holding a single persistent connection."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    yield engine
+    engine.dispose()
+
+
+def raw_connection_id(engine):
+    """Identity of the DBAPI connection handed out by the pool."""
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        return id(connection.connection.dbapi_connection)
+
+
+class TestEnginePoolOptions:
+    """Test suite for pool mode selection."""
+
+    def test_null_mode(self):
+        """Test that null mode keeps NullPool."""
+        settings = Mock(database_pool_mode="null")
+
+        assert engine_pool_options(settings) == {"poolclass": NullPool}
+
+    def test_lambda_mode(self):
+        """Test that lambda mode keeps one connection with a max age."""
+        settings = Mock(database_pool_mode="lambda", database_pool_max_age_seconds=600)
+
+        options = engine_pool_options(settings)
+
+        assert options["poolclass"] is QueuePool
+        assert options["pool_size"] == 1
+        assert options["pool_recycle"] == 600
+
+    def test_unknown_mode_raises(self):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown database pool mode"):
+            engine_pool_options(Mock(database_pool_mode="bogus"))
+
+
+class TestAsyncEngine:
+    """Test suite for the async serving mode engine options."""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("sqlite:///local.db", "sqlite+aiosqlite:///local.db"),
+            ("sqlite+aiosqlite:///local.db", "sqlite+aiosqlite:///local.db"),
+            ("mysql+pymysql://u:p@db/app", "mysql+aiomysql://u:p@db/app"),
+            ("postgresql://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+            ("mssql+pyodbc://u:p@db/app", "mssql+pyodbc://u:p@db/app"),
+        ],
+    )
+    def test_async_database_url(self, url, expected):
+        """Test that sync drivers are swapped for their asyncio driver."""
+        assert async_database_url(url) == expected
+
+    def test_sqlite_keeps_default_pool(self):
+        """Test that SQLite gets no pool sizing."""
+        assert async_engine_options(Mock(), "sqlite+aiosqlite://") == {}
+
+    def test_server_pool_options(self):
+        """Test that server databases get a sized, recycled, pinged pool."""
+        settings = Mock(
+            database_async_pool_size=8,
+            database_async_max_overflow=2,
+            database_pool_max_age_seconds=600,
+        )
+
+        options = async_engine_options(settings, "mysql+aiomysql://u:p@db/app")
+
+        assert options == {
+            "pool_size": 8,
+            "max_overflow": 2,
+            "pool_recycle": 600,
+            "pool_pre_ping": True,
+        }
+
+
+class TestLivenessCheck:
+    """Test suite for the idle liveness check."""
+
+    def test_connection_is_reused_across_checkouts(self, engine):
+        """Test that warm checkouts reuse the same connection."""
+        install_liveness_check(engine, idle_seconds=30, clock=FakeClock())
+
+        assert raw_connection_id(engine) == raw_connection_id(engine)
+
+    def test_recent_connection_is_not_pinged(self, engine):
+        """Test that back-to-back checkouts skip the ping."""
+        clock = FakeClock()
+        install_liveness_check(engine, idle_seconds=30, clock=clock)
+        statements = []
+        with engine.connect() as connection:
+            raw = connection.connection.dbapi_connection
+            raw.set_trace_callback(statements.append)
+        clock.now = 10
+        with engine.connect():
+            pass
+
+        assert statements == []
+
+    def test_dropped_connection_is_replaced_after_idle(self, engine):
+        """Test transparent reconnect when the idle connection is dead."""
+        clock = FakeClock()
+        install_liveness_check(engine, idle_seconds=30, clock=clock)
+        with engine.connect() as connection:
+            connection.connection.dbapi_connection.close()
+
+        clock.now = 31
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+
+    def test_idle_connection_is_pinged(self, engine):
+        """Test that a connection idle past the threshold is pinged."""
+        clock = FakeClock()
+        install_liveness_check(engine, idle_seconds=30, clock=clock)
+        statements = []
+        with engine.connect() as connection:
+            connection.connection.dbapi_connection.set_trace_callback(
+                statements.append
+            )
+
+        clock.now = 31
+        with engine.connect():
+            pass
+
+        assert statements == ["SELECT 1"]
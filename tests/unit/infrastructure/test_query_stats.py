@@ -0,0 +1,221 @@
+"""Unit tests for per-request SQL statement, row and DB time tracking."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from loguru import logger
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.adapters.gateways.readonly_customer_repository import (
+    ReadOnlyCustomerRepository,
+)
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.database.models import Base, CustomerModel
+from src.infrastructure.database.query_stats import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    QueryStats,
+    build_query_budget,
+    count_rows,
+    install_query_stats,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    """In-memory engine holding five customers, with query stats installed."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            CustomerModel.__table__.insert(),
+            [
+                {
+                    "id": f"id-{i}",
+                    "cpf": f"0000000000{i}",
+                    "nome": f"Customer {i}",
+                    "criado_em": datetime(2024, 1, 1),
+                    "atualizado_em": datetime(2024, 1, 1),
+                }
+                for i in range(5)
+            ],
+        )
+    install_query_stats(engine)
+    yield engine
+    engine.dispose()
+
+
+def stats(statements=0, rows=0):
+    """QueryStats with the given totals."""
+    result = QueryStats()
+    result.statements, result.rows = statements, rows
+    return result
+
+
+class TestTrackQueries:
+    """Test suite for the engine hooks and track_queries."""
+
+    def test_core_statements_and_db_time(self, engine):
+        """Test that statements and DB time are counted by the engine hooks."""
+        with track_queries() as queries, engine.connect() as connection:
+            connection.execute(select(CustomerModel.__table__)).all()
+            connection.execute(text("SELECT 1")).first()
+            connection.execute(text("SELECT 1 UNION ALL SELECT 2")).fetchmany(1)
+
+        assert queries.statements == 3
+        assert queries.rows == 0
+        assert queries.seconds > 0
+
+    def test_orm_statements(self, engine):
+        """Test that ORM queries are counted through the same hooks."""
+        with track_queries() as queries, Session(engine) as session:
+            customer = session.scalars(
+                select(CustomerModel).where(CustomerModel.cpf == "00000000003")
+            ).first()
+
+        assert customer.nome == "Customer 3"
+        assert queries.statements == 1
+
+    def test_count_rows(self):
+        """Test that reported rows add up only inside track_queries."""
+        count_rows(7)
+        with track_queries() as queries:
+            count_rows(2)
+            count_rows(0)
+
+        assert queries.rows == 2
+
+    def test_repository_rows(self, engine):
+        """Test that repository lookups report the rows they fetch."""
+        repository = ReadOnlyCustomerRepository(engine.connect)
+
+        with track_queries() as queries:
+            customers = repository.find_many_by_cpf(
+                ["00000000001", "00000000002", "39053344705"]
+            )
+            repository.find_by_cpf("00000000003")
+
+        assert len(customers) == 2
+        assert (queries.statements, queries.rows) == (2, 3)
+
+    def test_untracked_queries_ignored(self, engine):
+        """Test that nothing is recorded outside track_queries."""
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1")).all()
+        with track_queries() as queries:
+            pass
+
+        assert queries.statements == 0
+
+    def test_install_is_idempotent(self, engine):
+        """Test that installing twice does not double count."""
+        install_query_stats(engine)
+
+        with track_queries() as queries, engine.connect() as connection:
+            connection.execute(text("SELECT 1")).all()
+
+        assert queries.statements == 1
+
+    def test_async_engine(self, tmp_path):
+        """Test that an async engine's sync_engine counts awaited queries."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        async def run():
+            async_engine = create_async_engine(
+                f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}"
+            )
+            install_query_stats(async_engine.sync_engine)
+            try:
+                with track_queries() as queries:
+                    async with async_engine.connect() as connection:
+                        result = await connection.execute(
+                            text("SELECT 1 UNION ALL SELECT 2")
+                        )
+                        result.all()
+                return queries
+            finally:
+                await async_engine.dispose()
+
+        queries = asyncio.run(run())
+
+        assert queries.statements == 1
+
+    def test_failed_statement_not_counted(self, engine):
+        """Test that a statement the database rejects is not counted."""
+        with track_queries() as queries, engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 1")).all()
+
+        assert queries.statements == 1
+
+
+class TestQueryBudget:
+    """Test suite for QueryBudget and build_query_budget."""
+
+    def test_within_budget_logs_totals(self):
+        """Test that requests at the limits pass and their totals are logged."""
+        messages = []
+        sink = logger.add(messages.append, level="INFO")
+        try:
+            QueryBudget(2, 10, mode="raise").check(stats(2, 10), "/auth")
+        finally:
+            logger.remove(sink)
+
+        [message] = messages
+        assert message.record["level"].name == "INFO"
+        assert message.record["message"] == "Query totals for /auth"
+        assert message.record["extra"]["statements"] == 2
+        assert message.record["extra"]["rows"] == 10
+
+    def test_full_table_read_raises(self, engine):
+        """Test that a lookup fetching the whole table fails in raise mode."""
+        budget = QueryBudget(max_statements=1, max_rows=1, mode="raise")
+
+        with track_queries() as queries, Session(engine) as session:
+            count_rows(len(session.scalars(select(CustomerModel)).all()))
+
+        with pytest.raises(QueryBudgetExceeded, match="for /auth: 5 rows > 1"):
+            budget.check(queries, "/auth")
+
+    def test_warn_mode_logs(self):
+        """Test that warn mode logs the overrun instead of raising."""
+        messages = []
+        sink = logger.add(messages.append, level="WARNING")
+        try:
+            QueryBudget(1, 10, mode="warn").check(stats(3, 20), "/auth")
+        finally:
+            logger.remove(sink)
+
+        assert len(messages) == 1
+        record = messages[0].record
+        assert record["message"] == (
+            "Query budget exceeded for /auth: 3 statements > 1, 20 rows > 10"
+        )
+        assert record["extra"]["statements"] == 3
+        assert record["extra"]["rows"] == 20
+
+    def test_unknown_mode(self):
+        """Test that a misspelled mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown query budget mode"):
+            QueryBudget(1, 1, mode="strict")
+
+    def test_build_query_budget(self):
+        """Test that QUERY_BUDGET_MODE=off disables the budget."""
+        settings = Settings(
+            database_url="sqlite://",
+            jwt_secret="secret",
+            query_budget_mode="raise",
+            query_budget_max_statements=2,
+        )
+
+        budget = build_query_budget(settings)
+
+        with pytest.raises(QueryBudgetExceeded):
+            budget.check(stats(3, 0), "/auth")
+        settings.query_budget_mode = "off"
+        assert build_query_budget(settings) is None
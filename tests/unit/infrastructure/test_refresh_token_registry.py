@@ -0,0 +1,53 @@
+"""Unit tests for InMemoryRefreshTokenRegistry."""
+
+import pytest
+
+from src.infrastructure.cache.refresh_token_registry import (
+    InMemoryRefreshTokenRegistry,
+    build_refresh_token_registry,
+)
+from src.infrastructure.config.settings import Settings
+from tests.unit.infrastructure.test_ttl_cache import FakeClock
+
+
+class TestInMemoryRefreshTokenRegistry:
+    """Test suite for refresh token replay detection."""
+
+    def test_second_consume_is_rejected(self):
+        """Test that a token id can only be consumed once."""
+        registry = InMemoryRefreshTokenRegistry(max_size=10, clock=FakeClock())
+
+        assert registry.consume("jti-1", expires_at=100) is True
+        assert registry.consume("jti-1", expires_at=100) is False
+        assert registry.consume("jti-2", expires_at=100) is True
+
+    def test_entries_dropped_after_token_expiration(self):
+        """Test that ids are forgotten once the token itself has expired."""
+        clock = FakeClock()
+        registry = InMemoryRefreshTokenRegistry(max_size=10, clock=clock)
+        registry.consume("jti-1", expires_at=100)
+
+        clock.now = 100
+
+        assert registry.consume("jti-1", expires_at=100) is True
+
+    def test_build_from_settings(self):
+        """Test that rotation with a positive size builds a registry."""
+        settings = Settings(database_url="sqlite://", jwt_secret="secret")
+
+        assert isinstance(
+            build_refresh_token_registry(settings), InMemoryRefreshTokenRegistry
+        )
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"refresh_token_registry_max_size": 0},
+            {"refresh_token_rotation": False},
+        ],
+    )
+    def test_build_disabled(self, overrides):
+        """Test that a size of 0 or rotation off builds no registry."""
+        settings = Settings(database_url="sqlite://", jwt_secret="secret", **overrides)
+
+        assert build_refresh_token_registry(settings) is None
@@ -4,7 +4,7 @@ import pytest
 import os
 from unittest.mock import patch
 
-from src.infrastructure.config.settings import Settings, get_settings
+from src.infrastructure.config.settings import LoggingSettings, Settings, get_settings
 
 
 class TestSettings:
@@ -172,9 +172,362 @@ class TestSettings:
                 "DB_NAME": "db",
                 "JWT_SECRET": "secret",
                 "JWT_EXPIRATION_MINUTES": "45",
+                "AUTH_BATCH_MAX_SIZE": "10",
             },
             clear=True,
         ):
             settings = Settings.from_env()
 
             assert settings.jwt_expiration_minutes == 45
+            assert settings.auth_batch_max_size == 10
+
+    def test_customer_cache_settings(self):
+        """Test customer cache size and TTL configuration."""
+        with patch.dict(
+            os.environ,
+            {
+                "DB_HOST": "localhost",
+                "DB_USER": "root",
+                "DB_PASSWORD": "pass",
+                "DB_NAME": "db",
+                "JWT_SECRET": "secret",
+                "CUSTOMER_CACHE_MAX_SIZE": "10",
+                "CUSTOMER_CACHE_TTL_SECONDS": "2.5",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.customer_cache_max_size == 10
+            assert settings.customer_cache_ttl_seconds == 2.5
+
+    def test_zero_cache_ttl_builds_uncached_repository(self):
+        """Test that a TTL of 0 leaves the caches out of the composition root."""
+        from src.adapters.gateways.readonly_customer_repository import (
+            ReadOnlyCustomerRepository,
+        )
+        from src.lambda_handler import build_customer_repository
+
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_SECRET": "secret",
+                "CUSTOMER_CACHE_TTL_SECONDS": "0",
+                "NEGATIVE_CACHE_TTL_SECONDS": "0",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.customer_cache_ttl_seconds == 0
+            assert settings.negative_cache_ttl_seconds == 0
+            repository = build_customer_repository(settings)
+            assert type(repository) is ReadOnlyCustomerRepository
+
+    def test_negative_lookup_settings(self):
+        """Test negative cache and Bloom filter configuration."""
+        with patch.dict(
+            os.environ,
+            {
+                "DB_HOST": "localhost",
+                "DB_USER": "root",
+                "DB_PASSWORD": "pass",
+                "DB_NAME": "db",
+                "JWT_SECRET": "secret",
+                "NEGATIVE_CACHE_TTL_SECONDS": "5",
+                "BLOOM_FILTER_ENABLED": "true",
+                "BLOOM_FILTER_CAPACITY": "500",
+                "BLOOM_FILTER_FALSE_POSITIVE_RATE": "0.001",
+                "BLOOM_FILTER_MAX_BYTES": "2048",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.negative_cache_ttl_seconds == 5
+            assert settings.bloom_filter_enabled is True
+            assert settings.bloom_filter_capacity == 500
+            assert settings.bloom_filter_false_positive_rate == 0.001
+            assert settings.bloom_filter_max_bytes == 2048
+
+    def test_database_url_override(self):
+        """Test that DATABASE_URL replaces the DB_* variables."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite:///local.db", "JWT_SECRET": "secret"},
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.database_url == "sqlite:///local.db"
+
+    def test_database_pool_settings(self):
+        """Test connection pool mode configuration."""
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite:///local.db",
+                "JWT_SECRET": "secret",
+                "DATABASE_POOL_MODE": "LAMBDA",
+                "DATABASE_POOL_MAX_AGE_SECONDS": "120",
+                "DATABASE_PING_AFTER_IDLE_SECONDS": "5",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.database_pool_mode == "lambda"
+            assert settings.database_pool_max_age_seconds == 120
+            assert settings.database_ping_after_idle_seconds == 5
+            assert settings.customer_repository_mode == "readonly"
+
+    def test_asymmetric_algorithm_requires_private_key(self):
+        """Test that ES256/EdDSA need a private key instead of JWT_SECRET."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite://", "JWT_ALGORITHM": "EdDSA"},
+            clear=True,
+        ):
+            with pytest.raises(ValueError, match="JWT_PRIVATE_KEY"):
+                Settings.from_env()
+
+    def test_private_key_from_env_unescapes_newlines(self):
+        """Test that single-line PEM values are restored."""
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_ALGORITHM": "ES256",
+                "JWT_PRIVATE_KEY": "-----BEGIN-----\\nabc\\n-----END-----",
+                "JWT_KEY_ID": "key-1",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.jwt_private_key == "-----BEGIN-----\nabc\n-----END-----"
+            assert settings.jwt_key_id == "key-1"
+            assert settings.jwt_secret == ""
+
+    def test_private_key_from_file(self, tmp_path):
+        """Test reading the PEM key from JWT_PRIVATE_KEY_FILE."""
+        key_file = tmp_path / "key.pem"
+        key_file.write_text("-----BEGIN-----\nabc\n-----END-----\n")
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_ALGORITHM": "EdDSA",
+                "JWT_PRIVATE_KEY_FILE": str(key_file),
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.jwt_private_key.startswith("-----BEGIN-----\nabc")
+
+    def test_authorizer_settings(self):
+        """Test token cache and authorizer rule configuration."""
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_SECRET": "secret",
+                "TOKEN_CACHE_MAX_SIZE": "0",
+                "TOKEN_FAILURE_CACHE_SECONDS": "1",
+                "AUTHORIZER_ALLOWED_ROLES": "client, admin",
+                "AUTHORIZER_REVOKED_TOKEN_IDS": "abc,,def",
+                "AUTHORIZER_SIMPLE_RESPONSES": "false",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.token_cache_max_size == 0
+            assert settings.token_cache_ttl_seconds == 300
+            assert settings.token_failure_cache_seconds == 1
+            assert settings.authorizer_allowed_roles == ("client", "admin")
+            assert settings.authorizer_revoked_token_ids == ("abc", "def")
+            assert settings.authorizer_simple_responses is False
+
+    def test_refresh_token_settings(self):
+        """Test refresh token lifetime and rotation configuration."""
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_SECRET": "secret",
+                "JWT_REFRESH_EXPIRATION_MINUTES": "60",
+                "JWT_REFRESH_MAX_LIFETIME_MINUTES": "120",
+                "REFRESH_TOKEN_ROTATION": "false",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.jwt_refresh_expiration_minutes == 60
+            assert settings.jwt_refresh_max_lifetime_minutes == 120
+            assert settings.refresh_token_rotation is False
+            assert settings.refresh_token_registry_max_size == 10000
+
+    def test_customer_cpf_key_setting(self):
+        """Test the CPF lookup column setting."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite://", "JWT_SECRET": "secret"},
+            clear=True,
+        ):
+            assert Settings.from_env().customer_cpf_key == "string"
+            os.environ["CUSTOMER_CPF_KEY"] = "Dual"
+            assert Settings.from_env().customer_cpf_key == "dual"
+
+    def test_json_encoder_setting(self):
+        """Test response encoder selection."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite://", "JWT_SECRET": "secret"},
+            clear=True,
+        ):
+            assert Settings.from_env().json_encoder == "stdlib"
+            os.environ["JSON_ENCODER"] = "ORJSON"
+            assert Settings.from_env().json_encoder == "orjson"
+
+    def test_logging_settings(self):
+        """Test logging level, format, sink mode and sampling."""
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_SECRET": "secret",
+                "LOG_LEVEL": "debug",
+                "LOG_JSON": "true",
+                "LOG_ENQUEUE": "true",
+                "LOG_SUCCESS_SAMPLE_RATE": "0.1",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.log_level == "DEBUG"
+            assert settings.log_json is True
+            assert settings.log_enqueue is True
+            assert settings.log_success_sample_rate == 0.1
+
+    def test_logging_settings_need_no_database_or_secret(self):
+        """Test that LOG_* settings load without DATABASE_URL or JWT_SECRET."""
+        with patch.dict(os.environ, {"LOG_LEVEL": "warning"}, clear=True):
+            settings = LoggingSettings.from_env()
+
+            assert settings.log_level == "WARNING"
+            assert settings.log_json is False
+            with pytest.raises(ValueError):
+                Settings.from_env()
+
+    def test_async_database_settings(self):
+        """Test async serving mode URL and pool sizing."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite://", "JWT_SECRET": "secret"},
+            clear=True,
+        ):
+            settings = Settings.from_env()
+            assert settings.database_async_url is None
+            assert settings.database_async_pool_size == 20
+            assert settings.database_async_max_overflow == 10
+
+            os.environ.update(
+                {
+                    "DATABASE_ASYNC_URL": "postgresql+asyncpg://u:p@db/app",
+                    "DATABASE_ASYNC_POOL_SIZE": "5",
+                    "DATABASE_ASYNC_MAX_OVERFLOW": "0",
+                }
+            )
+            settings = Settings.from_env()
+            assert settings.database_async_url == "postgresql+asyncpg://u:p@db/app"
+            assert settings.database_async_pool_size == 5
+            assert settings.database_async_max_overflow == 0
+
+    def test_keyring_settings(self):
+        """Test that a keyring replaces JWT_SECRET and sets its timings."""
+        with patch.dict(
+            os.environ,
+            {
+                "DATABASE_URL": "sqlite://",
+                "JWT_KEYRING_FILE": "/mnt/keys/keyring.json",
+                "JWT_REFRESH_EXPIRATION_MINUTES": "60",
+            },
+            clear=True,
+        ):
+            settings = Settings.from_env()
+
+            assert settings.jwt_keyring_file == "/mnt/keys/keyring.json"
+            assert settings.jwt_keyring_parameter is None
+            assert settings.jwt_keyring_refresh_seconds == 300
+            assert settings.jwt_keyring_grace_seconds == 3600
+
+            os.environ.update(
+                {
+                    "JWT_ALGORITHM": "ES256",
+                    "JWT_KEYRING_FILE": "",
+                    "JWT_KEYRING_PARAMETER": "/auth/keyring",
+                    "JWT_KEYRING_REFRESH_SECONDS": "30",
+                    "JWT_KEYRING_GRACE_SECONDS": "90",
+                }
+            )
+            settings = Settings.from_env()
+
+            assert settings.jwt_keyring_parameter == "/auth/keyring"
+            assert settings.jwt_keyring_refresh_seconds == 30
+            assert settings.jwt_keyring_grace_seconds == 90
+
+    def test_instrumentation_settings(self):
+        """Test stage instrumentation switches and metrics namespace."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite://", "JWT_SECRET": "secret"},
+            clear=True,
+        ):
+            settings = Settings.from_env()
+            assert settings.instrumentation_enabled is False
+            assert settings.instrumentation_server_timing is False
+            assert settings.instrumentation_metrics is True
+            assert settings.metrics_namespace == "ServerlessAuth"
+
+            os.environ.update(
+                {
+                    "INSTRUMENTATION_ENABLED": "TRUE",
+                    "INSTRUMENTATION_SERVER_TIMING": "true",
+                    "INSTRUMENTATION_METRICS": "false",
+                    "METRICS_NAMESPACE": "Auth/Staging",
+                }
+            )
+            settings = Settings.from_env()
+            assert settings.instrumentation_enabled is True
+            assert settings.instrumentation_server_timing is True
+            assert settings.instrumentation_metrics is False
+            assert settings.metrics_namespace == "Auth/Staging"
+
+    def test_query_budget_settings(self):
+        """Test the per-request SQL statement and row budget."""
+        with patch.dict(
+            os.environ,
+            {"DATABASE_URL": "sqlite://", "JWT_SECRET": "secret"},
+            clear=True,
+        ):
+            settings = Settings.from_env()
+            assert settings.query_budget_mode == "warn"
+            assert settings.query_budget_max_statements == 4
+            assert settings.query_budget_max_rows == 100
+
+            os.environ.update(
+                {
+                    "QUERY_BUDGET_MODE": "RAISE",
+                    "QUERY_BUDGET_MAX_STATEMENTS": "2",
+                    "QUERY_BUDGET_MAX_ROWS": "10",
+                }
+            )
+            settings = Settings.from_env()
+            assert settings.query_budget_mode == "raise"
+            assert settings.query_budget_max_statements == 2
+            assert settings.query_budget_max_rows == 10
@@ -0,0 +1,111 @@
+"""Unit tests for TTLCache."""
+
+import pytest
+
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that stored values are returned and counted as hits."""
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_get_missing_counts_miss(self):
+        """Test that missing keys count as misses."""
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL elapses."""
+        clock = FakeClock()
+        cache = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_override(self):
+        """Test that set accepts a TTL shorter than the default."""
+        clock = FakeClock()
+        cache = TTLCache(max_size=2, ttl_seconds=60, clock=clock)
+        cache.set("a", 1, ttl_seconds=1)
+
+        clock.now = 1.5
+
+        assert cache.get("a") is None
+
+    def test_non_positive_ttl_is_not_stored(self):
+        """Test that an already-expired entry is never stored."""
+        cache = TTLCache(max_size=2, ttl_seconds=60)
+
+        cache.set("a", 1, ttl_seconds=0)
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction when max_size is exceeded."""
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_delete_and_delete_where(self):
+        """Test explicit invalidation helpers."""
+        cache = TTLCache(max_size=4, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert cache.delete_where(lambda value: value > 2) == 1
+        assert len(cache) == 1
+
+    def test_clear_resets_counters(self):
+        """Test that clear drops entries and counters."""
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+    @pytest.mark.parametrize("max_size, ttl", [(0, 10), (2, 0)])
+    def test_invalid_configuration_raises(self, max_size, ttl):
+        """Test that non-positive size or TTL is rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(max_size=max_size, ttl_seconds=ttl)
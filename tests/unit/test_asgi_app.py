@@ -0,0 +1,82 @@
+"""Unit tests for the async (ASGI) serving mode."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+from src.asgi_app import app, get_async_controller, get_query_budget
+from src.infrastructure.database.connection import DatabaseConnection
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def asgi_database(sqlite_database):
+    """Seeded database with the async composition root reset around the test."""
+    get_async_controller.cache_clear()
+    get_query_budget.cache_clear()
+    yield sqlite_database
+    get_async_controller.cache_clear()
+    get_query_budget.cache_clear()
+
+
+def post_all(bodies, path="/auth"):
+    """POST every body concurrently on one event loop; return the responses."""
+
+    async def post(body):
+        messages = [{"type": "http.request", "body": body.encode()}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "path": path, "headers": []}
+        await app(scope, receive, send)
+        return sent[0]["status"], json.loads(sent[1]["body"])
+
+    async def main():
+        try:
+            return await asyncio.gather(*(post(body) for body in bodies))
+        finally:
+            await DatabaseConnection.dispose_async()
+
+    return asyncio.run(main())
+
+
+class TestAsgiApp:
+    """Test suite for the async entry point against the local database."""
+
+    def test_concurrent_logins(self, asgi_database):
+        """Test concurrent logins sharing one async engine."""
+        bodies = [
+            json.dumps({"cpf": cpf})
+            for cpf in ["111.444.777-35", "52998224725", "39053344705"] * 5
+        ]
+
+        responses = post_all(bodies)
+
+        assert [status for status, _ in responses] == [200, 200, 401] * 5
+        assert responses[0][1]["customer"]["name"] == "João da Silva"
+        assert get_async_controller.cache_info().misses == 1
+
+    def test_batch_route(self, asgi_database):
+        """Test that the batch route reaches the async batch use case."""
+        body = json.dumps({"cpfs": ["11144477735", "39053344705"]})
+
+        [(status, payload)] = post_all([body], path="/auth/batch")
+
+        assert status == 200
+        assert len(payload["results"]) == 2
+
+    def test_query_budget(self, asgi_database):
+        """Test that async lookups are checked against the query budget."""
+        from src.infrastructure.database.query_stats import QueryBudgetExceeded
+
+        with patch.dict("os.environ", {"QUERY_BUDGET_MAX_ROWS": "0"}):
+            with pytest.raises(QueryBudgetExceeded, match="/auth: 1 rows > 0"):
+                post_all([json.dumps({"cpf": "111.444.777-35"})])
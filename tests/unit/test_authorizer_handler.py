@@ -0,0 +1,128 @@
+"""Unit tests for the Lambda authorizer handler."""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+from src.authorizer_handler import get_authorizer, lambda_handler
+from src.infrastructure.config.settings import get_settings
+from src.protected_handler import lambda_handler as protected_handler
+from src.protected_handler import setup_logging
+
+
+@pytest.fixture
+def environment():
+    """HS256 settings with the verified-token cache enabled."""
+    with patch.dict(
+        os.environ,
+        {"DATABASE_URL": "sqlite://", "JWT_SECRET": "test-secret"},
+        clear=True,
+    ):
+        get_settings.cache_clear()
+        get_authorizer.cache_clear()
+        setup_logging.cache_clear()
+        yield
+        get_settings.cache_clear()
+        get_authorizer.cache_clear()
+        setup_logging.cache_clear()
+
+
+def event(token):
+    return {
+        "version": "2.0",
+        "type": "REQUEST",
+        "routeArn": "arn:aws:execute-api:us-east-2:1:api/prod/GET/protected",
+        "identitySource": [f"Bearer {token}"],
+    }
+
+
+class TestAuthorizerHandler:
+    """Test suite for the authorizer composition root."""
+
+    def test_allows_tokens_issued_by_auth_lambda(self, environment):
+        """Test end to end: generated token is authorized and cached."""
+        generator = get_authorizer()._token_generator
+        token = generator.generate(customer_id="abc", cpf="11144477735")
+
+        first = lambda_handler(event(token), None)
+        second = lambda_handler(event(token), None)
+
+        assert first == second
+        assert first["isAuthorized"] is True
+        assert first["context"]["sub"] == "abc"
+        assert generator.token_cache.hits == 1
+
+    def test_denies_garbage(self, environment):
+        """Test that an unverifiable token is denied."""
+        assert lambda_handler(event("garbage"), None)["isAuthorized"] is False
+
+    @pytest.mark.parametrize(
+        "variable", ["TOKEN_CACHE_MAX_SIZE", "TOKEN_CACHE_TTL_SECONDS"]
+    )
+    def test_cache_disabled(self, environment, variable):
+        """Test that a size or TTL of 0 builds no verified-token cache."""
+        os.environ[variable] = "0"
+        generator = get_authorizer()._token_generator
+        token = generator.generate(customer_id="abc", cpf="11144477735")
+
+        assert generator.token_cache is None
+        assert lambda_handler(event(token), None)["isAuthorized"] is True
+
+
+class TestProtectedHandler:
+    """Test suite for claims extraction in the protected endpoint."""
+
+    @pytest.mark.parametrize(
+        "authorizer",
+        [
+            {"lambda": {"cpf": "11144477735"}},
+            {"jwt": {"claims": {"cpf": "11144477735"}}},
+            {"cpf": "11144477735"},
+        ],
+    )
+    def test_reads_claims_from_any_authorizer(
+        self, authorizer, environment, lambda_context
+    ):
+        """Test Lambda, JWT and REST authorizer context shapes."""
+        response = protected_handler(
+            {"requestContext": {"authorizer": authorizer}}, lambda_context
+        )
+
+        assert json.loads(response["body"])["claims"] == {"cpf": "11144477735"}
+
+    def test_claims_logged_at_debug_without_cpf(
+        self, environment, lambda_context, capsys
+    ):
+        """Test that claims are only logged at DEBUG, with the CPF masked."""
+        event = {"requestContext": {"authorizer": {"lambda": {"cpf": "11144477735"}}}}
+
+        protected_handler(event, lambda_context)
+        info_output = capsys.readouterr()
+
+        os.environ.update({"LOG_LEVEL": "DEBUG", "LOG_JSON": "true"})
+        setup_logging.cache_clear()
+        protected_handler(event, lambda_context)
+        debug_output = capsys.readouterr()
+
+        assert "Protected endpoint accessed" in info_output.out
+        assert "JWT claims extracted" not in info_output.out
+        assert info_output.err == ""
+        records = [json.loads(line)["record"] for line in debug_output.out.splitlines()]
+        claims = [r["extra"] for r in records if r["message"] == "JWT claims extracted"]
+        assert claims == [{"claims": {"cpf": "***"}}]
+        assert "11144477735" not in debug_output.out
+
+    def test_needs_no_database_or_jwt_settings(self, lambda_context, capsys):
+        """Test a cold start with only the LOG_* variables configured."""
+        event = {"requestContext": {"authorizer": {"lambda": {"sub": "abc"}}}}
+
+        with patch.dict(os.environ, {"LOG_LEVEL": "INFO"}, clear=True):
+            setup_logging.cache_clear()
+            try:
+                response = protected_handler(event, lambda_context)
+            finally:
+                setup_logging.cache_clear()
+
+        assert response["statusCode"] == 200
+        assert "Protected endpoint accessed" in capsys.readouterr().out
@@ -0,0 +1,90 @@
+"""Import-boundary tests: what each entry point loads on a cold start."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEAVY_MODULES = ["sqlalchemy", "sqlalchemy.orm", "jwt", "numpy"]
+
+
+def loaded_modules(code: str, **env: str) -> dict:
+    """Run code in a fresh interpreter; report which heavy modules it loaded."""
+    script = (
+        f"import sys\n{code}\n"
+        f"print(__import__('json').dumps("
+        f"{{name: name in sys.modules for name in {HEAVY_MODULES!r}}}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        env={
+            **os.environ,
+            "DATABASE_URL": "sqlite://",
+            "JWT_SECRET": "test-secret",
+            **env,
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestColdImports:
+    """Test suite for per-handler import boundaries."""
+
+    def test_protected_handler_loads_no_heavy_dependency(self):
+        """Test that the protected handler imports neither SQLAlchemy nor PyJWT."""
+        loaded = loaded_modules("import src.protected_handler")
+
+        assert not any(loaded.values())
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import src.authorizer_handler as m; m.get_authorizer()",
+            "import src.jwks_handler as m; m.get_jwks_body()",
+        ],
+    )
+    def test_token_handlers_do_not_load_the_database_stack(self, code):
+        """Test that the authorizer and JWKS paths never import SQLAlchemy."""
+        loaded = loaded_modules(code)
+
+        assert loaded["jwt"]
+        assert not loaded["sqlalchemy"]
+        assert not loaded["numpy"]
+
+    def test_readonly_lambda_handler_skips_orm_and_numpy(self):
+        """Test that the default read-only stack never imports the ORM."""
+        loaded = loaded_modules("import src.lambda_handler as m; m.get_controller()")
+
+        assert loaded["sqlalchemy"]
+        assert not loaded["sqlalchemy.orm"]
+        assert not loaded["numpy"]
+
+    def test_orm_mappers_are_configured_by_the_composition_root(self):
+        """Test that ORM mode configures mappers before the first query."""
+        loaded = loaded_modules(
+            "import src.lambda_handler as m; m.get_controller()\n"
+            "from src.infrastructure.database.models import CustomerModel\n"
+            "assert CustomerModel.__mapper__.configured",
+            CUSTOMER_REPOSITORY_MODE="orm",
+        )
+
+        assert loaded["sqlalchemy.orm"]
+
+    def test_value_objects_defer_numpy_until_bulk_validation(self):
+        """Test that NumPy is imported by validate_cpfs, not by the package."""
+        before = loaded_modules("import src.domain.value_objects")
+        after = loaded_modules(
+            "from src.domain.value_objects import validate_cpfs\n"
+            "validate_cpfs(['11144477735'])"
+        )
+
+        assert not before["numpy"]
+        assert after["numpy"]
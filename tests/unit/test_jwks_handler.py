@@ -0,0 +1,79 @@
+"""Unit tests for the JWKS Lambda handler."""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from src.jwks_handler import (
+    _serialize_jwks,
+    get_jwks_body,
+    get_token_generator,
+    lambda_handler,
+)
+from tests.unit.infrastructure.test_jwt_service import private_key_pem
+
+
+@pytest.fixture
+def settings():
+    """EdDSA settings for the token generator."""
+    mock_settings = Mock()
+    mock_settings.jwt_secret = ""
+    mock_settings.jwt_algorithm = "EdDSA"
+    mock_settings.jwt_private_key = private_key_pem("EdDSA")
+    mock_settings.jwt_key_id = "key-1"
+    mock_settings.jwt_keyring_file = None
+    mock_settings.jwt_keyring_parameter = None
+
+    get_token_generator.cache_clear()
+    _serialize_jwks.cache_clear()
+    with patch(
+        "src.infrastructure.security.jwt_service.get_settings",
+        return_value=mock_settings,
+    ), patch("src.jwks_handler.get_settings", return_value=mock_settings):
+        yield mock_settings
+    get_token_generator.cache_clear()
+    _serialize_jwks.cache_clear()
+
+
+class TestJwksHandler:
+    """Test suite for the JWKS endpoint."""
+
+    def test_returns_cacheable_jwks(self, settings):
+        """Test that the public keys are served with cache headers."""
+        response = lambda_handler({}, None)
+
+        assert response["statusCode"] == 200
+        assert "max-age" in response["headers"]["Cache-Control"]
+        keys = json.loads(response["body"])["keys"]
+        assert [key["kid"] for key in keys] == ["key-1"]
+
+    def test_document_is_built_once(self, settings):
+        """Test that warm invocations reuse the serialized document."""
+        lambda_handler({}, None)
+        lambda_handler({}, None)
+
+        assert _serialize_jwks.cache_info().misses == 1
+        assert get_jwks_body() == lambda_handler({}, None)["body"]
+
+    def test_document_follows_keyring_rotation(self, settings, tmp_path):
+        """Test that a keyring reload republishes the JWKS."""
+        path = tmp_path / "keyring.json"
+
+        def write(*kids):
+            keys = [
+                {"kid": kid, "alg": "EdDSA", "private_key": private_key_pem("EdDSA")}
+                for kid in kids
+            ]
+            path.write_text(json.dumps({"signing_kid": kids[-1], "keys": keys}))
+
+        write("k1")
+        settings.jwt_keyring_file = str(path)
+        settings.jwt_keyring_refresh_seconds = 0
+        settings.jwt_keyring_grace_seconds = 0
+
+        first = json.loads(get_jwks_body())
+        write("k1", "k2")
+        second = json.loads(get_jwks_body())
+
+        assert [key["kid"] for key in first["keys"]] == ["k1"]
+        assert [key["kid"] for key in second["keys"]] == ["k1", "k2"]
@@ -0,0 +1,254 @@
+"""Unit tests for the authentication Lambda handler."""
+
+import json
+import os
+
+import pytest
+from unittest.mock import patch
+
+from src.infrastructure.database.connection import DatabaseConnection
+from src.lambda_handler import get_controller, lambda_handler
+
+
+class TestLambdaHandler:
+    """Test suite for the authentication entry point."""
+
+    def test_authenticates_customer(self, sqlite_database, lambda_context):
+        """Test a successful login against the local database."""
+        event = {"body": json.dumps({"cpf": "111.444.777-35"})}
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["customer"]["name"] == "João da Silva"
+
+    def test_unknown_customer(self, sqlite_database, lambda_context):
+        """Test a valid but unregistered CPF."""
+        event = {"body": json.dumps({"cpf": "39053344705"})}
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 401
+
+    def test_object_graph_is_reused_across_invocations(
+        self, sqlite_database, lambda_context
+    ):
+        """Test that the composition root is built once per container."""
+        event = {"body": json.dumps({"cpf": "52998224725"})}
+
+        lambda_handler(event, lambda_context)
+        controller = get_controller()
+        lambda_handler(event, lambda_context)
+
+        assert get_controller() is controller
+        assert get_controller.cache_info().misses == 1
+
+    @pytest.mark.parametrize(
+        "event, status_code",
+        [
+            ({"requestContext": {"http": {"method": "OPTIONS"}}}, 204),
+            ({"body": "invalid-json"}, 400),
+            ({"body": json.dumps({})}, 400),
+            ({"body": json.dumps({"cpf": "12345678900"})}, 401),
+        ],
+    )
+    def test_early_rejections_do_no_database_io(
+        self, sqlite_database, lambda_context, event, status_code
+    ):
+        """Test that requests rejected before lookup never touch the database."""
+        with patch.object(
+            DatabaseConnection, "get_session", wraps=DatabaseConnection.get_session
+        ) as get_session, patch.object(
+            DatabaseConnection,
+            "get_readonly_connection",
+            wraps=DatabaseConnection.get_readonly_connection,
+        ) as get_readonly_connection:
+            get_controller.cache_clear()
+
+            response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == status_code
+        get_session.assert_not_called()
+        get_readonly_connection.assert_not_called()
+        assert DatabaseConnection._engine is None
+        assert DatabaseConnection._readonly_engine is None
+
+    def test_lookup_opens_database_lazily(self, sqlite_database, lambda_context):
+        """Test that the engine is created by the first lookup."""
+        event = {"body": json.dumps({"cpf": "52998224725"})}
+
+        lambda_handler({"body": json.dumps({})}, lambda_context)
+        assert DatabaseConnection._readonly_engine is None
+
+        lambda_handler(event, lambda_context)
+        assert DatabaseConnection._readonly_engine is not None
+
+    def test_orm_repository_mode(self, sqlite_database, lambda_context):
+        """Test that the ORM lookup path stays selectable."""
+        event = {"body": json.dumps({"cpf": "111.444.777-35"})}
+
+        with patch.dict("os.environ", {"CUSTOMER_REPOSITORY_MODE": "orm"}):
+            response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        assert DatabaseConnection._engine is not None
+        assert DatabaseConnection._readonly_engine is None
+
+    def test_unknown_repository_mode_raises(self, sqlite_database):
+        """Test that an unknown repository mode fails the composition root."""
+        with patch.dict("os.environ", {"CUSTOMER_REPOSITORY_MODE": "bogus"}):
+            with pytest.raises(ValueError, match="Unknown customer repository mode"):
+                get_controller()
+
+    def test_refresh_token_registry_disabled(self, sqlite_database, lambda_context):
+        """Test that REFRESH_TOKEN_REGISTRY_MAX_SIZE=0 keeps logins working."""
+        event = {"body": json.dumps({"cpf": "111.444.777-35"})}
+
+        with patch.dict("os.environ", {"REFRESH_TOKEN_REGISTRY_MAX_SIZE": "0"}):
+            response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        assert get_controller()._use_case._refresh_token_registry is None
+
+    @pytest.mark.parametrize(
+        "variable", ["CUSTOMER_CACHE_TTL_SECONDS", "NEGATIVE_CACHE_TTL_SECONDS"]
+    )
+    def test_zero_cache_ttl_disables_cache(
+        self, sqlite_database, lambda_context, variable
+    ):
+        """Test that a TTL of 0 disables the cache instead of failing."""
+        event = {"body": json.dumps({"cpf": "111.444.777-35"})}
+
+        with patch.dict("os.environ", {variable: "0"}):
+            response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+
+    def test_batch_authentication(self, sqlite_database, lambda_context):
+        """Test the batch route end to end against the local database."""
+        event = {
+            "rawPath": "/auth/batch",
+            "body": json.dumps(
+                {"cpfs": ["111.444.777-35", "52998224725", "39053344705", "1"]}
+            ),
+        }
+
+        response = lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        results = json.loads(response["body"])["results"]
+        assert [r["success"] for r in results] == [True, True, False, False]
+        assert results[2]["error"]["code"] == "CUSTOMER_NOT_FOUND"
+        assert results[3]["error"]["code"] == "INVALID_CPF"
+
+    def test_refresh_reissues_token_without_database(
+        self, sqlite_database, lambda_context
+    ):
+        """Test login -> refresh -> replay against the local database."""
+        login = lambda_handler(
+            {"body": json.dumps({"cpf": "111.444.777-35"})}, lambda_context
+        )
+        refresh_token = json.loads(login["body"])["refresh_token"]
+        event = {
+            "rawPath": "/auth/refresh",
+            "body": json.dumps({"refresh_token": refresh_token}),
+        }
+
+        with patch.object(
+            DatabaseConnection, "get_readonly_connection"
+        ) as get_readonly_connection:
+            refreshed = lambda_handler(event, lambda_context)
+            replayed = lambda_handler(event, lambda_context)
+
+        get_readonly_connection.assert_not_called()
+        assert refreshed["statusCode"] == 200
+        body = json.loads(refreshed["body"])
+        assert body["customer"]["name"] == "João da Silva"
+        assert body["refresh_token"] != refresh_token
+        assert replayed["statusCode"] == 401
+
+    def test_success_logs_are_sampled(self, sqlite_database, lambda_context, capsys):
+        """Test that sampled-out successes skip routine logs but errors do not."""
+        os.environ["LOG_SUCCESS_SAMPLE_RATE"] = "0"
+
+        lambda_handler({"body": json.dumps({"cpf": "52998224725"})}, lambda_context)
+        success = capsys.readouterr().out
+        lambda_handler({"body": json.dumps({})}, lambda_context)
+        failure = capsys.readouterr().out
+
+        assert "Authentication Lambda invoked" in success
+        assert "Authentication successful" not in success
+        assert "request completed" not in success
+        assert "request completed" in failure
+
+    def test_stage_instrumentation(self, sqlite_database, lambda_context, capsys):
+        """Test Server-Timing and EMF output for a login end to end."""
+        event = {"rawPath": "/auth", "body": json.dumps({"cpf": "111.444.777-35"})}
+
+        with patch.dict(
+            "os.environ",
+            {
+                "INSTRUMENTATION_ENABLED": "true",
+                "INSTRUMENTATION_SERVER_TIMING": "true",
+                "LOG_LEVEL": "ERROR",
+            },
+        ):
+            cold = lambda_handler(event, lambda_context)
+            warm = lambda_handler(event, lambda_context)
+
+        stages = [
+            metric.split(";")[0]
+            for metric in cold["headers"]["Server-Timing"].split(", ")
+        ]
+        assert stages == [
+            "parse",
+            "validate",
+            "db_connect",
+            "db_query",
+            "sign",
+            "serialize",
+            "total",
+            "db",
+            "cold_start",
+        ]
+        assert 'desc="statements=1 rows=1"' in cold["headers"]["Server-Timing"]
+        assert "cold_start" not in warm["headers"]["Server-Timing"]
+
+        records = [
+            json.loads(line)
+            for line in capsys.readouterr().out.splitlines()
+            if line.startswith('{"_aws"')
+        ]
+        assert [record["cold_start"] for record in records] == [1, 0]
+        assert records[0]["request_id"] == "test-request-id"
+        assert records[0]["db_statements"] == 1
+        assert records[0]["db_rows"] == 1
+
+    def test_query_budget(self, sqlite_database, lambda_context):
+        """Test that a login fetching more rows than budgeted fails the test run."""
+        from src.infrastructure.database.query_stats import QueryBudgetExceeded
+
+        event = {"rawPath": "/auth", "body": json.dumps({"cpf": "111.444.777-35"})}
+
+        with patch.dict("os.environ", {"QUERY_BUDGET_MAX_ROWS": "0"}):
+            with pytest.raises(QueryBudgetExceeded, match="/auth: 1 rows > 0"):
+                lambda_handler(event, lambda_context)
+
+    def test_database_outage_is_not_cached_as_miss(
+        self, sqlite_database, lambda_context, tmp_path
+    ):
+        """Test that an outage answers 503, not 401, and is not cached."""
+        database = sqlite_database.removeprefix("sqlite:///")
+        event = {"rawPath": "/auth", "body": json.dumps({"cpf": "111.444.777-35"})}
+
+        os.replace(database, tmp_path / "offline.db")
+        try:
+            during = lambda_handler(event, lambda_context)
+        finally:
+            os.replace(tmp_path / "offline.db", database)
+        after = lambda_handler(event, lambda_context)
+
+        assert during["statusCode"] == 503
+        assert "indisponível" in json.loads(during["body"])["error"]
+        assert after["statusCode"] == 200
@@ -0,0 +1,213 @@
+"""Unit tests for the cpf_numero migration and customer generator in migrate.py."""
+
+from datetime import datetime
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    select,
+    text,
+)
+
+import migrate
+from migrate import (
+    MAX_SYNTHETIC_CUSTOMERS,
+    add_cpf_numero_column,
+    backfill_cpf_numero,
+    create_sample_data,
+    generate_customers,
+    synthetic_cpf,
+    synthetic_customers,
+)
+from src.domain.value_objects import CPF
+from src.infrastructure.database.models import Base, CustomerModel
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    """SQLite database with the clientes table as it was before cpf_numero."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    metadata = MetaData()
+    clientes = Table(
+        "clientes",
+        metadata,
+        Column("id", String(36), primary_key=True),
+        Column("cpf", String(14), unique=True),
+        Column("nome", String(100), nullable=False),
+        Column("telefone", String(20)),
+        Column("email", String(100)),
+        Column("criado_em", DateTime, nullable=False),
+        Column("atualizado_em", DateTime, nullable=False),
+    )
+    metadata.create_all(engine)
+
+    now = datetime(2024, 1, 1)
+    rows = [
+        ("a", "111.444.777-35"),
+        ("b", "52998224725"),
+        ("c", "123"),
+        ("d", None),
+        ("e", "11144477735"),
+    ] + [(f"f{i:03d}", f"{i:011d}") for i in range(1, 8)]
+    with engine.begin() as connection:
+        connection.execute(
+            clientes.insert(),
+            [
+                {"id": i, "cpf": cpf, "nome": i, "criado_em": now, "atualizado_em": now}
+                for i, cpf in rows
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Empty SQLite database with the current clientes table."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'clientes.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def cpf_keys(engine):
+    table = CustomerModel.__table__
+    with engine.connect() as connection:
+        return dict(connection.execute(select(table.c.id, table.c.cpf_numero)).all())
+
+
+class TestCpfNumeroMigration:
+    """Test suite for adding and backfilling clientes.cpf_numero."""
+
+    def test_backfill_in_chunks(self, legacy_engine):
+        """Test chunked backfill, skipping malformed and colliding rows."""
+        add_cpf_numero_column(legacy_engine)
+
+        updated, skipped = backfill_cpf_numero(legacy_engine, chunk_size=3)
+
+        keys = cpf_keys(legacy_engine)
+        assert keys["a"] == 11144477735
+        assert keys["b"] == 52998224725
+        assert keys["f001"] == 1
+        assert keys["c"] is None
+        assert keys["d"] is None
+        assert keys["e"] is None  # same CPF as "a", stored bare
+        assert (updated, skipped) == (9, 2)
+
+    def test_is_idempotent(self, legacy_engine):
+        """Test that re-running the migration only touches unfilled rows."""
+        add_cpf_numero_column(legacy_engine)
+        backfill_cpf_numero(legacy_engine, chunk_size=100)
+
+        add_cpf_numero_column(legacy_engine)
+        updated, _ = backfill_cpf_numero(legacy_engine, chunk_size=100)
+
+        assert updated == 0
+
+
+class TestSampleData:
+    """Test suite for --with-sample-data."""
+
+    def use_engine(self, monkeypatch, engine):
+        settings = Mock(database_url=str(engine.url))
+        monkeypatch.setattr(migrate, "get_settings", lambda: settings)
+
+    def test_legacy_table_without_cpf_numero(self, legacy_engine, monkeypatch):
+        """Test that sample data is inserted into tables not yet migrated."""
+        self.use_engine(monkeypatch, legacy_engine)
+        with legacy_engine.begin() as connection:
+            connection.execute(text("DELETE FROM clientes"))
+
+        create_sample_data()
+
+        with legacy_engine.connect() as connection:
+            cpfs = connection.execute(text("SELECT cpf FROM clientes")).scalars()
+            assert sorted(cpfs) == [
+                "111.444.777-35",
+                "390.533.447-05",
+                "529.982.247-25",
+            ]
+
+    def test_fills_cpf_numero(self, engine, monkeypatch):
+        """Test that current tables get the integer CPF key."""
+        self.use_engine(monkeypatch, engine)
+
+        create_sample_data()
+
+        assert sorted(cpf_keys(engine).values()) == [
+            11144477735,
+            39053344705,
+            52998224725,
+        ]
+
+
+class TestSyntheticCustomers:
+    """Test suite for the synthetic customer generator."""
+
+    def test_cpfs_valid_and_unique(self):
+        """Test CPFs, including indexes that would hit repeated-digit bodies."""
+        # Indexes whose permuted body is 000000000 and 111111111
+        indexes = list(range(2000)) + [447041821, 834466220]
+
+        keys = [synthetic_cpf(index) for index in indexes]
+
+        assert len(set(keys)) == len(keys)
+        for key in keys:
+            assert CPF.from_int(key).to_int() == key
+
+    def test_formatting_mix(self):
+        """Test that formatted_ratio picks the stored CPF formatting."""
+        rows = synthetic_customers(0, 1000, formatted_ratio=0.3)
+
+        formatted = [row for row in rows if "." in row["cpf"]]
+        assert 250 < len(formatted) < 350
+        for row in rows:
+            assert CPF(row["cpf"]).to_int() == row["cpf_numero"]
+        assert all("." not in row["cpf"] for row in synthetic_customers(0, 50, 0))
+        assert all("." in row["cpf"] for row in synthetic_customers(0, 50, 1))
+
+    def test_generate_in_batches(self, engine, capsys):
+        """Test batched inserts with cpf_numero filled and progress output."""
+        inserted, skipped = generate_customers(engine, 25, batch_size=10)
+
+        keys = cpf_keys(engine)
+        assert (inserted, skipped) == (25, 0)
+        assert sorted(keys.values()) == sorted(synthetic_cpf(i) for i in range(25))
+        assert "25/25 customers" in capsys.readouterr().out
+
+    def test_resumes_after_last_batch(self, engine):
+        """Test that a re-run continues after the rows already inserted."""
+        generate_customers(engine, 12, batch_size=5)
+
+        assert generate_customers(engine, 30, batch_size=5) == (18, 0)
+        assert generate_customers(engine, 30, batch_size=5) == (0, 0)
+        assert len(cpf_keys(engine)) == 30
+
+    def test_existing_cpf_skipped(self, engine):
+        """Test that a CPF already owned by another row is skipped."""
+        taken = synthetic_customers(3, 4)[0]
+        with engine.begin() as connection:
+            connection.execute(
+                CustomerModel.__table__.insert(), {**taken, "id": "existing"}
+            )
+
+        inserted, skipped = generate_customers(engine, 10, batch_size=10)
+
+        assert (inserted, skipped) == (9, 1)
+        assert len(cpf_keys(engine)) == 10
+
+    @pytest.mark.parametrize(
+        "count, formatted_ratio",
+        [(-1, 0.5), (MAX_SYNTHETIC_CUSTOMERS + 1, 0.5), (10, 1.5)],
+    )
+    def test_invalid_arguments(self, engine, count, formatted_ratio):
+        """Test that out-of-range counts and ratios are rejected."""
+        with pytest.raises(ValueError):
+            generate_customers(engine, count, formatted_ratio=formatted_ratio)
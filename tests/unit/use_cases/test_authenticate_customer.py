@@ -1,12 +1,28 @@
 """Unit tests for AuthenticateCustomerUseCase."""
 
+import asyncio
+import time
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from src.application.use_cases.authenticate_customer import (
+    AsyncAuthenticateCustomerUseCase,
     AuthenticateCustomerUseCase,
     AuthenticationRequest,
     AuthenticationResponse,
+    BatchAuthenticationRequest,
+    CUSTOMER_NOT_FOUND,
+    INVALID_CPF,
+    INVALID_REFRESH_TOKEN,
+    RefreshRequest,
+)
+from src.application.use_cases.ports import (
+    CustomerLookupError,
+    IAsyncCustomerRepository,
+)
+from src.infrastructure.cache.refresh_token_registry import (
+    InMemoryRefreshTokenRegistry,
 )
 
 
@@ -92,6 +108,23 @@ class TestAuthenticateCustomerUseCase:
         mock_customer_repository.find_by_cpf.assert_called_once_with("52998224725")
         mock_token_generator.generate.assert_not_called()
 
+    def test_failed_lookup_is_not_reported_as_not_found(
+        self, mock_customer_repository, mock_token_generator
+    ):
+        """Test that repository errors propagate instead of reading as a miss."""
+        mock_customer_repository.find_by_cpf.side_effect = CustomerLookupError()
+        mock_customer_repository.find_many_by_cpf.side_effect = CustomerLookupError()
+        use_case = AuthenticateCustomerUseCase(
+            customer_repository=mock_customer_repository,
+            token_generator=mock_token_generator,
+        )
+
+        with pytest.raises(CustomerLookupError):
+            use_case.execute(AuthenticationRequest(cpf="52998224725"))
+        with pytest.raises(CustomerLookupError):
+            use_case.execute_batch(BatchAuthenticationRequest(cpfs=["52998224725"]))
+        mock_token_generator.generate.assert_not_called()
+
     def test_authentication_with_formatted_cpf(
         self, mock_customer_repository, mock_token_generator, sample_customer
     ):
@@ -145,3 +178,306 @@ class TestAuthenticateCustomerUseCase:
         assert response.message == "Error"
         assert response.customer_id is None
         assert response.customer_name is None
+
+
+class TestBatchAuthentication:
+    """Test suite for batch authentication."""
+
+    def test_batch_resolves_all_cpfs_in_one_lookup(
+        self, mock_customer_repository, mock_token_generator, sample_customer
+    ):
+        """Test that valid CPFs are resolved with a single repository call."""
+        # Arrange
+        mock_customer_repository.find_many_by_cpf.return_value = {
+            "11144477735": sample_customer
+        }
+        mock_token_generator.generate.return_value = "fake-jwt-token"
+
+        use_case = AuthenticateCustomerUseCase(
+            customer_repository=mock_customer_repository,
+            token_generator=mock_token_generator,
+        )
+
+        request = BatchAuthenticationRequest(
+            cpfs=["111.444.777-35", "00000000000", "52998224725", "11144477735"]
+        )
+
+        # Act
+        response = use_case.execute_batch(request)
+
+        # Assert
+        assert response.success is True
+        assert [r.success for r in response.results] == [True, False, False, True]
+        assert response.results[0].token == "fake-jwt-token"
+        assert response.results[1].error_code == INVALID_CPF
+        assert response.results[2].error_code == CUSTOMER_NOT_FOUND
+
+        mock_customer_repository.find_many_by_cpf.assert_called_once_with(
+            ["11144477735", "52998224725"]
+        )
+        mock_customer_repository.find_by_cpf.assert_not_called()
+        # Duplicate CPFs share a single signed token
+        mock_token_generator.generate.assert_called_once()
+
+    def test_batch_with_only_invalid_cpfs_skips_repository(
+        self, mock_customer_repository, mock_token_generator
+    ):
+        """Test that a batch without valid CPFs never reaches the repository."""
+        use_case = AuthenticateCustomerUseCase(
+            customer_repository=mock_customer_repository,
+            token_generator=mock_token_generator,
+        )
+
+        response = use_case.execute_batch(
+            BatchAuthenticationRequest(cpfs=["00000000000", 12345])
+        )
+
+        assert response.success is True
+        assert all(r.error_code == INVALID_CPF for r in response.results)
+        mock_customer_repository.find_many_by_cpf.assert_not_called()
+
+    def test_batch_size_limit(self, mock_customer_repository, mock_token_generator):
+        """Test that batches above the configured limit are rejected."""
+        use_case = AuthenticateCustomerUseCase(
+            customer_repository=mock_customer_repository,
+            token_generator=mock_token_generator,
+            max_batch_size=2,
+        )
+
+        response = use_case.execute_batch(
+            BatchAuthenticationRequest(cpfs=["11144477735"] * 3)
+        )
+
+        assert response.success is False
+        assert "2" in response.message
+        mock_customer_repository.find_many_by_cpf.assert_not_called()
+
+    def test_empty_batch_is_rejected(
+        self, mock_customer_repository, mock_token_generator
+    ):
+        """Test that an empty CPF list is rejected."""
+        use_case = AuthenticateCustomerUseCase(
+            customer_repository=mock_customer_repository,
+            token_generator=mock_token_generator,
+        )
+
+        response = use_case.execute_batch(BatchAuthenticationRequest(cpfs=[]))
+
+        assert response.success is False
+
+
+class TestRefreshTokens:
+    """Test suite for refresh token issuance and exchange."""
+
+    CLAIMS = {
+        "sub": "550e8400-e29b-41d4-a716-446655440000",
+        "cpf": "11144477735",
+        "name": "João da Silva",
+        "jti": "jti-1",
+    }
+
+    @pytest.fixture
+    def registry(self):
+        return InMemoryRefreshTokenRegistry(max_size=10)
+
+    @pytest.fixture
+    def use_case(self, mock_customer_repository, mock_token_generator, registry):
+        mock_token_generator.generate.return_value = "access-token"
+        mock_token_generator.generate_refresh.return_value = "refresh-token"
+        return AuthenticateCustomerUseCase(
+            customer_repository=mock_customer_repository,
+            token_generator=mock_token_generator,
+            refresh_expiration_minutes=60,
+            refresh_max_lifetime_minutes=120,
+            refresh_token_registry=registry,
+        )
+
+    def claims(self, auth_time_offset=0):
+        now = int(time.time())
+        return {
+            **self.CLAIMS,
+            "auth_time": now + auth_time_offset,
+            "exp": now + 3600,
+        }
+
+    def test_login_returns_refresh_token(
+        self, use_case, mock_customer_repository, mock_token_generator, sample_customer
+    ):
+        """Test that login issues a refresh token capped by max lifetime."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+
+        response = use_case.execute(AuthenticationRequest(cpf="11144477735"))
+
+        assert response.refresh_token == "refresh-token"
+        kwargs = mock_token_generator.generate_refresh.call_args.kwargs
+        assert kwargs["customer_name"] == "João da Silva"
+        assert kwargs["expires_at"] - kwargs["auth_time"] == 3600
+
+    def test_refresh_token_disabled_by_default(
+        self, mock_customer_repository, mock_token_generator, sample_customer
+    ):
+        """Test that no refresh token is issued without a refresh lifetime."""
+        mock_customer_repository.find_by_cpf.return_value = sample_customer
+        use_case = AuthenticateCustomerUseCase(
+            mock_customer_repository, mock_token_generator
+        )
+
+        response = use_case.execute(AuthenticationRequest(cpf="11144477735"))
+
+        assert response.refresh_token is None
+        assert use_case.execute_refresh(RefreshRequest("token")).success is False
+
+    def test_refresh_uses_claims_only(
+        self, use_case, mock_customer_repository, mock_token_generator
+    ):
+        """Test that refreshing never queries the repository."""
+        claims = self.claims(auth_time_offset=-5400)
+        mock_token_generator.validate_refresh.return_value = claims
+
+        response = use_case.execute_refresh(RefreshRequest("refresh-token"))
+
+        assert response.success is True
+        assert response.token == "access-token"
+        assert response.refresh_token == "refresh-token"
+        assert response.customer_name == "João da Silva"
+        mock_customer_repository.find_by_cpf.assert_not_called()
+        mock_token_generator.generate.assert_called_once_with(
+            customer_id=claims["sub"], cpf="11144477735"
+        )
+        kwargs = mock_token_generator.generate_refresh.call_args.kwargs
+        assert kwargs["auth_time"] == claims["auth_time"]
+        assert kwargs["expires_at"] == claims["auth_time"] + 7200
+
+    def test_rotated_token_cannot_be_replayed(self, use_case, mock_token_generator):
+        """Test that a consumed refresh token is rejected."""
+        mock_token_generator.validate_refresh.return_value = self.claims()
+
+        first = use_case.execute_refresh(RefreshRequest("refresh-token"))
+        second = use_case.execute_refresh(RefreshRequest("refresh-token"))
+
+        assert first.success is True
+        assert second.success is False
+        assert second.error_code == INVALID_REFRESH_TOKEN
+
+    def test_without_rotation_token_is_reusable(
+        self, mock_customer_repository, mock_token_generator
+    ):
+        """Test that disabling rotation keeps the presented refresh token."""
+        mock_token_generator.validate_refresh.return_value = self.claims()
+        use_case = AuthenticateCustomerUseCase(
+            mock_customer_repository,
+            mock_token_generator,
+            refresh_expiration_minutes=60,
+            rotate_refresh_tokens=False,
+        )
+
+        for _ in range(2):
+            response = use_case.execute_refresh(RefreshRequest("refresh-token"))
+            assert response.success is True
+            assert response.refresh_token is None
+        mock_token_generator.generate_refresh.assert_not_called()
+
+    def test_max_lifetime_forces_login(self, use_case, mock_token_generator):
+        """Test that sessions older than the max lifetime are rejected."""
+        mock_token_generator.validate_refresh.return_value = self.claims(
+            auth_time_offset=-7200
+        )
+
+        response = use_case.execute_refresh(RefreshRequest("refresh-token"))
+
+        assert response.success is False
+        assert response.error_code == INVALID_REFRESH_TOKEN
+
+    def test_invalid_refresh_token(self, use_case, mock_token_generator):
+        """Test that validation errors are reported as invalid token."""
+        mock_token_generator.validate_refresh.side_effect = ValueError("Token expirado")
+
+        response = use_case.execute_refresh(RefreshRequest("refresh-token"))
+
+        assert response.success is False
+        assert response.error_code == INVALID_REFRESH_TOKEN
+
+
+class TestAsyncAuthenticateCustomerUseCase:
+    """Test suite for the asyncio variant of the use case."""
+
+    @pytest.fixture
+    def repository(self):
+        return AsyncMock(spec=IAsyncCustomerRepository)
+
+    @pytest.fixture
+    def use_case(self, repository, mock_token_generator):
+        mock_token_generator.generate.return_value = "fake-jwt-token"
+        return AsyncAuthenticateCustomerUseCase(repository, mock_token_generator)
+
+    def test_successful_authentication(self, use_case, repository, sample_customer):
+        """Test that the lookup is awaited and a token is issued."""
+        repository.find_by_cpf.return_value = sample_customer
+
+        request = AuthenticationRequest("111.444.777-35")
+
+        response = asyncio.run(use_case.execute(request))
+
+        assert response.success is True
+        assert response.token == "fake-jwt-token"
+        repository.find_by_cpf.assert_awaited_once_with("11144477735")
+
+    def test_invalid_cpf_skips_lookup(self, use_case, repository):
+        """Test that invalid CPFs are rejected before any lookup."""
+        response = asyncio.run(use_case.execute(AuthenticationRequest("123")))
+
+        assert response.error_code == INVALID_CPF
+        repository.find_by_cpf.assert_not_awaited()
+
+    def test_customer_not_found(self, use_case, repository):
+        """Test a valid but unregistered CPF."""
+        repository.find_by_cpf.return_value = None
+
+        response = asyncio.run(use_case.execute(AuthenticationRequest("11144477735")))
+
+        assert response.error_code == CUSTOMER_NOT_FOUND
+
+    def test_failed_lookup_is_not_reported_as_not_found(self, use_case, repository):
+        """Test that repository errors propagate instead of reading as a miss."""
+        repository.find_by_cpf.side_effect = CustomerLookupError()
+        repository.find_many_by_cpf.side_effect = CustomerLookupError()
+
+        with pytest.raises(CustomerLookupError):
+            asyncio.run(use_case.execute(AuthenticationRequest("11144477735")))
+        with pytest.raises(CustomerLookupError):
+            asyncio.run(
+                use_case.execute_batch(BatchAuthenticationRequest(cpfs=["11144477735"]))
+            )
+
+    def test_batch_uses_one_lookup(self, use_case, repository, sample_customer):
+        """Test that batch results match the sync use case."""
+        repository.find_many_by_cpf.return_value = {"11144477735": sample_customer}
+
+        response = asyncio.run(
+            use_case.execute_batch(
+                BatchAuthenticationRequest(cpfs=["11144477735", "39053344705", "1"])
+            )
+        )
+
+        assert [r.error_code for r in response.results] == [
+            None,
+            CUSTOMER_NOT_FOUND,
+            INVALID_CPF,
+        ]
+        repository.find_many_by_cpf.assert_awaited_once_with(
+            ["11144477735", "39053344705"]
+        )
+
+    def test_batch_rejected_when_empty(self, use_case, repository):
+        """Test that an empty batch is rejected without a lookup."""
+        response = asyncio.run(use_case.execute_batch(BatchAuthenticationRequest([])))
+
+        assert response.success is False
+        repository.find_many_by_cpf.assert_not_awaited()
+
+    def test_refresh_is_awaitable(self, use_case, mock_token_generator):
+        """Test that execute_refresh follows the sync rules (disabled here)."""
+        response = asyncio.run(use_case.execute_refresh(RefreshRequest("token")))
+
+        assert response.error_code == INVALID_REFRESH_TOKEN
+        mock_token_generator.validate_refresh.assert_not_called()
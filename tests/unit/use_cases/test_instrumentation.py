@@ -0,0 +1,76 @@
+"""Unit tests for per-stage request timing."""
+
+import asyncio
+
+import pytest
+
+from src.application.instrumentation import TOTAL, Timings, stage, timed
+
+
+class TestStageTiming:
+    """Test suite for stage and timed."""
+
+    def test_stage_is_noop_outside_timed(self):
+        """Test that stages outside a timed request share one no-op."""
+        first, second = stage("parse"), stage("sign")
+
+        assert first is second
+        with first:
+            pass
+
+    def test_records_stages_and_total(self):
+        """Test that stages accumulate and total covers the whole block."""
+        with timed(cold_start=True) as timings:
+            with stage("sign"):
+                pass
+            with stage("sign"):
+                pass
+            with stage("parse"):
+                pass
+
+        assert timings.cold_start is True
+        assert list(timings.stages) == ["sign", "parse", TOTAL]
+        assert timings.stages[TOTAL] >= timings.stages["sign"]
+
+    def test_stage_is_recorded_when_it_raises(self):
+        """Test that failing stages still count."""
+        with timed() as timings:
+            with pytest.raises(ValueError):
+                with stage("validate"):
+                    raise ValueError("bad cpf")
+
+        assert "validate" in timings.stages
+
+    def test_nothing_recorded_after_request(self):
+        """Test that the request's timings are detached when it ends."""
+        with timed() as timings:
+            pass
+
+        with stage("late"):
+            pass
+
+        assert "late" not in timings.stages
+
+    def test_concurrent_tasks_record_separately(self):
+        """Test that asyncio tasks each time their own request."""
+
+        async def request(name):
+            with timed() as timings:
+                with stage(name):
+                    await asyncio.sleep(0)
+            return timings
+
+        async def main():
+            return await asyncio.gather(request("a"), request("b"))
+
+        first, second = asyncio.run(main())
+
+        assert set(first.stages) == {"a", TOTAL}
+        assert set(second.stages) == {"b", TOTAL}
+
+    def test_milliseconds(self):
+        """Test millisecond conversion."""
+        timings = Timings()
+        timings.add("db_query", 0.0012345)
+
+        assert timings.milliseconds() == {"db_query": 1.234}